@@ -2,24 +2,59 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 from attr import dataclass
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_CONFIG_ENTRY_ID, CONF_NAME, Platform
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_STATE,
+    ATTR_TIME,
+    CONF_NAME,
+    CONF_PORT,
+    STATE_OFF,
+    STATE_ON,
+    Platform,
+)
 from homeassistant.core import ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers import selector
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.util import dt as dt_util
 
 from custom_components.pima_force.const import (
+    ATTR_END,
+    ATTR_ENTRIES,
+    ATTR_RECORDS,
+    ATTR_REPLAY,
+    ATTR_START,
+    ATTR_ZONE,
+    CONF_ACCOUNT,
+    CONF_COALESCE_WINDOW,
+    CONF_IO_THREAD,
+    CONF_MAX_CONNECTIONS,
+    CONF_OVERFLOW_POLICY,
+    CONF_PROTOCOL,
+    CONF_RATE_LIMIT,
     CONF_ZONES,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_RATE_LIMIT,
     DOMAIN,
+    EVENT_JOURNAL,
+    OVERFLOW_POLICY_KEEP_NEWEST,
+    PROTOCOL_TCP,
+    SERVICE_GET_ZONE_STATES,
     SERVICE_GET_ZONES,
+    SERVICE_QUERY_JOURNAL,
     SERVICE_SET_ZONES,
+    SIGNAL_ZONES_UPDATED,
 )
 
-from .coordinator import PimaForceDataUpdateCoordinator
+from . import websocket_api
+from .coordinator import PimaForceDataUpdateCoordinator, async_remove_store
+from .journal import remove_journal
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant, ServiceCall
@@ -27,7 +62,7 @@ if TYPE_CHECKING:
 
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
-PLATFORMS = (Platform.BINARY_SENSOR,)
+PLATFORMS = (Platform.BINARY_SENSOR, Platform.SENSOR)
 SERVICE_GET_ZONES_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_CONFIG_ENTRY_ID): selector.ConfigEntrySelector(
@@ -35,14 +70,42 @@ SERVICE_GET_ZONES_SCHEMA = vol.Schema(
         )
     }
 )
-SERVICE_SET_ZONES_SCHEMA = vol.Schema(
+SERVICE_GET_ZONE_STATES_SCHEMA = vol.Schema(
+    {vol.Required(ATTR_CONFIG_ENTRY_ID): vol.All(cv.ensure_list, [cv.string])}
+)
+SERVICE_QUERY_JOURNAL_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_CONFIG_ENTRY_ID): selector.ConfigEntrySelector(
             selector.ConfigEntrySelectorConfig(integration=DOMAIN)
         ),
-        vol.Required(CONF_ZONES): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(ATTR_START): cv.datetime,
+        vol.Optional(ATTR_END): cv.datetime,
+        vol.Optional(CONF_ZONES): vol.All(cv.ensure_list, [cv.positive_int]),
+        vol.Optional(ATTR_REPLAY, default=False): cv.boolean,
     }
 )
+ZONE_NAMES_SCHEMA = vol.All(cv.ensure_list, [cv.string])
+SERVICE_SET_ZONES_SCHEMA = vol.Schema(
+    vol.Any(
+        {
+            vol.Required(ATTR_CONFIG_ENTRY_ID): selector.ConfigEntrySelector(
+                selector.ConfigEntrySelectorConfig(integration=DOMAIN)
+            ),
+            vol.Required(CONF_ZONES): ZONE_NAMES_SCHEMA,
+        },
+        {
+            vol.Required(ATTR_ENTRIES): vol.All(
+                cv.ensure_list,
+                [
+                    {
+                        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+                        vol.Required(CONF_ZONES): ZONE_NAMES_SCHEMA,
+                    }
+                ],
+            )
+        },
+    )
+)
 
 
 @dataclass
@@ -72,17 +135,80 @@ async def async_setup(hass: HomeAssistant, _: ConfigType) -> bool:
             }
         return None
 
+    @callback
+    def async_get_coordinator(entry_id: str) -> PimaForceDataUpdateCoordinator:
+        """Return the coordinator of a loaded config entry."""
+        config_entry: PimaForceConfigEntry | None = hass.config_entries.async_get_entry(
+            entry_id
+        )
+        if config_entry is None or config_entry.state != ConfigEntryState.LOADED:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="entry_not_loaded",
+                translation_placeholders={"entry_id": entry_id},
+            )
+        return config_entry.runtime_data.coordinator
+
+    @callback
+    async def async_get_zone_states(call: ServiceCall) -> ServiceResponse:
+        """Return the zone states of config entries, keyed by config entry ID."""
+        response: dict[str, Any] = {
+            entry_id: async_get_coordinator(entry_id).async_get_zone_states()
+            for entry_id in call.data[ATTR_CONFIG_ENTRY_ID]
+        }
+        return response
+
+    @callback
+    async def async_query_journal(call: ServiceCall) -> ServiceResponse:
+        """Return and optionally replay the journal records of a time range."""
+        entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+        coordinator = async_get_coordinator(entry_id)
+        start, end = (
+            dt_util.as_utc(value).timestamp() if (value := call.data.get(key)) else None
+            for key in (ATTR_START, ATTR_END)
+        )
+        zones = set(call.data.get(CONF_ZONES, ()))
+        records: list[dict[str, Any]] = [
+            {
+                ATTR_TIME: dt_util.as_local(
+                    dt_util.utc_from_timestamp(time)
+                ).isoformat(),
+                ATTR_ZONE: zone,
+                ATTR_STATE: STATE_ON if is_open else STATE_OFF,
+            }
+            for time, zone, is_open in coordinator.journal.records(start, end)
+            if not zones or zone in zones
+        ]
+        if call.data[ATTR_REPLAY]:
+            for record in records:
+                hass.bus.async_fire(
+                    EVENT_JOURNAL, {ATTR_CONFIG_ENTRY_ID: entry_id, **record}
+                )
+        response: dict[str, Any] = {ATTR_RECORDS: records}
+        return response if call.return_response else None
+
     @callback
     async def async_set_zones(call: ServiceCall) -> None:
-        """Set zone list for a config entry."""
-        if config_entry := hass.config_entries.async_get_entry(
-            call.data[ATTR_CONFIG_ENTRY_ID]
-        ):
+        """Set the zone lists of config entries, all of them or none."""
+        updates: list[tuple[ConfigEntry, list[str]]] = []
+        for data in call.data.get(ATTR_ENTRIES, [call.data]):
+            entry_id = data[ATTR_CONFIG_ENTRY_ID]
+            config_entry = hass.config_entries.async_get_entry(entry_id)
+            if config_entry is None or config_entry.domain != DOMAIN:
+                raise ServiceValidationError(
+                    translation_domain=DOMAIN,
+                    translation_key="entry_not_found",
+                    translation_placeholders={"entry_id": entry_id},
+                )
+            updates.append((config_entry, data[CONF_ZONES]))
+        # Loaded entries apply only the difference to their zone entities
+        # (see config_entry_update_listener), unchanged lists are skipped.
+        for config_entry, zones in updates:
             hass.config_entries.async_update_entry(
                 config_entry,
                 options={
                     **config_entry.options,
-                    CONF_ZONES: [{CONF_NAME: zone} for zone in call.data[CONF_ZONES]],
+                    CONF_ZONES: [{CONF_NAME: zone} for zone in zones],
                 },
             )
 
@@ -93,12 +219,27 @@ async def async_setup(hass: HomeAssistant, _: ConfigType) -> bool:
         schema=SERVICE_GET_ZONES_SCHEMA,
         supports_response=SupportsResponse.ONLY,
     )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_ZONE_STATES,
+        async_get_zone_states,
+        schema=SERVICE_GET_ZONE_STATES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_QUERY_JOURNAL,
+        async_query_journal,
+        schema=SERVICE_QUERY_JOURNAL_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_ZONES,
         async_set_zones,
         schema=SERVICE_SET_ZONES_SCHEMA,
     )
+    websocket_api.async_setup(hass)
 
     return True
 
@@ -118,7 +259,36 @@ async def config_entry_update_listener(
     hass: HomeAssistant, entry: PimaForceConfigEntry
 ) -> None:
     """Update listener, called when the config entry options are changed."""
-    hass.config_entries.async_schedule_reload(entry.entry_id)
+    coordinator = entry.runtime_data.coordinator
+    if (
+        entry.options[CONF_PORT],
+        entry.options.get(CONF_ACCOUNT, ""),
+        entry.options.get(CONF_PROTOCOL, PROTOCOL_TCP),
+        entry.options.get(CONF_IO_THREAD, False),
+        entry.options.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT),
+        entry.options.get(CONF_MAX_CONNECTIONS, DEFAULT_MAX_CONNECTIONS),
+    ) != (
+        coordinator.port,
+        coordinator.account,
+        coordinator.protocol,
+        coordinator.io_thread,
+        coordinator.rate_limit,
+        coordinator.max_connections,
+    ):
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+        return
+    # The listener keeps running, only the zone entities are reconciled.
+    coordinator.coalesce_window = entry.options.get(CONF_COALESCE_WINDOW, 0)
+    coordinator.overflow_policy = entry.options.get(
+        CONF_OVERFLOW_POLICY, OVERFLOW_POLICY_KEEP_NEWEST
+    )
+    async_dispatcher_send(hass, SIGNAL_ZONES_UPDATED.format(entry.entry_id))
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: PimaForceConfigEntry) -> None:
+    """Remove the files of a config entry."""
+    await hass.async_add_executor_job(remove_journal, hass, entry.entry_id)
+    await async_remove_store(hass, entry.entry_id)
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: PimaForceConfigEntry) -> bool:
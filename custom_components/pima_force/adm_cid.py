@@ -0,0 +1,105 @@
+"""Fast-path decoder for the SIA frames sent by Pima Force alarms."""
+
+from __future__ import annotations
+
+import re
+from typing import NamedTuple
+
+from .const import ADM_CID_PIMA_ZONE_STATUS_CODE, SIA_PIMA_KEEP_CONNECTED_QUALIFIER
+
+# Unencrypted zone status (760) ADM-CID frames and NULL (keep-alive) frames.
+# Anything else is left to pysiaalarm's general-purpose parser.
+_FRAME_MATCHER = re.compile(
+    rb"""
+    \s*
+    (?P<crc>[0-9A-F]{4})
+    [0-9A-F]{4}
+    (?P<message>
+        "(?:ADM-CID|(?P<null>NULL))"
+        (?P<sequence>\d{4})
+        (?P<receiver>R[0-9A-F]{1,6})?
+        (?P<line>L[0-9A-F]{1,6})
+        \#(?P<account>[0-9A-F]{3,16})
+        \[
+        (?(null)|
+            \#[0-9A-F]{3,16}\|
+            (?P<event_qualifier>[13])
+            (?P<event_type>"""
+    + ADM_CID_PIMA_ZONE_STATUS_CODE.encode()
+    + rb""")
+            \x20(?P<partition>\d{2})
+            \x20(?P<ri>\d{3})
+        )
+        \]
+        (?:_[0-9:,-]*)?
+    )
+    \s*
+    """,
+    re.VERBOSE,
+)
+
+
+def _crc_table() -> tuple[int, ...]:
+    """Return the lookup table of CRC-16/ARC (the SIA DC-09 CRC)."""
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC_TABLE = _crc_table()
+
+
+def crc(data: bytes) -> int:
+    """Calculate the CRC of a SIA message."""
+    value = 0
+    for byte in data:
+        value = (value >> 8) ^ _CRC_TABLE[(value ^ byte) & 0xFF]
+    return value
+
+
+class AdmCidEvent(NamedTuple):
+    """Zone status or keep-alive frame decoded by the fast path."""
+
+    account: str
+    sequence: str
+    receiver: str
+    line: str
+    event_qualifier: str | None  # None for keep-alive frames
+    event_type: str | None
+    partition: str | None
+    ri: str | None
+
+
+def parse_frame(data: bytes) -> AdmCidEvent | None:
+    """Decode a raw frame, return None if it's not handled by the fast path."""
+    if (match := _FRAME_MATCHER.fullmatch(data)) is None or crc(
+        match["message"]
+    ) != int(match["crc"], 16):
+        return None
+    qualifier, event_type, partition, ri = (
+        None if value is None else value.decode()
+        for value in match.group("event_qualifier", "event_type", "partition", "ri")
+    )
+    return AdmCidEvent(
+        match["account"].decode(),
+        match["sequence"].decode(),
+        (match["receiver"] or b"").decode(),
+        match["line"].decode(),
+        qualifier,
+        event_type,
+        partition,
+        ri,
+    )
+
+
+def create_ack(event: AdmCidEvent) -> bytes:
+    """Create the ACK response of a frame decoded by the fast path."""
+    message = (
+        f'"ACK"{event.sequence}{event.receiver}{event.line}'
+        f"#{event.account}[{SIA_PIMA_KEEP_CONNECTED_QUALIFIER}]"
+    ).encode()
+    return b"\n%04X%04X%s\r" % (crc(message), len(message), message)
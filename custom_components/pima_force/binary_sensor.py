@@ -2,27 +2,41 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 from homeassistant.components import binary_sensor
-from homeassistant.const import CONF_NAME, CONF_PORT, STATE_ON
+from homeassistant.const import ATTR_STATE, CONF_NAME, STATE_OFF, STATE_ON
+from homeassistant.core import callback
 from homeassistant.helpers import entity_platform
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.util import dt as dt_util
 
 from .const import (
+    ATTR_CODE,
+    ATTR_EVENTS,
     ATTR_LAST_CLOSE,
     ATTR_LAST_OPEN,
     ATTR_LAST_SET,
+    ATTR_SUPPRESSED_TRANSITIONS,
     ATTR_ZONE,
-    CONF_ZONES,
     DOMAIN,
     SERVICE_SET_CLOSED,
     SERVICE_SET_OPEN,
+    SIGNAL_ZONES_UPDATED,
 )
-from .entity import PimaForceEntity
+from .entity import (
+    PimaForceAggregateEntity,
+    PimaForceEntity,
+    PimaForceEntryEntity,
+    PimaForceHealthEntity,
+    object_id,
+    zone_names,
+)
+from .zone_store import TIMESTAMPS
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -35,22 +49,70 @@ PARALLEL_UPDATES = 0
 SERVICE_SCHEMA = cv.make_entity_service_schema(None, extra=vol.ALLOW_EXTRA)
 
 
+def _unique_id(config_entry: PimaForceConfigEntry, zone: int) -> str:
+    """Return the unique ID of a zone entity."""
+    return f"{config_entry.entry_id}_{zone}"
+
+
 async def async_setup_entry(
-    _: HomeAssistant,
+    hass: HomeAssistant,
     config_entry: PimaForceConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Initialize config entry."""
-    now = dt_util.now().isoformat()
+    entities: dict[int, PimaForceZoneBinarySensor] = {}
+
+    @callback
+    def async_update_zones() -> None:
+        """Add, remove and rename zone entities to match the configured zones."""
+        names = zone_names(config_entry)
+        registry = er.async_get(hass)
+        for zone in entities.keys() - names.keys():
+            del entities[zone]
+            # The entity ID is looked up since it can be changed by the user.
+            if entity_id := registry.async_get_entity_id(
+                binary_sensor.DOMAIN, DOMAIN, _unique_id(config_entry, zone)
+            ):
+                registry.async_remove(entity_id)
+        for zone, entity in entities.items():
+            if entity.name != names[zone]:
+                entity.async_set_zone_name(names[zone])
+                if entity_id := registry.async_get_entity_id(
+                    binary_sensor.DOMAIN, DOMAIN, _unique_id(config_entry, zone)
+                ):
+                    registry.async_update_entity(entity_id, original_name=names[zone])
+        now = dt_util.utcnow().timestamp()
+        added = [
+            PimaForceZoneBinarySensor(config_entry, zone, name, now)
+            for zone, name in names.items()
+            if zone not in entities
+        ]
+        entities.update((entity.zone, entity) for entity in added)
+        async_add_entities(added)
+
+    async_update_zones()
     async_add_entities(
-        PimaForceZoneBinarySensor(
-            config_entry,
-            index + 1,
-            zone[CONF_NAME],
-            now,
+        [
+            PimaForceAnyZoneOpenBinarySensor(config_entry),
+            PimaForceConditionBinarySensor(
+                config_entry,
+                "alarm",
+                binary_sensor.BinarySensorDeviceClass.SAFETY,
+                config_entry.runtime_data.coordinator.alarms,
+            ),
+            PimaForceConditionBinarySensor(
+                config_entry,
+                "trouble",
+                binary_sensor.BinarySensorDeviceClass.PROBLEM,
+                config_entry.runtime_data.coordinator.troubles,
+            ),
+            PimaForceConnectedBinarySensor(config_entry),
+        ]
+    )
+    config_entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_ZONES_UPDATED.format(config_entry.entry_id), async_update_zones
         )
-        for index, zone in enumerate(config_entry.options.get(CONF_ZONES, []))
-        if zone.get(CONF_NAME)
     )
     platform = entity_platform.async_get_current_platform()
     platform.async_register_entity_service(
@@ -68,57 +130,202 @@ class PimaForceZoneBinarySensor(
 
     _attr_device_class = binary_sensor.BinarySensorDeviceClass.DOOR
     _unrecorded_attributes = frozenset(
-        {ATTR_ZONE, ATTR_LAST_SET, ATTR_LAST_OPEN, ATTR_LAST_CLOSE}
+        {
+            ATTR_ZONE,
+            ATTR_LAST_SET,
+            ATTR_LAST_OPEN,
+            ATTR_LAST_CLOSE,
+            ATTR_SUPPRESSED_TRANSITIONS,
+        }
     )
 
     def __init__(
-        self, config_entry: PimaForceConfigEntry, zone: int, name: str, now: str
+        self, config_entry: PimaForceConfigEntry, zone: int, name: str, now: float
     ) -> None:
         """Initialize object with defaults."""
-        super().__init__(config_entry)
-        self._attr_unique_id = f"{config_entry.entry_id}_{zone}"
-        self.entity_id = (
-            f"binary_sensor.{DOMAIN}_{config_entry.options[CONF_PORT]}_zone{zone}"
-        )
+        super().__init__(config_entry, zone)
+        self._attr_unique_id = _unique_id(config_entry, zone)
+        self.entity_id = f"binary_sensor.{object_id(config_entry)}_zone{zone}"
         self._attr_name = name
-        self._attr_is_on = False
-        self._attr_extra_state_attributes = {
-            ATTR_ZONE: zone,
-            ATTR_LAST_SET: now,
-            ATTR_LAST_OPEN: None,
-            ATTR_LAST_CLOSE: now,
-        }
         self._zone = zone
+        self._suppressed = 0  # suppressed transitions count of the last write
+        # The state and timestamps are kept (and saved) by the coordinator's
+        # zone store.
+        zones = self.coordinator.zones
+        self._attr_is_on = zones.get(zone, False)
+        if zones.timestamp(ATTR_LAST_SET, zone) is None:
+            zones.set_timestamp(ATTR_LAST_SET, zone, now)
+            zones.set_timestamp(ATTR_LAST_OPEN, zone, None)
+            zones.set_timestamp(ATTR_LAST_CLOSE, zone, now)
+
+    @property
+    def zone(self) -> int:
+        """Return the zone number."""
+        return self._zone
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the state attributes (rendered when read)."""
+        zones = self.coordinator.zones
+        attributes: dict[str, Any] = {ATTR_ZONE: self._zone}
+        for key in TIMESTAMPS:
+            attributes[key] = zones.isoformat(key, self._zone)
+        # Only exposed once the coalescing window suppressed a transition.
+        if self._suppressed:
+            attributes[ATTR_SUPPRESSED_TRANSITIONS] = self._suppressed
+        return attributes
+
+    @callback
+    def async_set_zone_name(self, name: str) -> None:
+        """Rename the zone without re-creating the entity."""
+        self._attr_name = name
+        if self.hass:
+            self._async_publish_state()
+            self.async_write_ha_state()
+
+    @callback
+    def _async_publish_state(self) -> None:
+        """Update the zone's entry in the coordinator's snapshot."""
+        self.coordinator.async_set_zone_state(
+            self._zone,
+            {
+                ATTR_ZONE: self._zone,
+                CONF_NAME: self._attr_name,
+                ATTR_STATE: STATE_ON if self._attr_is_on else STATE_OFF,
+            },
+        )
 
     async def async_added_to_hass(self) -> None:
         """Handle entity which will be added."""
         await super().async_added_to_hass()
-        if last_state := await self.async_get_last_state():
+        # The restore state is used only until the zone store is first saved.
+        if not self.coordinator.zones_restored and (
+            last_state := await self.async_get_last_state()
+        ):
             self._attr_is_on = last_state.state == STATE_ON
-            for key in self._attr_extra_state_attributes:
+            zones = self.coordinator.zones
+            if self._zone not in zones:  # counted by the aggregates until reported
+                zones[self._zone] = self._attr_is_on
+                self.coordinator.async_update_zone_listeners()
+            for key in TIMESTAMPS:
                 if key in last_state.attributes:
-                    self._attr_extra_state_attributes[key] = last_state.attributes[key]
+                    value = last_state.attributes[key]
+                    restored = dt_util.parse_datetime(value) if value else None
+                    self.coordinator.zones.set_timestamp(
+                        key, self._zone, restored.timestamp() if restored else None
+                    )
+        self._async_publish_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Handle entity which will be removed."""
+        await super().async_will_remove_from_hass()
+        self.coordinator.async_set_zone_state(self._zone, None)
 
     def _handle_coordinator_update(self) -> None:
         """Handle updated data from the coordinator."""
+        changed = False
+        zones = self.coordinator.zones
+        if (
+            suppressed := self.coordinator.suppressed_transitions.get(self._zone, 0)
+        ) != self._suppressed:
+            self._suppressed = suppressed
+            changed = True
         if (
-            new_state := self.coordinator.zones.get(self._zone)
+            new_state := zones.get(self._zone)
         ) is not None and new_state != self._attr_is_on:
-            now = dt_util.now().isoformat()
-            self._attr_extra_state_attributes[ATTR_LAST_SET] = now
-            if new_state:
-                self._attr_extra_state_attributes[ATTR_LAST_OPEN] = now
-            else:
-                self._attr_extra_state_attributes[ATTR_LAST_CLOSE] = now
+            now = self.coordinator.batch_time or dt_util.utcnow().timestamp()
+            zones.set_timestamp(ATTR_LAST_SET, self._zone, now)
+            zones.set_timestamp(
+                ATTR_LAST_OPEN if new_state else ATTR_LAST_CLOSE, self._zone, now
+            )
             self._attr_is_on = new_state
+            changed = True
+        if changed:
+            self._async_publish_state()
             super()._handle_coordinator_update()
 
     async def async_set_open(self) -> None:
         """Set the zone state to open."""
         self.coordinator.zones[self._zone] = True
-        self._handle_coordinator_update()
+        self.coordinator.async_update_zone_listeners(self._zone)
 
     async def async_set_closed(self) -> None:
         """Set the zone state to closed."""
         self.coordinator.zones[self._zone] = False
-        self._handle_coordinator_update()
+        self.coordinator.async_update_zone_listeners(self._zone)
+
+
+class PimaForceAnyZoneOpenBinarySensor(
+    PimaForceAggregateEntity, binary_sensor.BinarySensorEntity
+):
+    """Whether any of the used zones is open."""
+
+    _attr_device_class = binary_sensor.BinarySensorDeviceClass.OPENING
+
+    def __init__(self, config_entry: PimaForceConfigEntry) -> None:
+        """Initialize the entity."""
+        super().__init__(config_entry, binary_sensor.DOMAIN, "any_zone_open")
+
+    @callback
+    def _async_set_value(self, open_count: int) -> bool:
+        """Set the value from the open zones count, return whether it changed."""
+        is_on = open_count > 0
+        if is_on == self._attr_is_on:
+            return False
+        self._attr_is_on = is_on
+        return True
+
+
+class PimaForceConditionBinarySensor(
+    PimaForceEntryEntity, binary_sensor.BinarySensorEntity
+):
+    """Whether the panel reports an active alarm (or trouble) condition."""
+
+    _unrecorded_attributes = frozenset({ATTR_EVENTS})
+    _events: frozenset[tuple[str, int]] | None = None
+
+    def __init__(
+        self,
+        config_entry: PimaForceConfigEntry,
+        key: str,
+        device_class: binary_sensor.BinarySensorDeviceClass,
+        conditions: set[tuple[str, int]],
+    ) -> None:
+        """Initialize the entity."""
+        self._attr_device_class = device_class
+        self._conditions = conditions
+        super().__init__(config_entry, binary_sensor.DOMAIN, key)
+
+    @callback
+    def _async_update_value(self) -> bool:
+        """Update the value from the coordinator, return whether it changed."""
+        if (events := frozenset(self._conditions)) == self._events:
+            return False
+        self._events = events
+        self._attr_is_on = bool(events)
+        self._attr_extra_state_attributes = {
+            ATTR_EVENTS: [
+                {ATTR_CODE: code, ATTR_ZONE: zone} for code, zone in sorted(events)
+            ]
+        }
+        return True
+
+
+class PimaForceConnectedBinarySensor(
+    PimaForceHealthEntity, binary_sensor.BinarySensorEntity
+):
+    """Whether the panel sent a frame recently."""
+
+    _attr_device_class = binary_sensor.BinarySensorDeviceClass.CONNECTIVITY
+
+    def __init__(self, config_entry: PimaForceConfigEntry) -> None:
+        """Initialize the entity."""
+        super().__init__(config_entry, binary_sensor.DOMAIN, "connected")
+
+    @callback
+    def _async_update_value(self) -> bool:
+        """Update the value from the coordinator, return whether it changed."""
+        if (connected := self.coordinator.connected) == self._attr_is_on:
+            return False
+        self._attr_is_on = connected
+        return True
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from typing import Any
+import re
+from typing import TYPE_CHECKING, Any
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
@@ -12,11 +13,36 @@ from homeassistant.config_entries import (
     ConfigFlowResult,
     OptionsFlow,
 )
-from homeassistant.const import CONF_NAME, CONF_PORT
+from homeassistant.const import CONF_NAME, CONF_PORT, UnitOfTime
 from homeassistant.core import callback
 from homeassistant.helpers import selector
 
-from .const import CONF_ZONES, DEFAULT_LISTENING_PORT, DOMAIN, TITLE
+from .const import (
+    CONF_ACCOUNT,
+    CONF_COALESCE_WINDOW,
+    CONF_IO_THREAD,
+    CONF_MAX_CONNECTIONS,
+    CONF_OVERFLOW_POLICY,
+    CONF_PROTOCOL,
+    CONF_RATE_LIMIT,
+    CONF_ZONES,
+    DEFAULT_LISTENING_PORT,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_RATE_LIMIT,
+    DOMAIN,
+    OVERFLOW_POLICY_KEEP_NEWEST,
+    OVERFLOW_POLICY_REFUSE,
+    PROTOCOL_TCP,
+    PROTOCOL_UDP,
+    TITLE,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from homeassistant.core import HomeAssistant
+
+ACCOUNT_PATTERN = re.compile(r"[0-9A-F]{3,16}")
 
 ZONES_SCHEMA = selector.ObjectSelector(
     selector.ObjectSelectorConfig(
@@ -30,14 +56,86 @@ ZONES_SCHEMA = selector.ObjectSelector(
     )
 )
 
+COALESCE_WINDOW_SCHEMA = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0,
+        max=60,
+        step=0.1,
+        unit_of_measurement=UnitOfTime.SECONDS,
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+
+RATE_LIMIT_SCHEMA = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0,
+        max=1000,
+        step=1,
+        unit_of_measurement="frames/s",
+        mode=selector.NumberSelectorMode.BOX,
+    )
+)
+
+MAX_CONNECTIONS_SCHEMA = selector.NumberSelector(
+    selector.NumberSelectorConfig(
+        min=0, max=1024, step=1, mode=selector.NumberSelectorMode.BOX
+    )
+)
+
+OVERFLOW_POLICY_SCHEMA = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[OVERFLOW_POLICY_KEEP_NEWEST, OVERFLOW_POLICY_REFUSE],
+        translation_key=CONF_OVERFLOW_POLICY,
+    )
+)
+
+PROTOCOL_SCHEMA = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[PROTOCOL_TCP, PROTOCOL_UDP], translation_key=CONF_PROTOCOL
+    )
+)
+
 OPTIONS_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_PORT, default=DEFAULT_LISTENING_PORT): cv.positive_int,
+        vol.Optional(CONF_PROTOCOL): PROTOCOL_SCHEMA,
+        vol.Optional(CONF_ACCOUNT): cv.string,
         vol.Optional(CONF_ZONES): ZONES_SCHEMA,
     }
 )
 
 
+def _title(options: Mapping[str, Any]) -> str:
+    """Return the title of a config entry."""
+    if account := options.get(CONF_ACCOUNT):
+        return f"{TITLE} {options[CONF_PORT]} {account}"
+    return f"{TITLE} {options[CONF_PORT]}"
+
+
+def _validate(
+    hass: HomeAssistant, options: dict[str, Any], entry_id: str | None = None
+) -> dict[str, str]:
+    """Normalize the account ID in place and return the form errors."""
+    if account := options.pop(CONF_ACCOUNT, "").strip().upper():
+        if not ACCOUNT_PATTERN.fullmatch(account):
+            return {CONF_ACCOUNT: "invalid_account"}
+        options[CONF_ACCOUNT] = account
+    if (
+        options.get(CONF_IO_THREAD)
+        and options.get(CONF_OVERFLOW_POLICY) == OVERFLOW_POLICY_REFUSE
+    ):
+        # Events are acknowledged in the I/O thread before they're queued.
+        return {CONF_OVERFLOW_POLICY: "refuse_io_thread"}
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if (
+            entry.entry_id != entry_id
+            and entry.options.get(CONF_PORT) == options[CONF_PORT]
+            and entry.options.get(CONF_ACCOUNT, "") == account
+        ):
+            return {"base": "already_configured"}
+    return {}
+
+
 class PimaForceConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Pima Force."""
 
@@ -47,13 +145,18 @@ class PimaForceConfigFlow(ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Handle the initial step."""
-        if user_input is None:
-            return self.async_show_form(step_id="user", data_schema=OPTIONS_SCHEMA)
+        errors: dict[str, str] = {}
+        if user_input is not None and not (errors := _validate(self.hass, user_input)):
+            return self.async_create_entry(
+                title=_title(user_input),
+                data={},
+                options=user_input,
+            )
 
-        return self.async_create_entry(
-            title=f"{TITLE} {user_input[CONF_PORT]}",
-            data={},
-            options=user_input,
+        return self.async_show_form(
+            step_id="user",
+            data_schema=self.add_suggested_values_to_schema(OPTIONS_SCHEMA, user_input),
+            errors=errors,
         )
 
     @staticmethod
@@ -72,14 +175,19 @@ class OptionsFlowHandler(OptionsFlow):
 
     async def async_step_init(self, user_input: dict[str, Any]) -> ConfigFlowResult:
         """Handle an options flow."""
+        errors: dict[str, str] = {}
         if user_input is not None:
-            if self._config_entry.options[CONF_PORT] != user_input[CONF_PORT]:
-                self.hass.config_entries.async_update_entry(
-                    self._config_entry, title=f"{TITLE} {user_input[CONF_PORT]}"
-                )
-            return self.async_create_entry(
-                data={**self._config_entry.options, **user_input},
-            )
+            options = {**self._config_entry.options, **user_input}
+            if CONF_ACCOUNT not in user_input:
+                options.pop(CONF_ACCOUNT, None)  # the field was cleared
+            if not (
+                errors := _validate(self.hass, options, self._config_entry.entry_id)
+            ):
+                if self._config_entry.title != (title := _title(options)):
+                    self.hass.config_entries.async_update_entry(
+                        self._config_entry, title=title
+                    )
+                return self.async_create_entry(data=options)
 
         return self.async_show_form(
             step_id="init",
@@ -88,9 +196,50 @@ class OptionsFlowHandler(OptionsFlow):
                     vol.Required(
                         CONF_PORT, default=self._config_entry.options[CONF_PORT]
                     ): cv.positive_int,
+                    vol.Optional(
+                        CONF_PROTOCOL,
+                        default=self._config_entry.options.get(
+                            CONF_PROTOCOL, PROTOCOL_TCP
+                        ),
+                    ): PROTOCOL_SCHEMA,
+                    vol.Optional(
+                        CONF_ACCOUNT,
+                        description={
+                            "suggested_value": self._config_entry.options.get(
+                                CONF_ACCOUNT
+                            )
+                        },
+                    ): cv.string,
                     vol.Optional(
                         CONF_ZONES, default=self._config_entry.options.get(CONF_ZONES)
                     ): ZONES_SCHEMA,
+                    vol.Optional(
+                        CONF_COALESCE_WINDOW,
+                        default=self._config_entry.options.get(CONF_COALESCE_WINDOW, 0),
+                    ): COALESCE_WINDOW_SCHEMA,
+                    vol.Optional(
+                        CONF_OVERFLOW_POLICY,
+                        default=self._config_entry.options.get(
+                            CONF_OVERFLOW_POLICY, OVERFLOW_POLICY_KEEP_NEWEST
+                        ),
+                    ): OVERFLOW_POLICY_SCHEMA,
+                    vol.Optional(
+                        CONF_IO_THREAD,
+                        default=self._config_entry.options.get(CONF_IO_THREAD, False),
+                    ): selector.BooleanSelector(),
+                    vol.Optional(
+                        CONF_RATE_LIMIT,
+                        default=self._config_entry.options.get(
+                            CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT
+                        ),
+                    ): RATE_LIMIT_SCHEMA,
+                    vol.Optional(
+                        CONF_MAX_CONNECTIONS,
+                        default=self._config_entry.options.get(
+                            CONF_MAX_CONNECTIONS, DEFAULT_MAX_CONNECTIONS
+                        ),
+                    ): vol.All(MAX_CONNECTIONS_SCHEMA, vol.Coerce(int)),
                 }
             ),
+            errors=errors,
         )
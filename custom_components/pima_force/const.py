@@ -8,11 +8,30 @@ TITLE: Final = "Pima Force"
 LOGGER = logging.getLogger(__package__)
 
 DEFAULT_LISTENING_PORT: Final = 10001
+CONF_ACCOUNT: Final = "account"
 CONF_ZONES: Final = "zones"
+CONF_COALESCE_WINDOW: Final = "coalesce_window"
+CONF_OVERFLOW_POLICY: Final = "overflow_policy"
+OVERFLOW_POLICY_KEEP_NEWEST: Final = "keep_newest"
+OVERFLOW_POLICY_REFUSE: Final = "refuse"
+CONF_IO_THREAD: Final = "io_thread"
+CONF_PROTOCOL: Final = "protocol"
+PROTOCOL_TCP: Final = "tcp"
+PROTOCOL_UDP: Final = "udp"
+CONF_RATE_LIMIT: Final = "rate_limit"
+DEFAULT_RATE_LIMIT: Final = 0  # frames per second of a source, 0 disables it
+CONF_MAX_CONNECTIONS: Final = "max_connections"
+DEFAULT_MAX_CONNECTIONS: Final = 0  # 0 disables the cap
 SERVICE_GET_ZONES: Final = "get_zones"
+SERVICE_GET_ZONE_STATES: Final = "get_zone_states"
 SERVICE_SET_ZONES: Final = "set_zones"
+SERVICE_QUERY_JOURNAL: Final = "query_journal"
 SERVICE_SET_OPEN: Final = "set_open"
 SERVICE_SET_CLOSED: Final = "set_closed"
+EVENT_JOURNAL: Final = f"{DOMAIN}_journal"
+SIGNAL_ZONES_UPDATED: Final = f"{DOMAIN}_zones_updated_{{}}"
+# Indexed by config entry ID, trigger type and zone (empty for panel triggers).
+SIGNAL_DEVICE_TRIGGER: Final = f"{DOMAIN}_device_trigger_{{}}_{{}}_{{}}"
 
 DEVICE_MANUFACTURER: Final = "Pima"
 DEVICE_MODEL: Final = "Force"
@@ -21,8 +40,73 @@ ATTR_LAST_OPEN: Final = "last_open"
 ATTR_LAST_CLOSE: Final = "last_close"
 ATTR_LAST_SET: Final = "last_set"
 ATTR_ZONE: Final = "zone"
+ATTR_SUPPRESSED_TRANSITIONS: Final = "suppressed_transitions"
+ATTR_START: Final = "start"
+ATTR_END: Final = "end"
+ATTR_REPLAY: Final = "replay"
+ATTR_RECORDS: Final = "records"
+ATTR_ENTRIES: Final = "entries"
+ATTR_EVENTS: Final = "events"
+ATTR_CODE: Final = "code"
+ATTR_ZONES: Final = "zones"
+ATTR_PARTITION: Final = "partition"
+ATTR_QUALIFIER: Final = "qualifier"
+ATTR_EVENT_TYPES: Final = "event_types"
+ATTR_OLD_STATE: Final = "old_state"
+ATTR_NEW_STATE: Final = "new_state"
+
+ARM_STATE_DISARMED: Final = "disarmed"
+ARM_STATE_ARMED_AWAY: Final = "armed_away"
+ARM_STATE_ARMED_HOME: Final = "armed_home"
+
+CONF_SUBTYPE: Final = "subtype"
+TRIGGER_TYPE_ZONE_OPENED: Final = "zone_opened"
+TRIGGER_TYPE_ZONE_CLOSED: Final = "zone_closed"
+TRIGGER_TYPE_ALARM: Final = "alarm"
+TRIGGER_TYPE_ALARM_RESTORED: Final = "alarm_restored"
+TRIGGER_TYPE_TROUBLE: Final = "trouble"
+TRIGGER_TYPE_TROUBLE_RESTORED: Final = "trouble_restored"
+TRIGGER_TYPE_ARMED_AWAY: Final = "armed_away"
+TRIGGER_TYPE_ARMED_HOME: Final = "armed_home"
+TRIGGER_TYPE_DISARMED: Final = "disarmed"
+ZONE_TRIGGER_TYPES: Final = (TRIGGER_TYPE_ZONE_OPENED, TRIGGER_TYPE_ZONE_CLOSED)
+PANEL_TRIGGER_TYPES: Final = (
+    TRIGGER_TYPE_ALARM,
+    TRIGGER_TYPE_ALARM_RESTORED,
+    TRIGGER_TYPE_TROUBLE,
+    TRIGGER_TYPE_TROUBLE_RESTORED,
+    TRIGGER_TYPE_ARMED_AWAY,
+    TRIGGER_TYPE_ARMED_HOME,
+    TRIGGER_TYPE_DISARMED,
+)
 
 SIA_PIMA_KEEP_CONNECTED_QUALIFIER: Final = "KC"
 ADM_CID_PIMA_ZONE_STATUS_CODE: Final = "760"
-ADM_CID_EVENT_QUALIFIER_OPEN: Final = "1"
-ADM_CID_EVENT_QUALIFIER_CLOSE: Final = "3"
+ADM_CID_MAX_ZONE: Final = 999  # the zone (or user) field has 3 digits
+ADM_CID_EVENT_QUALIFIER_OPEN: Final = "1"  # new event, or disarm (opening)
+ADM_CID_EVENT_QUALIFIER_CLOSE: Final = "3"  # restore, or arm (closing)
+ADM_CID_EVENT_QUALIFIER_STATUS: Final = "6"  # previously reported, still present
+ADM_CID_ALARM_CODES: Final = tuple(str(code) for code in range(100, 170))
+ADM_CID_TROUBLE_CODES: Final = (
+    "300",  # system trouble
+    "301",  # AC loss
+    "302",  # low system battery
+    "309",  # battery test failure
+    "311",  # battery missing
+    "312",  # power supply overcurrent
+    "321",  # bell
+    "330",  # system peripheral trouble
+    "333",  # expansion module failure
+    "344",  # RF receiver jam
+    "350",  # communication trouble
+    "351",  # telco fault
+    "354",  # failure to communicate
+    "373",  # fire trouble
+    "380",  # sensor trouble
+    "381",  # loss of RF supervision
+    "383",  # sensor tamper
+    "384",  # RF low battery
+)
+ADM_CID_ARM_AWAY_CODES: Final = ("400", "401", "402", "403", "407", "408", "409")
+ADM_CID_ARM_HOME_CODES: Final = ("441", "442")
+ADM_CID_BYPASS_CODES: Final = ("570", "571", "572", "573", "574")
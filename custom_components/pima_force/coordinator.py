@@ -2,28 +2,245 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import time
+from collections import deque
+from datetime import timedelta
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
-from homeassistant.const import CONF_PORT
+from homeassistant.const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_TIME,
+    CONF_PORT,
+    STATE_OFF,
+    STATE_ON,
+)
 from homeassistant.core import callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
-from pysiaalarm.account import SIAAccount
-from pysiaalarm.aio.client import SIAClient
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
 
 from .const import (
+    ADM_CID_ALARM_CODES,
+    ADM_CID_ARM_AWAY_CODES,
+    ADM_CID_ARM_HOME_CODES,
+    ADM_CID_BYPASS_CODES,
     ADM_CID_EVENT_QUALIFIER_CLOSE,
     ADM_CID_EVENT_QUALIFIER_OPEN,
+    ADM_CID_EVENT_QUALIFIER_STATUS,
+    ADM_CID_MAX_ZONE,
     ADM_CID_PIMA_ZONE_STATUS_CODE,
+    ADM_CID_TROUBLE_CODES,
+    ARM_STATE_ARMED_AWAY,
+    ARM_STATE_ARMED_HOME,
+    ARM_STATE_DISARMED,
+    ATTR_CODE,
+    ATTR_NEW_STATE,
+    ATTR_OLD_STATE,
+    ATTR_PARTITION,
+    ATTR_QUALIFIER,
+    ATTR_ZONE,
+    CONF_ACCOUNT,
+    CONF_COALESCE_WINDOW,
+    CONF_IO_THREAD,
+    CONF_MAX_CONNECTIONS,
+    CONF_OVERFLOW_POLICY,
+    CONF_PROTOCOL,
+    CONF_RATE_LIMIT,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_RATE_LIMIT,
     DOMAIN,
     LOGGER,
-    SIA_PIMA_KEEP_CONNECTED_QUALIFIER,
+    OVERFLOW_POLICY_KEEP_NEWEST,
+    OVERFLOW_POLICY_REFUSE,
+    PROTOCOL_TCP,
+    SIGNAL_DEVICE_TRIGGER,
+    TRIGGER_TYPE_ALARM,
+    TRIGGER_TYPE_ALARM_RESTORED,
+    TRIGGER_TYPE_ARMED_AWAY,
+    TRIGGER_TYPE_ARMED_HOME,
+    TRIGGER_TYPE_DISARMED,
+    TRIGGER_TYPE_TROUBLE,
+    TRIGGER_TYPE_TROUBLE_RESTORED,
+    TRIGGER_TYPE_ZONE_CLOSED,
+    TRIGGER_TYPE_ZONE_OPENED,
+    ZONE_TRIGGER_TYPES,
 )
+from .journal import Journal
+from .listener import DATA_LISTENERS, DEFAULT_ACCOUNT, async_register
+from .stats import CoordinatorStats
+from .zone_store import TIMESTAMPS, ZoneStore
 
 if TYPE_CHECKING:
-    from homeassistant.core import HomeAssistant
+    from collections.abc import Awaitable, Callable, Iterable
+    from datetime import datetime
+
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
     from pysiaalarm.event import SIAEvent
 
     from . import PimaForceConfigEntry
+    from .adm_cid import AdmCidEvent
+
+type DispatchHandler = Callable[[SIAEvent | AdmCidEvent], bool]  # False ignores it
+type EventSubscriber = Callable[[dict[str, Any]], None]
+type QueueKey = int | tuple[str | None, str | None, str | None]
+
+INGEST_QUEUE_SIZE = 1024  # events
+INGEST_BATCH_SIZE = 64  # events handled per event loop iteration
+STORAGE_VERSION = 1
+SAVE_DELAY = 10  # seconds
+HEALTH_CHECK_INTERVAL = timedelta(seconds=30)
+CONNECTION_TIMEOUT = 300  # seconds without frames until a panel is disconnected
+
+
+class _HealthTimer:
+    """Single timer running the health checks of all the config entries."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Start the timer."""
+        self.checks: set[Callable[[], None]] = set()
+        self.cancel = async_track_time_interval(
+            hass, self._async_run, HEALTH_CHECK_INTERVAL
+        )
+
+    @callback
+    def _async_run(self, _: datetime) -> None:
+        """Run the health checks."""
+        for check in list(self.checks):
+            check()
+
+
+class _QueuedEvent:
+    """Event waiting in the ingest queue, replaced in place once superseded."""
+
+    __slots__ = ("arrived", "event", "key")
+
+    def __init__(
+        self, arrived: float, event: SIAEvent | AdmCidEvent, key: QueueKey
+    ) -> None:
+        """Initialize the queued event."""
+        self.arrived = arrived  # time.perf_counter() of the arrival
+        self.event = event
+        self.key = key
+
+
+DATA_HEALTH_TIMER: HassKey[_HealthTimer] = HassKey(f"{DOMAIN}_health_timer")
+
+
+@callback
+def _async_track_health(
+    hass: HomeAssistant, check: Callable[[], None]
+) -> CALLBACK_TYPE:
+    """Run a check on the shared health timer, return the function removing it."""
+    if (timer := hass.data.get(DATA_HEALTH_TIMER)) is None:
+        timer = hass.data[DATA_HEALTH_TIMER] = _HealthTimer(hass)
+    timer.checks.add(check)
+
+    @callback
+    def async_remove() -> None:
+        timer.checks.discard(check)
+        if not timer.checks:
+            timer.cancel()
+            del hass.data[DATA_HEALTH_TIMER]
+
+    return async_remove
+
+
+DATA_EVENT_SUBSCRIBERS: HassKey[dict[str | None, list[EventSubscriber]]] = HassKey(
+    f"{DOMAIN}_event_subscribers"
+)
+
+
+@callback
+def async_subscribe_events(
+    hass: HomeAssistant,
+    subscriber: EventSubscriber,
+    entry_ids: Iterable[str] | None = None,
+) -> CALLBACK_TYPE:
+    """Pass the events of config entries (None for all) to a subscriber."""
+    subscribers = hass.data.setdefault(DATA_EVENT_SUBSCRIBERS, {})
+    # Kept by config entry ID, so subscriptions outlive the entries' reloads.
+    keys: list[str | None] = [None] if entry_ids is None else list(entry_ids)
+    for key in keys:
+        subscribers.setdefault(key, []).append(subscriber)
+
+    @callback
+    def async_remove() -> None:
+        for key in keys:
+            subscribers[key].remove(subscriber)
+            if not subscribers[key]:
+                del subscribers[key]
+        if not subscribers:
+            del hass.data[DATA_EVENT_SUBSCRIBERS]
+
+    return async_remove
+
+
+def _trigger_types() -> dict[tuple[str, str | None], str]:
+    """Return the panel device trigger types keyed by event code and qualifier."""
+    trigger_types: dict[tuple[str, str | None], str] = {}
+    for codes, new, restored in (
+        (ADM_CID_ALARM_CODES, TRIGGER_TYPE_ALARM, TRIGGER_TYPE_ALARM_RESTORED),
+        (ADM_CID_TROUBLE_CODES, TRIGGER_TYPE_TROUBLE, TRIGGER_TYPE_TROUBLE_RESTORED),
+    ):
+        for code in codes:
+            trigger_types[code, ADM_CID_EVENT_QUALIFIER_OPEN] = new
+            trigger_types[code, ADM_CID_EVENT_QUALIFIER_CLOSE] = restored
+    for codes, armed in (
+        (ADM_CID_ARM_AWAY_CODES, TRIGGER_TYPE_ARMED_AWAY),
+        (ADM_CID_ARM_HOME_CODES, TRIGGER_TYPE_ARMED_HOME),
+    ):
+        for code in codes:
+            trigger_types[code, ADM_CID_EVENT_QUALIFIER_OPEN] = TRIGGER_TYPE_DISARMED
+            trigger_types[code, ADM_CID_EVENT_QUALIFIER_CLOSE] = armed
+    return trigger_types
+
+
+TRIGGER_TYPES = _trigger_types()
+
+
+def _zone_status(event: SIAEvent | AdmCidEvent) -> tuple[int, bool] | None:
+    """Return the zone number and whether it's open of a zone status event."""
+    if (
+        event.event_type != ADM_CID_PIMA_ZONE_STATUS_CODE
+        or event.event_qualifier
+        not in (
+            ADM_CID_EVENT_QUALIFIER_OPEN,
+            ADM_CID_EVENT_QUALIFIER_CLOSE,
+        )
+        or not event.ri
+        or not event.ri.isdecimal()
+        # A malformed zone would overflow the journal and bloat the zone store.
+        or (zone := int(event.ri)) > ADM_CID_MAX_ZONE
+    ):
+        return None
+    return zone, event.event_qualifier == ADM_CID_EVENT_QUALIFIER_OPEN
+
+
+def _queue_key(event: SIAEvent | AdmCidEvent) -> QueueKey:
+    """Return the zone of a zone status event, or its code, partition and zone."""
+    if (status := _zone_status(event)) is None:
+        return (event.event_type, event.partition, event.ri)
+    return status[0]
+
+
+def _number(value: str | None, default: int = 0) -> int:
+    """Return the number of a zone (or user) or partition field."""
+    return int(value) if value and value.isdigit() else default
+
+
+def _store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store of the zones of a config entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+
+async def async_remove_store(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the store of the zones of a config entry."""
+    await _store(hass, entry_id).async_remove()
 
 
 class PimaForceDataUpdateCoordinator(DataUpdateCoordinator):
@@ -37,48 +254,499 @@ class PimaForceDataUpdateCoordinator(DataUpdateCoordinator):
         """Initialize global data updater."""
         super().__init__(hass, LOGGER, name=DOMAIN)
         self._config_entry = config_entry
-        self.zones: dict[int, bool] = {}  # zone number -> open state
-        self._sia_client = SIAClient(  # type: ignore[abstract]
-            "",
-            config_entry.options[CONF_PORT],
-            [
-                SIAAccount(
-                    "",
-                    allowed_timeband=None,
-                    response_qualifier=SIA_PIMA_KEEP_CONNECTED_QUALIFIER,
-                )
-            ],
-            self.process_event,
-        )  # pyright: ignore[reportAbstractUsage]
+        self.port: int = config_entry.options[CONF_PORT]
+        self.account: str = config_entry.options.get(CONF_ACCOUNT, DEFAULT_ACCOUNT)
+        self.protocol: str = config_entry.options.get(CONF_PROTOCOL, PROTOCOL_TCP)
+        self.io_thread: bool = config_entry.options.get(CONF_IO_THREAD, False)
+        self.rate_limit: float = config_entry.options.get(
+            CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT
+        )
+        self.max_connections: int = config_entry.options.get(
+            CONF_MAX_CONNECTIONS, DEFAULT_MAX_CONNECTIONS
+        )
+        self.zones = ZoneStore()
+        self.coalesce_window: float = config_entry.options.get(CONF_COALESCE_WINDOW, 0)
+        self.suppressed_transitions: dict[int, int] = {}  # zone number -> count
+        self._windows: dict[int, CALLBACK_TYPE] = {}  # zone number -> cancel timer
+        self._window_transitions: dict[int, int] = {}  # zone number -> count
+        self._window_pending: dict[int, bool] = {}  # zone number -> last state
+        self.batch_time: float | None = None  # shared timestamp of a flushed batch
+        self._batch: set[int] = set()  # zone numbers
+        self._batch_handle: asyncio.Handle | None = None
+        self._batch_started = 0.0  # time.perf_counter() of the batch's first arrival
+        self._arrived: float | None = None  # of the event being handled
+        self.overflow_policy: str = config_entry.options.get(
+            CONF_OVERFLOW_POLICY, OVERFLOW_POLICY_KEEP_NEWEST
+        )
+        self._queue: deque[_QueuedEvent] = deque()
+        self._queued: dict[QueueKey, _QueuedEvent] = {}  # newest queued by key
+        self._drain_task: asyncio.Task[None] | None = None
+        self.stats = CoordinatorStats()
+        self.journal = Journal(hass, config_entry.entry_id)
+        self._store = _store(hass, config_entry.entry_id)
+        self._save_pending = False  # whether a delayed save is scheduled
+        self.zones_restored = False  # whether the zone store was loaded
+        self._zone_states: dict[int, dict[str, Any]] = {}  # published by entities
+        self._zone_states_response: list[dict[str, Any]] | None = None
+        self._zone_listeners: dict[int, list[CALLBACK_TYPE]] = {}
+        self._unregister: Callable[[], Awaitable[None]] | None = None
+        self.last_frame: float | None = None  # POSIX time
+        self.connected: bool | None = None  # unknown until the first frame or timeout
+        self._panel_account = self.account  # last seen, for the default account
+        self._started = 0.0  # POSIX time
+        self._untrack_health: CALLBACK_TYPE | None = None
+        self.arm_states: dict[int, str] = {}  # partition number -> arm state
+        self.alarms: set[tuple[str, int]] = set()  # (event code, zone) active
+        self.troubles: set[tuple[str, int]] = set()  # (event code, zone) active
+        self.bypassed: set[int] = set()  # zone numbers
+        self._dispatch = self._build_dispatch()
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates (an integer context subscribes to a zone)."""
+        if not isinstance(context, int):
+            return super().async_add_listener(update_callback, context)
+        self._zone_listeners.setdefault(context, []).append(update_callback)
+        return partial(self._async_remove_zone_listener, context, update_callback)
+
+    @callback
+    def _async_remove_zone_listener(
+        self, zone: int, update_callback: CALLBACK_TYPE
+    ) -> None:
+        """Remove a zone listener."""
+        listeners = self._zone_listeners[zone]
+        listeners.remove(update_callback)
+        if not listeners:
+            del self._zone_listeners[zone]
+
+    @callback
+    def async_update_zone_listeners(self, *zones: int) -> None:
+        """Update the listeners of the given zones and the broadcast listeners."""
+        for zone in zones:
+            for update_callback in list(self._zone_listeners.get(zone, ())):
+                update_callback()
+        super().async_update_listeners()
+        if not self._save_pending:
+            # Not rearmed by later updates, which would postpone the save as
+            # long as the zones keep changing.
+            self._save_pending = True
+            self._store.async_delay_save(self._async_save_data, SAVE_DELAY)
+
+    @callback
+    def _async_save_data(self) -> dict[str, Any]:
+        """Return the zone store to save, once the delayed save is written."""
+        self._save_pending = False
+        return self.zones.as_dict()
+
+    @callback
+    def _async_schedule_zone_update(self, zone: int) -> None:
+        """Batch the zone updates of an event loop iteration."""
+        self._batch.add(zone)
+        self._async_schedule_update()
+
+    @callback
+    def _async_schedule_update(self) -> None:
+        """Update the listeners once the events of the loop iteration are handled."""
+        if self._batch_handle is None:
+            self._batch_started = (
+                time.perf_counter() if self._arrived is None else self._arrived
+            )
+            self._batch_handle = self.hass.loop.call_soon(self._async_flush_batch)
+
+    @callback
+    def _async_flush_batch(self) -> None:
+        """Update the listeners of the batched zones at once."""
+        zones, self._batch, self._batch_handle = self._batch, set(), None
+        self.batch_time = dt_util.utcnow().timestamp()
+        started = time.perf_counter()
+        self.stats.parse_to_listener.record(started - self._batch_started)
+        try:
+            self.async_update_zone_listeners(*zones)
+        finally:
+            self.batch_time = None
+        self.stats.listener_to_state_write.record(time.perf_counter() - started)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all registered listeners, including every zone listener."""
+        super().async_update_listeners()
+        for listeners in list(self._zone_listeners.values()):
+            for update_callback in list(listeners):
+                update_callback()
+
+    @callback
+    def async_set_zone_state(self, zone: int, state: dict[str, Any] | None) -> None:
+        """Update the snapshot of a zone (None removes it)."""
+        if state is None:
+            self._zone_states.pop(zone, None)
+        else:
+            self._zone_states[zone] = state
+        self._zone_states_response = None
+
+    @callback
+    def async_get_zone_states(self) -> list[dict[str, Any]]:
+        """Return the snapshot of all the zones, ordered by zone number."""
+        if self._zone_states_response is None:
+            self._zone_states_response = [
+                {
+                    **self._zone_states[zone],
+                    **{key: self.zones.isoformat(key, zone) for key in TIMESTAMPS},
+                }
+                for zone in sorted(self._zone_states)
+            ]
+        return self._zone_states_response
 
     async def process_event(self, event: SIAEvent) -> None:
         """Process new SIA ADM-CID event."""
+        self._arrived = time.perf_counter()
         self._handle_event(event)
+        self._arrived = None
+
+    @property
+    def ack_latency(self) -> float | None:
+        """Return the seconds the panel's last event frame waited for its ACK."""
+        if (listener := self.hass.data.get(DATA_LISTENERS, {}).get(self.port)) is None:
+            return None
+        return listener.server.ack_latency.get(self._panel_account)
 
     @callback
-    def _handle_event(self, event: SIAEvent) -> None:
+    def _async_check_health(self) -> None:
+        """Update the connection state and the health listeners."""
+        now = time.time()
+        if self.last_frame is not None and now - self.last_frame < CONNECTION_TIMEOUT:
+            self.connected = True
+        elif now - (self.last_frame or self._started) >= CONNECTION_TIMEOUT:
+            self.connected = False
+        super().async_update_listeners()
+
+    @callback
+    def async_ingest(self, event: SIAEvent | AdmCidEvent) -> bool:
+        """Queue an event, return False if it's refused since the queue is full."""
+        arrived = time.perf_counter()
+        self.last_frame = time.time()
+        self._panel_account = event.account or DEFAULT_ACCOUNT
+        if not self.connected:
+            self.connected = True
+            super().async_update_listeners()
+        queue = self._queue
+        stats = self.stats
+        key = _queue_key(event)
+        if len(queue) >= INGEST_QUEUE_SIZE:
+            if (
+                self.overflow_policy != OVERFLOW_POLICY_REFUSE
+                and (queued := self._queued.get(key)) is not None
+            ):
+                LOGGER.debug(
+                    "Queue full, dropped %s superseded by %s", queued.event, event
+                )
+                stats.events_dropped += 1
+                queued.arrived = arrived
+                queued.event = event
+                return True
+            if self.io_thread:
+                # Acknowledged already, the panel won't send it again.
+                LOGGER.debug("Queue full, dropped %s", event)
+                stats.events_dropped += 1
+            else:
+                LOGGER.debug("Queue full, refused %s", event)
+                stats.events_refused += 1
+            return False
+        queue.append(queued := _QueuedEvent(arrived, event, key))
+        self._queued[key] = queued
+        stats.queue_depth = len(queue)
+        stats.queue_high_water = max(stats.queue_high_water, stats.queue_depth)
+        if self._drain_task is None:
+            self._drain_task = self.hass.async_create_task(
+                self._async_drain(), eager_start=False
+            )
+        return True
+
+    async def _async_drain(self) -> None:
+        """Handle the queued events in batches, yielding to the loop in between."""
+        queue = self._queue
+        newest = self._queued
+        try:
+            while True:
+                for _ in range(min(len(queue), INGEST_BATCH_SIZE)):
+                    queued = queue.popleft()
+                    if newest.get(queued.key) is queued:
+                        del newest[queued.key]
+                    self._arrived = queued.arrived
+                    event = queued.event
+                    try:
+                        self._handle_event(event)
+                    except Exception:  # noqa: BLE001
+                        LOGGER.exception("Error handling event %s", event)
+                self._arrived = None
+                self.stats.queue_depth = len(queue)
+                if not queue:
+                    break
+                await asyncio.sleep(0)
+        finally:
+            self._drain_task = None
+
+    @callback
+    def _handle_event(self, event: SIAEvent | AdmCidEvent) -> None:
         """Handle a parsed SIA ADM-CID event."""
-        if (
-            event.event_type != ADM_CID_PIMA_ZONE_STATUS_CODE
-            or event.event_qualifier
-            not in (
+        stats = self.stats
+        stats.frames_received += 1
+        if event.event_type is None:
+            stats.keep_alives += 1
+            return
+        key = (event.event_type, event.event_qualifier)
+        if (handler := self._dispatch.get(key)) is not None and handler(event):
+            if (trigger_type := TRIGGER_TYPES.get(key)) is not None:
+                self._async_fire_trigger(trigger_type, event)
+        else:
+            stats.frames_ignored[event.event_type] = (
+                stats.frames_ignored.get(event.event_type, 0) + 1
+            )
+
+    @callback
+    def _async_fire_trigger(
+        self, trigger_type: str, event: SIAEvent | AdmCidEvent
+    ) -> None:
+        """Fire the device triggers of an event, without writing any state."""
+        zone = _number(event.ri)
+        async_dispatcher_send(
+            self.hass,
+            SIGNAL_DEVICE_TRIGGER.format(
+                self._config_entry.entry_id,
+                trigger_type,
+                zone if trigger_type in ZONE_TRIGGER_TYPES else "",
+            ),
+            {
+                ATTR_CODE: event.event_type,
+                ATTR_PARTITION: _number(event.partition, 1),
+                ATTR_ZONE: zone,
+            },
+        )
+
+    @callback
+    def _async_publish(
+        self,
+        subscribers: dict[str | None, list[EventSubscriber]],
+        event: SIAEvent | AdmCidEvent,
+        was_open: bool | None,  # noqa: FBT001
+        is_open: bool,  # noqa: FBT001
+    ) -> None:
+        """Pass a zone transition to the subscribers of the entry and all entries."""
+        entry_id = self._config_entry.entry_id
+        targets = [*subscribers.get(entry_id, ()), *subscribers.get(None, ())]
+        if not targets:
+            return
+        message = {
+            ATTR_CONFIG_ENTRY_ID: entry_id,
+            ATTR_TIME: time.time(),
+            ATTR_CODE: event.event_type,
+            ATTR_QUALIFIER: event.event_qualifier,
+            ATTR_PARTITION: _number(event.partition, 1),
+            ATTR_ZONE: _number(event.ri),
+            ATTR_OLD_STATE: (
+                None if was_open is None else STATE_ON if was_open else STATE_OFF
+            ),
+            ATTR_NEW_STATE: STATE_ON if is_open else STATE_OFF,
+        }
+        for subscriber in targets:
+            subscriber(message)
+
+    def _build_dispatch(self) -> dict[tuple[str, str | None], DispatchHandler]:
+        """Return the event handlers keyed by event code and qualifier."""
+        dispatch: dict[tuple[str, str | None], DispatchHandler] = {
+            (ADM_CID_PIMA_ZONE_STATUS_CODE, qualifier): self._handle_zone_status
+            for qualifier in (
                 ADM_CID_EVENT_QUALIFIER_OPEN,
                 ADM_CID_EVENT_QUALIFIER_CLOSE,
             )
-            or not event.ri
-            or not event.ri.isdigit()
+        }
+        for codes, conditions in (
+            (ADM_CID_ALARM_CODES, self.alarms),
+            (ADM_CID_TROUBLE_CODES, self.troubles),
         ):
-            return
+            for code in codes:
+                dispatch[code, ADM_CID_EVENT_QUALIFIER_OPEN] = dispatch[
+                    code, ADM_CID_EVENT_QUALIFIER_STATUS
+                ] = partial(self._handle_condition, conditions, code, active=True)
+                dispatch[code, ADM_CID_EVENT_QUALIFIER_CLOSE] = partial(
+                    self._handle_condition, conditions, code, active=False
+                )
+        for code in ADM_CID_BYPASS_CODES:
+            dispatch[code, ADM_CID_EVENT_QUALIFIER_OPEN] = partial(
+                self._handle_bypass, bypassed=True
+            )
+            dispatch[code, ADM_CID_EVENT_QUALIFIER_CLOSE] = partial(
+                self._handle_bypass, bypassed=False
+            )
+        for codes, armed in (
+            (ADM_CID_ARM_AWAY_CODES, ARM_STATE_ARMED_AWAY),
+            (ADM_CID_ARM_HOME_CODES, ARM_STATE_ARMED_HOME),
+        ):
+            for code in codes:
+                dispatch[code, ADM_CID_EVENT_QUALIFIER_OPEN] = partial(
+                    self._handle_arming, ARM_STATE_DISARMED
+                )
+                dispatch[code, ADM_CID_EVENT_QUALIFIER_CLOSE] = partial(
+                    self._handle_arming, armed
+                )
+        return dispatch
 
-        self.zones[int(event.ri)] = (
-            event.event_qualifier == ADM_CID_EVENT_QUALIFIER_OPEN
+    @callback
+    def _handle_condition(
+        self,
+        conditions: set[tuple[str, int]],
+        code: str,
+        event: SIAEvent | AdmCidEvent,
+        *,
+        active: bool,
+    ) -> bool:
+        """Handle an alarm or trouble event (or its restore)."""
+        key = (code, _number(event.ri))
+        if active != (key in conditions):
+            if active:
+                conditions.add(key)
+            else:
+                conditions.discard(key)
+            self._async_schedule_update()
+        return True
+
+    @callback
+    def _handle_bypass(self, event: SIAEvent | AdmCidEvent, *, bypassed: bool) -> bool:
+        """Handle a zone bypass event (or its restore)."""
+        zone = _number(event.ri)
+        if bypassed != (zone in self.bypassed):
+            if bypassed:
+                self.bypassed.add(zone)
+            else:
+                self.bypassed.discard(zone)
+            self._async_schedule_update()
+        return True
+
+    @callback
+    def _handle_arming(self, arm_state: str, event: SIAEvent | AdmCidEvent) -> bool:
+        """Handle an arming (closing) or disarming (opening) event of a partition."""
+        partition = _number(event.partition, 1)
+        if self.arm_states.get(partition) != arm_state:
+            self.arm_states[partition] = arm_state
+            self._async_schedule_update()
+        return True
+
+    @callback
+    def _handle_zone_status(self, event: SIAEvent | AdmCidEvent) -> bool:
+        """Handle a zone status event."""
+        if (status := _zone_status(event)) is None:
+            return False
+        zone, is_open = status
+        self.journal.append(time.time(), zone, is_open)
+        if self.zones.set_partition(zone, _number(event.partition, 1)):
+            self._async_schedule_update()
+        was_open = (
+            self._window_pending[zone]
+            if zone in self._window_pending
+            else self.zones.get(zone)
+        )
+        if changed := was_open != is_open:
+            self.stats.zone_changes += 1
+        if zone in self._windows:
+            # Written once the coalescing window of the zone is closed.
+            if changed:
+                self._window_transitions[zone] = (
+                    self._window_transitions.get(zone, 0) + 1
+                )
+                self._window_pending[zone] = is_open
+        else:
+            self.zones[zone] = is_open
+            if changed and self.coalesce_window:
+                self._async_open_window(zone)
+            self._async_schedule_zone_update(zone)
+        if changed:
+            # Zone triggers fire on transitions only, even within a window.
+            self._async_fire_trigger(
+                TRIGGER_TYPE_ZONE_OPENED if is_open else TRIGGER_TYPE_ZONE_CLOSED,
+                event,
+            )
+            if subscribers := self.hass.data.get(DATA_EVENT_SUBSCRIBERS):
+                self._async_publish(subscribers, event, was_open, is_open)
+        return True
+
+    @callback
+    def _async_open_window(self, zone: int) -> None:
+        """Start coalescing the transitions of a zone."""
+        self._windows[zone] = async_call_later(
+            self.hass,
+            self.coalesce_window,
+            partial(self._async_close_window, zone),
         )
-        self.async_update_listeners()
+
+    @callback
+    def _async_close_window(self, zone: int, _: datetime) -> None:
+        """Write the final state of a zone which changed during its window."""
+        del self._windows[zone]
+        if not (transitions := self._window_transitions.pop(zone, 0)):
+            return
+        # Only the last transition is written, unless the zone returned to
+        # the state written when the window was opened.
+        is_open = self._window_pending.pop(zone)
+        self.suppressed_transitions[zone] = (
+            self.suppressed_transitions.get(zone, 0)
+            + transitions
+            - (self.zones[zone] != is_open)
+        )
+        self.zones[zone] = is_open
+        self._async_open_window(zone)  # keep coalescing while the zone flaps
+        self._async_schedule_zone_update(zone)
 
     async def async_start(self) -> None:
-        """Start the SIA server."""
-        await self._sia_client.async_start()
+        """Start receiving the events of the account from the port's SIA server."""
+        self._started = time.time()
+        if (data := await self._store.async_load()) is not None:
+            self.zones.restore(data)
+            self.zones_restored = True
+        await self.hass.async_add_executor_job(self.journal.open)
+        try:
+            self._unregister = await async_register(
+                self.hass,
+                self.port,
+                self.account,
+                self.async_ingest,
+                protocol=self.protocol,
+                io_thread=self.io_thread,
+                refuse=self.overflow_policy == OVERFLOW_POLICY_REFUSE,
+                rate_limit=self.rate_limit,
+                max_connections=self.max_connections,
+            )
+        except Exception:
+            await self.hass.async_add_executor_job(self.journal.close)
+            raise
+        self._untrack_health = _async_track_health(self.hass, self._async_check_health)
 
     async def async_stop(self) -> None:
-        """Shutdown the SIA server."""
-        await self._sia_client.async_stop()
+        """Stop receiving events, the SIA server is shutdown once unused."""
+        if self._untrack_health is not None:
+            self._untrack_health()
+            self._untrack_health = None
+        for cancel in self._windows.values():
+            cancel()
+        self._windows.clear()
+        self._window_transitions.clear()
+        # The last states of the open windows are saved below.
+        for zone, is_open in self._window_pending.items():
+            self.zones[zone] = is_open
+        self._window_pending.clear()
+        if self._batch_handle is not None:
+            self._batch_handle.cancel()
+            self._batch_handle = None
+        self._batch.clear()
+        if self._drain_task is not None:
+            self._drain_task.cancel()
+            self._drain_task = None
+        self._queue.clear()
+        self._queued.clear()
+        self.stats.queue_depth = 0
+        if self._unregister is not None:
+            await self._unregister()
+            self._unregister = None
+        await self.hass.async_add_executor_job(self.journal.close)
+        self._save_pending = False  # canceled by the save below
+        await self._store.async_save(self.zones.as_dict())
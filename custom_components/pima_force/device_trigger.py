@@ -0,0 +1,116 @@
+"""Device triggers of pima_force integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import homeassistant.helpers.config_validation as cv
+import voluptuous as vol
+from homeassistant.components.device_automation import DEVICE_TRIGGER_BASE_SCHEMA
+from homeassistant.const import (
+    CONF_DEVICE_ID,
+    CONF_DOMAIN,
+    CONF_PLATFORM,
+    CONF_TYPE,
+)
+from homeassistant.core import HassJob, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from .const import (
+    CONF_SUBTYPE,
+    DOMAIN,
+    PANEL_TRIGGER_TYPES,
+    SIGNAL_DEVICE_TRIGGER,
+    ZONE_TRIGGER_TYPES,
+)
+from .entity import zone_names
+
+if TYPE_CHECKING:
+    from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+    from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
+    from homeassistant.helpers.typing import ConfigType
+
+TRIGGER_SCHEMA = vol.Any(
+    DEVICE_TRIGGER_BASE_SCHEMA.extend(
+        {
+            vol.Required(CONF_TYPE): vol.In(ZONE_TRIGGER_TYPES),
+            # The zone number.
+            vol.Required(CONF_SUBTYPE): vol.All(cv.string, vol.Match(r"^[1-9]\d*$")),
+        }
+    ),
+    DEVICE_TRIGGER_BASE_SCHEMA.extend(
+        {vol.Required(CONF_TYPE): vol.In(PANEL_TRIGGER_TYPES)}
+    ),
+)
+
+
+def _entry_id(hass: HomeAssistant, device_id: str) -> str | None:
+    """Return the config entry ID of a device."""
+    if (device := dr.async_get(hass).async_get(device_id)) is None:
+        return None
+    return next(
+        (value for domain, value in device.identifiers if domain == DOMAIN), None
+    )
+
+
+async def async_get_triggers(
+    hass: HomeAssistant, device_id: str
+) -> list[dict[str, Any]]:
+    """Return the triggers of the used zones and of the panel."""
+    if (entry_id := _entry_id(hass, device_id)) is None or (
+        config_entry := hass.config_entries.async_get_entry(entry_id)
+    ) is None:
+        return []
+    base = {
+        CONF_PLATFORM: "device",
+        CONF_DOMAIN: DOMAIN,
+        CONF_DEVICE_ID: device_id,
+    }
+    return [
+        *(
+            {**base, CONF_TYPE: trigger_type, CONF_SUBTYPE: str(zone)}
+            for zone in zone_names(config_entry)
+            for trigger_type in ZONE_TRIGGER_TYPES
+        ),
+        *({**base, CONF_TYPE: trigger_type} for trigger_type in PANEL_TRIGGER_TYPES),
+    ]
+
+
+async def async_attach_trigger(
+    hass: HomeAssistant,
+    config: ConfigType,
+    action: TriggerActionType,
+    trigger_info: TriggerInfo,
+) -> CALLBACK_TYPE:
+    """Run the action on the events of the trigger, as the coordinator decodes them."""
+    device_id = config[CONF_DEVICE_ID]
+    trigger_type = config[CONF_TYPE]
+    subtype = config.get(CONF_SUBTYPE, "")
+    job = HassJob(action)
+    trigger_data = trigger_info["trigger_data"]
+
+    @callback
+    def async_fire(data: dict[str, Any]) -> None:
+        """Run the action of an event."""
+        hass.async_run_hass_job(
+            job,
+            {
+                "trigger": {
+                    **trigger_data,
+                    CONF_PLATFORM: "device",
+                    CONF_DOMAIN: DOMAIN,
+                    CONF_DEVICE_ID: device_id,
+                    CONF_TYPE: trigger_type,
+                    CONF_SUBTYPE: subtype,
+                    **data,
+                    "description": f"{DOMAIN} {trigger_type}",
+                }
+            },
+        )
+
+    return async_dispatcher_connect(
+        hass,
+        SIGNAL_DEVICE_TRIGGER.format(_entry_id(hass, device_id), trigger_type, subtype),
+        async_fire,
+    )
@@ -0,0 +1,27 @@
+"""Diagnostics support for pima_force integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from .listener import DATA_LISTENERS
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from . import PimaForceConfigEntry
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: PimaForceConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data.coordinator
+    listener = hass.data[DATA_LISTENERS][coordinator.port]
+    return {
+        "options": dict(entry.options),
+        "zones": dict(coordinator.zones),
+        "suppressed_transitions": coordinator.suppressed_transitions,
+        "coordinator": coordinator.stats.as_dict(),
+        "server": listener.server.stats.as_dict(),
+    }
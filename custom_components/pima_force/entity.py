@@ -2,26 +2,54 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from abc import abstractmethod
+from typing import TYPE_CHECKING, Any
 
+from homeassistant.const import CONF_NAME, CONF_PORT, EntityCategory
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DEVICE_MANUFACTURER, DEVICE_MODEL, DOMAIN
+from .const import (
+    CONF_ACCOUNT,
+    CONF_ZONES,
+    DEVICE_MANUFACTURER,
+    DEVICE_MODEL,
+    DOMAIN,
+    SIGNAL_ZONES_UPDATED,
+)
 from .coordinator import PimaForceDataUpdateCoordinator
 
 if TYPE_CHECKING:
     from . import PimaForceConfigEntry
 
 
+def zone_names(config_entry: PimaForceConfigEntry) -> dict[int, str]:
+    """Return the names of the used zones keyed by zone number."""
+    return {
+        index + 1: zone[CONF_NAME]
+        for index, zone in enumerate(config_entry.options.get(CONF_ZONES, []))
+        if zone.get(CONF_NAME)
+    }
+
+
+def object_id(config_entry: PimaForceConfigEntry) -> str:
+    """Return the prefix of the entity IDs of a config entry."""
+    prefix = f"{DOMAIN}_{config_entry.options[CONF_PORT]}"
+    if account := config_entry.options.get(CONF_ACCOUNT):
+        prefix = f"{prefix}_{account.lower()}"
+    return prefix
+
+
 class PimaForceEntity(CoordinatorEntity[PimaForceDataUpdateCoordinator]):
     """Base class for entities."""
 
     _attr_has_entity_name = True
 
-    def __init__(self, config_entry: PimaForceConfigEntry) -> None:
+    def __init__(self, config_entry: PimaForceConfigEntry, context: Any = None) -> None:
         """Initialize the entity."""
-        super().__init__(config_entry.runtime_data.coordinator)
+        super().__init__(config_entry.runtime_data.coordinator, context)
         self._config_entry = config_entry
         self._attr_device_info = DeviceInfo(
             translation_key="default",
@@ -29,3 +57,91 @@ class PimaForceEntity(CoordinatorEntity[PimaForceDataUpdateCoordinator]):
             model=DEVICE_MODEL,
             identifiers={(DOMAIN, config_entry.entry_id)},
         )
+
+
+class PimaForceEntryEntity(PimaForceEntity):
+    """Base class for entities with a value of the whole entry."""
+
+    def __init__(
+        self, config_entry: PimaForceConfigEntry, platform: str, key: str
+    ) -> None:
+        """Initialize the entity."""
+        super().__init__(config_entry)
+        self._attr_translation_key = key
+        self._attr_unique_id = f"{config_entry.entry_id}_{key}"
+        self.entity_id = f"{platform}.{object_id(config_entry)}_{key}"
+        self._async_update_value()
+
+    @callback
+    @abstractmethod
+    def _async_update_value(self) -> bool:
+        """Update the value from the coordinator, return whether it changed."""
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator, written only on a change."""
+        if self._async_update_value():
+            super()._handle_coordinator_update()
+
+
+class PimaForcePartitionEntity(PimaForceEntryEntity):
+    """Base class for entities with a value of a partition."""
+
+    def __init__(
+        self,
+        config_entry: PimaForceConfigEntry,
+        platform: str,
+        key: str,
+        partition: int,
+    ) -> None:
+        """Initialize the entity."""
+        self._partition = partition
+        super().__init__(config_entry, platform, f"{key}_{partition}")
+        self._attr_translation_key = key
+        self._attr_translation_placeholders = {"partition": str(partition)}
+
+
+class PimaForceAggregateEntity(PimaForceEntryEntity):
+    """Base class for entities aggregating the open state of the used zones."""
+
+    _mask = 0  # bit per used zone
+
+    @callback
+    @abstractmethod
+    def _async_set_value(self, open_count: int) -> bool:
+        """Set the value from the open zones count, return whether it changed."""
+
+    @callback
+    def _async_update_value(self) -> bool:
+        """Recount the open zones, return whether the value changed."""
+        return self._async_set_value(self.coordinator.zones.open_count(self._mask))
+
+    @callback
+    def _async_update_mask(self) -> bool:
+        """Follow the used zones, return whether the value changed."""
+        self._mask = sum(1 << zone for zone in zone_names(self._config_entry))
+        return self._async_update_value()
+
+    @callback
+    def _async_zones_updated(self) -> None:
+        """Handle a change of the used zones."""
+        if self._async_update_mask():
+            self.async_write_ha_state()
+
+    async def async_added_to_hass(self) -> None:
+        """Handle entity which will be added."""
+        await super().async_added_to_hass()
+        self._async_update_mask()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_ZONES_UPDATED.format(self._config_entry.entry_id),
+                self._async_zones_updated,
+            )
+        )
+
+
+class PimaForceHealthEntity(PimaForceEntryEntity):
+    """Base class for the diagnostic entities of the panel's connection."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
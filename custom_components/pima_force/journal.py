@@ -0,0 +1,99 @@
+"""Persistent journal of zone events for pima_force integration."""
+
+from __future__ import annotations
+
+import mmap
+import struct
+from pathlib import Path
+from typing import TYPE_CHECKING, Final
+
+from homeassistant.helpers.storage import STORAGE_DIR
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from homeassistant.core import HomeAssistant
+
+JOURNAL_CAPACITY: Final = 65536  # records
+_MAGIC: Final = b"PFJ1"
+_HEADER: Final = struct.Struct("<4sI")  # magic, capacity
+_POSITION: Final = struct.Struct("<II")  # next record index, record count
+_RECORD: Final = struct.Struct("<dH?")  # POSIX time, zone, is open
+_RECORDS_OFFSET: Final = _HEADER.size + _POSITION.size
+
+
+def _path(hass: HomeAssistant, entry_id: str) -> Path:
+    """Return the journal file path of a config entry."""
+    return Path(hass.config.path(STORAGE_DIR, f"{DOMAIN}.{entry_id}.journal"))
+
+
+class Journal:
+    """Fixed-size ring buffer of zone events in a memory-mapped file."""
+
+    def __init__(
+        self, hass: HomeAssistant, entry_id: str, capacity: int = JOURNAL_CAPACITY
+    ) -> None:
+        """Initialize the journal."""
+        self.path = _path(hass, entry_id)
+        self.capacity = capacity
+        self._mmap: mmap.mmap | None = None
+        self._next = 0
+        self._count = 0
+
+    def open(self) -> None:
+        """Map the journal file, it's (re)created if missing or incompatible."""
+        size = _RECORDS_OFFSET + self.capacity * _RECORD.size
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.touch()
+        with self.path.open("r+b") as file:
+            if self.path.stat().st_size != size:
+                file.truncate(0)
+                file.truncate(size)
+            self._mmap = mmap.mmap(file.fileno(), size)
+        if _HEADER.unpack_from(self._mmap) != (_MAGIC, self.capacity):
+            _HEADER.pack_into(self._mmap, 0, _MAGIC, self.capacity)
+            _POSITION.pack_into(self._mmap, _HEADER.size, 0, 0)
+        self._next, self._count = _POSITION.unpack_from(self._mmap, _HEADER.size)
+
+    def close(self) -> None:
+        """Flush and unmap the journal file."""
+        if self._mmap is not None:
+            self._mmap.flush()
+            self._mmap.close()
+            self._mmap = None
+
+    def append(self, time: float, zone: int, is_open: bool) -> None:  # noqa: FBT001
+        """Write a zone event, overwriting the oldest one once full."""
+        if (journal := self._mmap) is None:
+            return
+        _RECORD.pack_into(
+            journal, _RECORDS_OFFSET + self._next * _RECORD.size, time, zone, is_open
+        )
+        self._next = (self._next + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+        _POSITION.pack_into(journal, _HEADER.size, self._next, self._count)
+
+    def records(
+        self, start: float | None = None, end: float | None = None
+    ) -> Iterator[tuple[float, int, bool]]:
+        """Yield the (time, zone, is open) events of a time range, oldest first."""
+        if (journal := self._mmap) is None:
+            return
+        oldest = (self._next - self._count) % self.capacity
+        for index in range(self._count):
+            record: tuple[float, int, bool] = _RECORD.unpack_from(
+                journal,
+                _RECORDS_OFFSET + (oldest + index) % self.capacity * _RECORD.size,
+            )
+            if (start is None or record[0] >= start) and (
+                end is None or record[0] <= end
+            ):
+                yield record
+
+
+def remove_journal(hass: HomeAssistant, entry_id: str) -> None:
+    """Delete the journal file of a config entry."""
+    _path(hass, entry_id).unlink(missing_ok=True)
@@ -0,0 +1,193 @@
+"""Shared SIA listener for pima_force integration."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import deque
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.exceptions import ConfigEntryError
+from homeassistant.util.hass_dict import HassKey
+
+from .const import (
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_RATE_LIMIT,
+    DOMAIN,
+    PROTOCOL_TCP,
+    PROTOCOL_UDP,
+)
+from .server import PimaForceSIAServer, PimaForceSIAServerUDP
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from homeassistant.core import HomeAssistant
+    from pysiaalarm.event import SIAEvent
+
+    from .adm_cid import AdmCidEvent
+
+type EventHandler = Callable[[SIAEvent | AdmCidEvent], bool]  # False refuses it
+
+DATA_LISTENERS: HassKey[dict[int, PimaForceListener]] = HassKey(DOMAIN)
+DEFAULT_ACCOUNT = ""  # route for panels without a dedicated config entry
+
+
+class PimaForceListener:
+    """SIA server shared by all the config entries listening on the same port."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        hass: HomeAssistant,
+        port: int,
+        *,
+        protocol: str,
+        io_thread: bool,
+        rate_limit: float = DEFAULT_RATE_LIMIT,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    ) -> None:
+        """Initialize the listener."""
+        self.hass = hass
+        self.port = port
+        self.protocol = protocol
+        self.io_thread = io_thread
+        self.routes: dict[str, EventHandler] = {}  # account ID -> handler
+        # With an I/O thread, the SIA server runs on its own event loop and the
+        # events are handed over to Home Assistant's loop in batches.
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._handoff: deque[SIAEvent | AdmCidEvent] = deque()
+        self._handoff_scheduled = False
+        self._route: EventHandler = self.async_route
+        if io_thread:
+            self._loop = asyncio.new_event_loop()
+            self._route = self._route_threadsafe
+        self.server = (
+            PimaForceSIAServerUDP if protocol == PROTOCOL_UDP else PimaForceSIAServer
+        )(
+            port,
+            self._route,
+            rate_limit=rate_limit,
+            max_connections=max_connections,
+        )
+
+    def _route_threadsafe(self, event: SIAEvent | AdmCidEvent) -> bool:
+        """Hand an event over to Home Assistant's loop (called in the I/O thread)."""
+        self._handoff.append(event)
+        if not self._handoff_scheduled:
+            self._handoff_scheduled = True
+            self.hass.loop.call_soon_threadsafe(self._async_route_handoff)
+        return True  # the queue's overflow policy can't hold the ACK back
+
+    @callback
+    def _async_route_handoff(self) -> None:
+        """Route the events handed over by the I/O thread."""
+        self._handoff_scheduled = False
+        handoff = self._handoff
+        while handoff:
+            self.async_route(handoff.popleft())
+
+    @callback
+    def async_route(self, event: SIAEvent | AdmCidEvent) -> bool:
+        """Route an event to the handler of its account, return False if refused."""
+        if (handler := self.routes.get((event.account or DEFAULT_ACCOUNT).upper())) or (
+            handler := self.routes.get(DEFAULT_ACCOUNT)
+        ):
+            return handler(event)
+        self.server.stats.frames_unrouted += 1
+        return True
+
+    async def async_start(self) -> None:
+        """Start the SIA server."""
+        if (loop := self._loop) is None:
+            await self.server.async_start()
+            return
+        self._thread = thread = threading.Thread(
+            target=loop.run_forever, name=f"{DOMAIN}_{self.port}", daemon=True
+        )
+        thread.start()
+        try:
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(self.server.async_start(), loop)
+            )
+        except Exception:
+            await self._async_stop_thread(loop, thread)
+            raise
+
+    async def async_stop(self) -> None:
+        """Shutdown the SIA server."""
+        if (loop := self._loop) is None or (thread := self._thread) is None:
+            await self.server.async_stop()
+            return
+        await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(self.server.async_stop(), loop)
+        )
+        await self._async_stop_thread(loop, thread)
+
+    async def _async_stop_thread(
+        self, loop: asyncio.AbstractEventLoop, thread: threading.Thread
+    ) -> None:
+        """Stop the I/O thread's loop and wait for the thread to end."""
+        loop.call_soon_threadsafe(loop.stop)
+        await self.hass.async_add_executor_job(thread.join)
+        loop.close()
+        self._thread = None
+
+
+async def async_register(  # noqa: PLR0913
+    hass: HomeAssistant,
+    port: int,
+    account: str,
+    handler: EventHandler,
+    *,
+    protocol: str = PROTOCOL_TCP,
+    io_thread: bool = False,
+    refuse: bool = False,
+    rate_limit: float = DEFAULT_RATE_LIMIT,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+) -> Callable[[], Awaitable[None]]:
+    """
+    Route the events of an account to a handler, return the unregister function.
+
+    A handler which refuses events (to hold their ACK back) can't share the port
+    with an I/O thread, where events are always acknowledged.
+    """
+    listeners = hass.data.setdefault(DATA_LISTENERS, {})
+    if (listener := listeners.get(port)) is None:
+        # The I/O thread mode and the limits are set by the first config entry
+        # on the port.
+        listener = listeners[port] = PimaForceListener(
+            hass,
+            port,
+            protocol=protocol,
+            io_thread=io_thread,
+            rate_limit=rate_limit,
+            max_connections=max_connections,
+        )
+        listener.routes[account] = handler
+        try:
+            await listener.async_start()
+        except Exception:
+            del listeners[port]
+            raise
+    elif protocol != listener.protocol:
+        msg = f"Port {port} is served over {listener.protocol.upper()}"
+        raise ConfigEntryError(msg)
+    elif account in listener.routes:
+        msg = f"Account '{account}' is already served on port {port}"
+        raise ConfigEntryError(msg)
+    elif refuse and listener.io_thread:
+        msg = f"Port {port} is served by an I/O thread, which can't refuse events"
+        raise ConfigEntryError(msg)
+    else:
+        listener.routes[account] = handler
+
+    async def async_unregister() -> None:
+        """Remove the route and stop the listener once it is unused."""
+        del listener.routes[account]
+        if not listener.routes:
+            del listeners[port]
+            await listener.async_stop()
+
+    return async_unregister
@@ -0,0 +1,203 @@
+"""Support for representing pima force panel state and health as sensors."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.components import sensor
+from homeassistant.const import UnitOfTime
+from homeassistant.core import callback
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    ARM_STATE_ARMED_AWAY,
+    ARM_STATE_ARMED_HOME,
+    ARM_STATE_DISARMED,
+    ATTR_ZONES,
+)
+from .entity import (
+    PimaForceAggregateEntity,
+    PimaForceEntryEntity,
+    PimaForceHealthEntity,
+    PimaForcePartitionEntity,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from custom_components.pima_force import PimaForceConfigEntry
+
+PARALLEL_UPDATES = 0
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,  # noqa: ARG001
+    config_entry: PimaForceConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Initialize config entry."""
+    coordinator = config_entry.runtime_data.coordinator
+    partitions: set[int] = set()
+
+    @callback
+    def async_add_partitions() -> None:
+        """Add the entities of every partition newly reported."""
+        if (
+            added := (
+                coordinator.arm_states.keys() | set(coordinator.zones.partitions())
+            )
+            - partitions
+        ):
+            partitions.update(added)
+            async_add_entities(
+                entity
+                for partition in sorted(added)
+                for entity in (
+                    PimaForcePartitionOpenZonesSensor(config_entry, partition),
+                    PimaForceArmStateSensor(config_entry, partition),
+                )
+            )
+
+    async_add_entities(
+        [
+            PimaForceOpenZonesSensor(config_entry),
+            PimaForceBypassedZonesSensor(config_entry),
+            PimaForceLastFrameSensor(config_entry),
+            PimaForceAckLatencySensor(config_entry),
+        ]
+    )
+    async_add_partitions()
+    config_entry.async_on_unload(coordinator.async_add_listener(async_add_partitions))
+
+
+class PimaForceOpenZonesSensor(PimaForceAggregateEntity, sensor.SensorEntity):
+    """Number of open zones among the used zones."""
+
+    _attr_state_class = sensor.SensorStateClass.MEASUREMENT
+
+    def __init__(self, config_entry: PimaForceConfigEntry) -> None:
+        """Initialize the entity."""
+        super().__init__(config_entry, sensor.DOMAIN, "open_zones")
+
+    @callback
+    def _async_set_value(self, open_count: int) -> bool:
+        """Set the value from the open zones count, return whether it changed."""
+        if open_count == self._attr_native_value:
+            return False
+        self._attr_native_value = open_count
+        return True
+
+
+class PimaForceBypassedZonesSensor(PimaForceEntryEntity, sensor.SensorEntity):
+    """Number of zones the panel reports bypassed."""
+
+    _attr_state_class = sensor.SensorStateClass.MEASUREMENT
+    _unrecorded_attributes = frozenset({ATTR_ZONES})
+    _zones: frozenset[int] | None = None
+
+    def __init__(self, config_entry: PimaForceConfigEntry) -> None:
+        """Initialize the entity."""
+        super().__init__(config_entry, sensor.DOMAIN, "bypassed_zones")
+
+    @callback
+    def _async_update_value(self) -> bool:
+        """Update the value from the coordinator, return whether it changed."""
+        if (zones := frozenset(self.coordinator.bypassed)) == self._zones:
+            return False
+        self._zones = zones
+        self._attr_native_value = len(zones)
+        self._attr_extra_state_attributes = {ATTR_ZONES: sorted(zones)}
+        return True
+
+
+class PimaForcePartitionOpenZonesSensor(
+    PimaForcePartitionEntity, PimaForceAggregateEntity, sensor.SensorEntity
+):
+    """Number of open zones of a partition among the used zones."""
+
+    _attr_state_class = sensor.SensorStateClass.MEASUREMENT
+
+    def __init__(self, config_entry: PimaForceConfigEntry, partition: int) -> None:
+        """Initialize the entity."""
+        super().__init__(config_entry, sensor.DOMAIN, "partition_open_zones", partition)
+
+    @callback
+    def _async_update_value(self) -> bool:
+        """Recount the open zones of the partition, return whether it changed."""
+        return self._async_set_value(
+            self.coordinator.zones.partition_open_count(self._partition, self._mask)
+        )
+
+    @callback
+    def _async_set_value(self, open_count: int) -> bool:
+        """Set the value from the open zones count, return whether it changed."""
+        if open_count == self._attr_native_value:
+            return False
+        self._attr_native_value = open_count
+        return True
+
+
+class PimaForceArmStateSensor(PimaForcePartitionEntity, sensor.SensorEntity):
+    """Arm state of a partition, as last reported by the panel."""
+
+    _attr_device_class = sensor.SensorDeviceClass.ENUM
+    _attr_options = [ARM_STATE_DISARMED, ARM_STATE_ARMED_AWAY, ARM_STATE_ARMED_HOME]  # noqa: RUF012
+
+    def __init__(self, config_entry: PimaForceConfigEntry, partition: int) -> None:
+        """Initialize the entity."""
+        super().__init__(config_entry, sensor.DOMAIN, "arm_state", partition)
+
+    @callback
+    def _async_update_value(self) -> bool:
+        """Update the value from the coordinator, return whether it changed."""
+        arm_state = self.coordinator.arm_states.get(self._partition)
+        if arm_state == self._attr_native_value:
+            return False
+        self._attr_native_value = arm_state
+        return True
+
+
+class PimaForceLastFrameSensor(PimaForceHealthEntity, sensor.SensorEntity):
+    """Time of the last frame received from the panel."""
+
+    _attr_device_class = sensor.SensorDeviceClass.TIMESTAMP
+    _last_frame: float | None = None
+
+    def __init__(self, config_entry: PimaForceConfigEntry) -> None:
+        """Initialize the entity."""
+        super().__init__(config_entry, sensor.DOMAIN, "last_frame")
+
+    @callback
+    def _async_update_value(self) -> bool:
+        """Update the value from the coordinator, return whether it changed."""
+        if (last_frame := self.coordinator.last_frame) == self._last_frame:
+            return False
+        self._last_frame = last_frame
+        self._attr_native_value = (
+            None if last_frame is None else dt_util.utc_from_timestamp(last_frame)
+        )
+        return True
+
+
+class PimaForceAckLatencySensor(PimaForceHealthEntity, sensor.SensorEntity):
+    """Time the panel's last event frame waited for its ACK."""
+
+    _attr_device_class = sensor.SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = sensor.SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 1
+
+    def __init__(self, config_entry: PimaForceConfigEntry) -> None:
+        """Initialize the entity."""
+        super().__init__(config_entry, sensor.DOMAIN, "ack_latency")
+
+    @callback
+    def _async_update_value(self) -> bool:
+        """Update the value from the coordinator, return whether it changed."""
+        latency = self.coordinator.ack_latency
+        value = None if latency is None else round(latency * 1000, 1)
+        if value == self._attr_native_value:
+            return False
+        self._attr_native_value = value
+        return True
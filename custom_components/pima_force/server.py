@@ -0,0 +1,269 @@
+"""SIA TCP and UDP servers for pima_force integration."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.util.async_ import create_eager_task
+from pysiaalarm.account import SIAAccount
+from pysiaalarm.aio.server import SIAServerTCP
+from pysiaalarm.base_server import BaseSIAServer
+from pysiaalarm.event import SIAEvent
+from pysiaalarm.utils.counter import Counter
+from pysiaalarm.utils.enums import ResponseType
+
+from .adm_cid import create_ack, parse_frame
+from .const import (
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_RATE_LIMIT,
+    LOGGER,
+    SIA_PIMA_KEEP_CONNECTED_QUALIFIER,
+)
+from .stats import ServerStats
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from .adm_cid import AdmCidEvent
+
+FRAME_TERMINATOR = b"\r"
+READ_SIZE = 1000
+MAX_FRAME_SIZE = 1000
+DEDUP_CACHE_SIZE = 256  # frames
+RATE_LIMIT_BURST = 5  # seconds of frames a source can send at once
+RATE_LIMIT_SOURCES = 256  # token buckets kept, least recently used are reset
+ACK_LATENCY_ACCOUNTS = 256  # accounts kept, oldest are forgotten
+
+
+class PimaForceSIAServer(SIAServerTCP):
+    """SIA TCP server with a fast path for Pima's zone status and keep-alive frames."""
+
+    def __init__(
+        self,
+        port: int,
+        route: Callable[[SIAEvent | AdmCidEvent], bool],
+        *,
+        rate_limit: float = DEFAULT_RATE_LIMIT,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    ) -> None:
+        """Initialize the server."""
+        # pysiaalarm's callback isn't used: every event is routed before it's
+        # acknowledged, so a refused event isn't acknowledged.
+        BaseSIAServer.__init__(
+            self,
+            {
+                "": SIAAccount(
+                    "",
+                    allowed_timeband=None,
+                    response_qualifier=SIA_PIMA_KEEP_CONNECTED_QUALIFIER,
+                )
+            },
+            Counter(),
+        )
+        self.port = port
+        self._route = route
+        self._server: asyncio.Server | None = None
+        self.stats = ServerStats()
+        # Recently acknowledged event frames (account, sequence and payload) and
+        # their ACK, to answer retransmissions without passing them on again.
+        self._acked: OrderedDict[bytes, bytes] = OrderedDict()
+        self.rate_limit = rate_limit  # frames per second of a source, 0 disables it
+        self.max_connections = max_connections  # 0 disables the cap
+        self._connections = 0
+        # Token bucket (tokens, monotonic time of the last refill) of a source.
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        # Seconds from the arrival of the last event frame of an account until
+        # its ACK was sent (including the wait for the connection to drain).
+        self.ack_latency: dict[str, float] = {}
+
+    async def async_start(self) -> None:
+        """Start listening."""
+        self._server = await asyncio.start_server(self.handle_line, "", self.port)
+
+    async def async_stop(self) -> None:
+        """Stop listening."""
+        if self._server is None:
+            return
+        self.shutdown_flag = True
+        self._server.close()
+        await self._server.wait_closed()
+        self._server = None
+
+    async def handle_line(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Handle the frames of a connection."""
+        if self.max_connections and self._connections >= self.max_connections:
+            self.stats.connections_refused += 1
+            writer.close()
+            await writer.wait_closed()
+            return
+        self._connections += 1
+        self.stats.connections_accepted += 1
+        source = (writer.get_extra_info("peername") or ("",))[0]
+        buffer = b""
+        try:
+
+            async def respond(data: bytes) -> None:
+                writer.write(data)
+                await writer.drain()
+
+            while not self.shutdown_flag:
+                try:
+                    data = await reader.read(READ_SIZE)
+                except ConnectionResetError:
+                    self.stats.connections_dropped += 1
+                    break
+                if not data:
+                    break
+                # A burst can deliver several frames in a single read, and a
+                # frame can span reads.
+                *frames, buffer = (buffer + data).split(FRAME_TERMINATOR)
+                if len(buffer) > MAX_FRAME_SIZE:
+                    LOGGER.warning("Dropping unterminated data: %s", buffer)
+                    buffer = b""
+                for frame in frames:
+                    if frame:
+                        self.stats.frames_received += 1
+                        if self._allow(source):
+                            await self._handle_frame(frame, respond)
+        finally:
+            self._connections -= 1
+            writer.close()
+            await writer.wait_closed()
+
+    def _allow(self, source: str) -> bool:
+        """Take a token of the source's bucket, return False if it's empty."""
+        if not (rate := self.rate_limit):
+            return True
+        now = time.monotonic()
+        burst = rate * RATE_LIMIT_BURST
+        tokens, refilled = self._buckets.pop(source, (burst, now))
+        tokens = min(burst, tokens + (now - refilled) * rate)
+        if allowed := tokens >= 1:
+            tokens -= 1
+        else:
+            # Not acknowledged, so the panel sends it again later.
+            self.stats.frames_rate_limited += 1
+        self._buckets[source] = (tokens, now)
+        if len(self._buckets) > RATE_LIMIT_SOURCES:
+            self._buckets.popitem(last=False)
+        return allowed
+
+    async def _handle_frame(
+        self, frame: bytes, respond: Callable[[bytes], Awaitable[None]]
+    ) -> None:
+        """Respond to a frame and pass its event on."""
+        started = time.perf_counter()
+        key = frame.strip()
+        if (ack := self._acked.get(key)) is not None:
+            self._acked.move_to_end(key)
+            self.stats.frames_duplicate += 1
+            await respond(ack)
+            return
+        if (event := parse_frame(frame)) is not None:
+            LOGGER.debug("Fast path event: %s", event)
+            if not self._route(event):
+                self.stats.frames_refused += 1
+                return  # not acknowledged, so the panel sends it again
+            ack = create_ack(event)
+            await respond(ack)
+            self._record_ack_latency(event.account, started)
+            if event.event_type is not None:  # keep-alives reach the handler
+                self._remember(key, ack)
+            return
+        if not (sia_event := self.parse_and_check_event(frame)):
+            return
+        valid = sia_event.response == ResponseType.ACK
+        if valid and isinstance(sia_event, SIAEvent):
+            self.counts.increment_valid_events()
+            if not self._route(sia_event):
+                self.stats.frames_refused += 1
+                return  # not acknowledged, so the panel sends it again
+        ack = sia_event.create_response()
+        await respond(ack)
+        if sia_event.account:
+            self._record_ack_latency(sia_event.account, started)
+        if valid and sia_event.code is not None:
+            self._remember(key, ack)
+
+    def _record_ack_latency(self, account: str, started: float) -> None:
+        """Record the time an account's frame waited for its ACK to be sent."""
+        latencies = self.ack_latency
+        latencies.pop(account, None)
+        latencies[account] = time.perf_counter() - started
+        if len(latencies) > ACK_LATENCY_ACCOUNTS:
+            del latencies[next(iter(latencies))]
+
+    def _remember(self, frame: bytes, ack: bytes) -> None:
+        """Cache the ACK of an event frame, evicting the least recently seen."""
+        self._acked[frame] = ack
+        if len(self._acked) > DEDUP_CACHE_SIZE:
+            self._acked.popitem(last=False)
+
+
+def _bind_udp(port: int) -> socket.socket:
+    """Return a UDP socket bound to a port of all the interfaces, IPv6 included."""
+    family = socket.AF_INET6 if socket.has_dualstack_ipv6() else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_DGRAM)
+    try:
+        if family == socket.AF_INET6:
+            sock.setsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY, 0)
+        sock.bind(("", port))  # like the TCP server's host
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+class PimaForceSIAServerUDP(PimaForceSIAServer, asyncio.DatagramProtocol):
+    """SIA UDP server, every datagram carries whole frames."""
+
+    def __init__(
+        self,
+        port: int,
+        route: Callable[[SIAEvent | AdmCidEvent], bool],
+        *,
+        rate_limit: float = DEFAULT_RATE_LIMIT,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    ) -> None:
+        """Initialize the server (connections aren't capped over UDP)."""
+        super().__init__(
+            port, route, rate_limit=rate_limit, max_connections=max_connections
+        )
+        self._transport: asyncio.DatagramTransport | None = None
+
+    async def async_start(self) -> None:
+        """Start listening."""
+        self._transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+            lambda: self, sock=_bind_udp(self.port)
+        )
+
+    async def async_stop(self) -> None:
+        """Stop listening."""
+        if self._transport is None:
+            return
+        self.shutdown_flag = True
+        self._transport.close()
+        self._transport = None
+
+    def datagram_received(self, data: bytes, addr: tuple[str | Any, int]) -> None:
+        """Handle the frames of a datagram, the ACKs are sent back to its source."""
+        if (transport := self._transport) is None:
+            return
+
+        async def respond(ack: bytes) -> None:
+            transport.sendto(ack, addr)
+
+        for frame in data.split(FRAME_TERMINATOR):
+            if frame:
+                self.stats.frames_received += 1
+                if not self._allow(addr[0]):
+                    continue
+                # Sending a datagram doesn't wait, so the frame is handled
+                # without suspending the task.
+                create_eager_task(self._handle_frame(frame, respond))
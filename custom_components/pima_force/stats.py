@@ -0,0 +1,101 @@
+"""Performance counters for pima_force integration."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any, Final
+
+HISTOGRAM_BOUNDS_MS: Final = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 1000)
+
+
+class Histogram:
+    """Latency histogram with fixed buckets."""
+
+    __slots__ = ("_counts",)
+
+    def __init__(self) -> None:
+        """Initialize the buckets."""
+        self._counts = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+
+    def record(self, seconds: float) -> None:
+        """Count a latency."""
+        self._counts[bisect_left(HISTOGRAM_BOUNDS_MS, seconds * 1000)] += 1
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counts keyed by the upper bound of the bucket."""
+        return {
+            **{
+                f"<={bound}ms": count
+                for bound, count in zip(HISTOGRAM_BOUNDS_MS, self._counts, strict=False)
+            },
+            f">{HISTOGRAM_BOUNDS_MS[-1]}ms": self._counts[-1],
+        }
+
+
+class ServerStats:
+    """Counters of a SIA server (shared by the config entries on its port)."""
+
+    __slots__ = (
+        "connections_accepted",
+        "connections_dropped",
+        "connections_refused",
+        "frames_duplicate",
+        "frames_rate_limited",
+        "frames_received",
+        "frames_refused",
+        "frames_unrouted",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.connections_accepted = 0
+        self.connections_dropped = 0  # reset by the peer
+        self.connections_refused = 0  # over the concurrent connections cap
+        self.frames_received = 0
+        self.frames_duplicate = 0  # retransmissions of acknowledged frames
+        self.frames_unrouted = 0  # no config entry for the account
+        self.frames_refused = 0  # not acknowledged since the entry's queue is full
+        self.frames_rate_limited = 0  # dropped unparsed, over the source's rate
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters."""
+        return {key: getattr(self, key) for key in self.__slots__}
+
+
+class CoordinatorStats:
+    """Counters of the events routed to a config entry."""
+
+    __slots__ = (
+        "events_dropped",
+        "events_refused",
+        "frames_ignored",
+        "frames_received",
+        "keep_alives",
+        "listener_to_state_write",
+        "parse_to_listener",
+        "queue_depth",
+        "queue_high_water",
+        "zone_changes",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.frames_received = 0
+        self.frames_ignored: dict[str, int] = {}  # event code -> count
+        self.keep_alives = 0
+        self.zone_changes = 0
+        self.queue_depth = 0  # events waiting in the ingest queue
+        self.queue_high_water = 0
+        self.events_dropped = 0  # superseded (or already ACKed) with a full queue
+        self.events_refused = 0  # not queued since the ingest queue was full
+        self.parse_to_listener = Histogram()
+        self.listener_to_state_write = Histogram()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters."""
+        return {
+            **{key: getattr(self, key) for key in self.__slots__},
+            "frames_ignored": dict(self.frames_ignored),
+            "parse_to_listener": self.parse_to_listener.as_dict(),
+            "listener_to_state_write": self.listener_to_state_write.as_dict(),
+        }
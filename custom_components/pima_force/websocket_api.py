@@ -0,0 +1,76 @@
+"""Websocket API of pima_force integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import homeassistant.helpers.config_validation as cv
+import voluptuous as vol
+from homeassistant.components import websocket_api
+from homeassistant.components.websocket_api.const import ERR_NOT_FOUND
+from homeassistant.components.websocket_api.decorators import (
+    require_admin,
+    websocket_command,
+)
+from homeassistant.components.websocket_api.messages import event_message
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID
+from homeassistant.core import callback
+
+from .const import ATTR_CODE, ATTR_EVENT_TYPES, ATTR_ZONE, CONF_ZONES, DOMAIN
+from .coordinator import async_subscribe_events
+
+if TYPE_CHECKING:
+    from homeassistant.components.websocket_api.connection import ActiveConnection
+    from homeassistant.core import HomeAssistant
+
+
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe_events)
+
+
+@websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe_events",
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional(CONF_ZONES): vol.All(cv.ensure_list, [cv.positive_int]),
+        vol.Optional(ATTR_EVENT_TYPES): vol.All(cv.ensure_list, [cv.string]),
+    }
+)
+@require_admin
+@callback
+def websocket_subscribe_events(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Subscribe to the zone transitions of config entries, filtered by zone."""
+    msg_id = msg["id"]
+    entry_ids: list[str] | None = msg.get(ATTR_CONFIG_ENTRY_ID)
+    for entry_id in entry_ids or ():
+        if (
+            config_entry := hass.config_entries.async_get_entry(entry_id)
+        ) is None or config_entry.domain != DOMAIN:
+            connection.send_error(
+                msg_id,
+                ERR_NOT_FOUND,
+                f"Config entry {entry_id} not found",
+            )
+            return
+    zones = frozenset(msg.get(CONF_ZONES, ()))
+    event_types = frozenset(msg.get(ATTR_EVENT_TYPES, ()))
+
+    @callback
+    def async_forward(message: dict[str, Any]) -> None:
+        """Send an event which passes the filters."""
+        if (zones and message[ATTR_ZONE] not in zones) or (
+            event_types and message[ATTR_CODE] not in event_types
+        ):
+            return
+        connection.send_message(event_message(msg_id, message))
+
+    connection.subscriptions[msg_id] = async_subscribe_events(
+        hass, async_forward, entry_ids
+    )
+    connection.send_result(msg_id)
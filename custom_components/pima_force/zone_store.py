@@ -0,0 +1,164 @@
+"""Compact zone state store for pima_force integration."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from collections.abc import Iterator, MutableMapping
+from datetime import datetime
+from typing import Any, Final
+
+from homeassistant.util import dt as dt_util
+
+from .const import ATTR_LAST_CLOSE, ATTR_LAST_OPEN, ATTR_LAST_SET
+
+TIMESTAMPS: Final = (ATTR_LAST_OPEN, ATTR_LAST_CLOSE, ATTR_LAST_SET)
+_UNSET: Final = math.nan
+
+
+def _bits(value: int) -> Iterator[int]:
+    """Yield the indexes of the set bits of a bitset, lowest first."""
+    while value:
+        lowest = value & -value
+        yield lowest.bit_length() - 1
+        value ^= lowest
+
+
+class ZoneStore(MutableMapping[int, bool]):
+    """Open state of zones as bitsets, and their timestamps as arrays of epochs."""
+
+    __slots__ = (
+        "_known",
+        "_open",
+        "_partitions",
+        "_timestamps",
+        "_zone_partition",
+    )
+
+    def __init__(self) -> None:
+        """Initialize an empty store."""
+        self._known = 0  # bit per zone with a known state
+        self._open = 0  # bit per open zone
+        self._timestamps = {key: array("d") for key in TIMESTAMPS}
+        self._partitions: dict[int, int] = {}  # bit per zone of a partition
+        self._zone_partition: dict[int, int] = {}
+
+    def __getitem__(self, zone: int) -> bool:
+        """Return whether a zone is open."""
+        if not self._known >> zone & 1:
+            raise KeyError(zone)
+        return bool(self._open >> zone & 1)
+
+    def get(self, zone: int, default: bool | None = None) -> bool | None:  # type: ignore[override]  # noqa: FBT001
+        """Return whether a zone is open, or the default if it's unknown."""
+        if not self._known >> zone & 1:
+            return default
+        return bool(self._open >> zone & 1)
+
+    def __setitem__(self, zone: int, is_open: bool) -> None:
+        """Set the state of a zone."""
+        bit = 1 << zone
+        self._known |= bit
+        if is_open:
+            self._open |= bit
+        else:
+            self._open &= ~bit
+
+    def __delitem__(self, zone: int) -> None:
+        """Forget the state of a zone."""
+        if not self._known >> zone & 1:
+            raise KeyError(zone)
+        bit = ~(1 << zone)
+        self._known &= bit
+        self._open &= bit
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate the zones with a known state."""
+        return _bits(self._known)
+
+    def __len__(self) -> int:
+        """Return the number of zones with a known state."""
+        return self._known.bit_count()
+
+    def open_count(self, mask: int = -1) -> int:
+        """Return the number of open zones (of a bitmask of zones)."""
+        return (self._open & mask).bit_count()
+
+    def partition(self, zone: int) -> int | None:
+        """Return the partition of a zone, if it was reported."""
+        return self._zone_partition.get(zone)
+
+    def partitions(self) -> list[int]:
+        """Return the partitions with a zone."""
+        return sorted(self._partitions)
+
+    def partition_open_count(self, partition: int, mask: int = -1) -> int:
+        """Return the number of open zones of a partition (of a bitmask of zones)."""
+        return self.open_count(self._partitions.get(partition, 0) & mask)
+
+    def set_partition(self, zone: int, partition: int) -> bool:
+        """Set the partition of a zone, return whether it changed."""
+        if (previous := self._zone_partition.get(zone)) == partition:
+            return False
+        bit = 1 << zone
+        if previous is not None:
+            self._partitions[previous] &= ~bit
+        self._zone_partition[zone] = partition
+        self._partitions[partition] = self._partitions.get(partition, 0) | bit
+        return True
+
+    def timestamp(self, key: str, zone: int) -> float | None:
+        """Return a timestamp of a zone (POSIX time)."""
+        values = self._timestamps[key]
+        if zone >= len(values) or math.isnan(value := values[zone]):
+            return None
+        return value
+
+    def set_timestamp(self, key: str, zone: int, value: float | None) -> None:
+        """Set a timestamp of a zone (POSIX time)."""
+        values = self._timestamps[key]
+        if zone >= len(values):
+            values.extend([_UNSET] * (zone + 1 - len(values)))
+        values[zone] = _UNSET if value is None else value
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the store in a compact JSON serializable form."""
+        return {
+            "known": f"{self._known:x}",
+            "open": f"{self._open:x}",
+            "partitions": {
+                str(partition): f"{zones:x}"
+                for partition, zones in self._partitions.items()
+            },
+            **{
+                key: [None if math.isnan(value) else value for value in values]
+                for key, values in self._timestamps.items()
+            },
+        }
+
+    def restore(self, data: dict[str, Any]) -> None:
+        """Replace the content of the store with the form returned by as_dict."""
+        self._known = int(data["known"], 16)
+        self._open = int(data["open"], 16)
+        self._partitions = {
+            int(partition): int(zones, 16)
+            for partition, zones in data.get("partitions", {}).items()
+        }
+        self._zone_partition = {
+            zone: partition
+            for partition, zones in self._partitions.items()
+            for zone in _bits(zones)
+        }
+        for key, values in self._timestamps.items():
+            values[:] = array(
+                "d", [_UNSET if value is None else value for value in data[key]]
+            )
+
+    def isoformat(self, key: str, zone: int) -> str | None:
+        """Render a timestamp of a zone in local time."""
+        if (value := self.timestamp(key, zone)) is None:
+            return None
+        # A single datetime is created, in the default (local) time zone.
+        return datetime.fromtimestamp(
+            value, dt_util.get_default_time_zone()
+        ).isoformat()
@@ -15,15 +15,71 @@
 #
 # See here for more info: https://docs.pytest.org/en/latest/fixture.html (note that
 # pytest includes fixtures OOB which you can use as defined on this page)
+from __future__ import annotations
+
 import logging
 from itertools import chain
 from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from homeassistant.const import CONF_NAME, CONF_PORT
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.pima_force.const import (
+    CONF_ZONES,
+    DEFAULT_LISTENING_PORT,
+    DOMAIN,
+)
+from custom_components.pima_force.stats import ServerStats
 
 if TYPE_CHECKING:
     from collections.abc import Generator
+    from pathlib import Path
+
+    from homeassistant.core import HomeAssistant
+
+    from .helpers import SetupEntry
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the benchmark options."""
+    group = parser.getgroup("benchmark")
+    group.addoption(
+        "--benchmark",
+        action="store_true",
+        help="Run the benchmarks (skipped by default)",
+    )
+    group.addoption(
+        "--benchmark-min-throughput",
+        type=float,
+        default=200,
+        help="Minimum throughput of a scenario, in events per second",
+    )
+    group.addoption(
+        "--benchmark-max-ack-p99",
+        type=float,
+        default=1000,
+        help="Maximum p99 ACK latency of a scenario, in milliseconds",
+    )
+    group.addoption(
+        "--benchmark-max-state-p99",
+        type=float,
+        default=2000,
+        help="Maximum p99 state latency of a scenario, in milliseconds",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip the benchmarks unless they're requested."""
+    if config.getoption("--benchmark"):
+        return
+    skip = pytest.mark.skip(reason="Benchmarks run with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
 
 
 # This fixture enables loading custom integrations in all tests.
@@ -34,15 +90,46 @@ def _auto_enable_custom_integrations(enable_custom_integrations: bool) -> None:
     return
 
 
+@pytest.fixture(autouse=True)
+def auto_journal_dir(tmp_path: Path) -> Generator[None]:
+    """Write the journals to a temporary directory."""
+    with patch("custom_components.pima_force.journal.STORAGE_DIR", str(tmp_path)):
+        yield
+
+
+@pytest.fixture
+def setup_entry(hass: HomeAssistant) -> SetupEntry:
+    """Return a function setting up a config entry with the given zone names."""
+
+    async def _setup_entry(zones: list[str] | None = None) -> MockConfigEntry:
+        options: dict[str, Any] = {CONF_PORT: DEFAULT_LISTENING_PORT}
+        if zones is not None:
+            options[CONF_ZONES] = [{CONF_NAME: name} for name in zones]
+        config_entry = MockConfigEntry(domain=DOMAIN, options=options)
+        config_entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+        return config_entry
+
+    return _setup_entry
+
+
 @pytest.fixture(autouse=True)
 def auto_mock_sia_client_tcp() -> Generator[MagicMock]:
-    """Mock SIAClientTCP to avoid opening sockets in tests."""
+    """Mock the SIA server to avoid opening sockets in tests."""
     mock_client = MagicMock()
     mock_client.async_start = AsyncMock()
     mock_client.async_stop = AsyncMock()
-    with patch(
-        "custom_components.pima_force.coordinator.SIAClient",
-        return_value=mock_client,
+    mock_client.stats = ServerStats()
+    with (
+        patch(
+            "custom_components.pima_force.listener.PimaForceSIAServer",
+            return_value=mock_client,
+        ),
+        patch(
+            "custom_components.pima_force.listener.PimaForceSIAServerUDP",
+            return_value=mock_client,
+        ),
     ):
         yield mock_client
 
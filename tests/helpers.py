@@ -0,0 +1,33 @@
+"""Helpers shared by the tests."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from custom_components.pima_force.adm_cid import AdmCidEvent, crc
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+type SetupEntry = Callable[..., Awaitable[MockConfigEntry]]
+
+
+def sia_frame(message: str) -> bytes:
+    """Frame a SIA message with its CRC and length, as sent by a panel."""
+    return b"\n%04X%04X%s\r" % (crc(message.encode()), len(message), message.encode())
+
+
+def adm_cid_event(
+    sequence: int,
+    event_type: str,
+    event_qualifier: str,
+    ri: str,
+    *,
+    partition: str = "01",
+) -> AdmCidEvent:
+    """Build an ADM-CID event of the default account."""
+    return AdmCidEvent(
+        "", f"{sequence:04}", "R1", "L0", event_qualifier, event_type, partition, ri
+    )
@@ -0,0 +1,63 @@
+"""Tests for the fast-path frame decoder."""
+
+from __future__ import annotations
+
+import pytest
+from pysiaalarm.event import SIAEvent
+
+from custom_components.pima_force.adm_cid import (
+    AdmCidEvent,
+    crc,
+    create_ack,
+    parse_frame,
+)
+
+from .helpers import sia_frame
+
+
+def test_crc_matches_pysiaalarm() -> None:
+    """Test the table-driven CRC matches pysiaalarm's implementation."""
+    message = '"ADM-CID"0141R1L0#AAAAAA[#AAAAAA|1760 01 032]_17:04:37,02-12-2026'
+    assert f"{crc(message.encode()):04X}" == SIAEvent._crc_calc(message)  # noqa: SLF001
+
+
+def test_parse_zone_frame() -> None:
+    """Test zone status frames are decoded and acknowledged."""
+    event = parse_frame(
+        b'\n9A940041"ADM-CID"0141R1L0#AAAAAA[#AAAAAA|1760 01 032]_17:04:37,02-12-2026\r'
+    )
+    assert event == AdmCidEvent(
+        account="AAAAAA",
+        sequence="0141",
+        receiver="R1",
+        line="L0",
+        event_qualifier="1",
+        event_type="760",
+        partition="01",
+        ri="032",
+    )
+    assert create_ack(event) == b'\n53C40018"ACK"0141R1L0#AAAAAA[KC]\r'
+
+
+def test_parse_keep_alive_frame() -> None:
+    """Test keep-alive frames are decoded without an event."""
+    event = parse_frame(sia_frame('"NULL"0005L0#AAAAAA[]'))
+    assert event == AdmCidEvent("AAAAAA", "0005", "", "L0", None, None, None, None)
+    assert create_ack(event) == sia_frame('"ACK"0005L0#AAAAAA[KC]')
+
+
+@pytest.mark.parametrize(
+    "frame",
+    [
+        sia_frame('"ADM-CID"0001R1L0#AAAAAA[#AAAAAA|1401 01 001]'),
+        sia_frame('"ADM-CID"0001R1L0#AAAAAA[#AAAAAA|9760 01 001]'),
+        sia_frame('"SIA-DCS"0001R1L0#AAAAAA[#AAAAAA|Nri1/OP001]'),
+        sia_frame('"NULL"0001R1L0#AAAAAA[#AAAAAA|1760 01 001]'),
+        sia_frame('"*ADM-CID"0001R1L0#AAAAAA[0123456789ABCDEF]'),
+        b'\n00000030"ADM-CID"0001R1L0#AAAAAA[#AAAAAA|1760 01 001]\r',
+        b"",
+    ],
+)
+def test_parse_frame_falls_back(frame: bytes) -> None:
+    """Test frames outside of the fast path are not decoded."""
+    assert parse_frame(frame) is None
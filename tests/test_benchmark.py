@@ -0,0 +1,153 @@
+"""Benchmarks of the SIA server, coordinator and binary sensors over real TCP."""
+
+from __future__ import annotations
+
+import socket
+import time
+from functools import partial
+from typing import TYPE_CHECKING
+
+import pytest
+from homeassistant.const import CONF_NAME, CONF_PORT, STATE_ON
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.pima_force.const import (
+    CONF_ACCOUNT,
+    CONF_IO_THREAD,
+    CONF_PROTOCOL,
+    CONF_RATE_LIMIT,
+    CONF_ZONES,
+    DOMAIN,
+    PROTOCOL_TCP,
+    PROTOCOL_UDP,
+)
+
+from .traffic_generator import account_id, percentile, run, zone_events
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.fixture(autouse=True)
+def auto_mock_sia_client_tcp(socket_enabled: None) -> None:  # noqa: ARG001
+    """Use the real SIA server."""
+    return
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+def _entity_id(port: int, account: str, zone: int) -> str:
+    return f"binary_sensor.{DOMAIN}_{port}_{account.lower()}_zone{zone}"
+
+
+@pytest.mark.parametrize(
+    "scenario",
+    [
+        # shape, panels, zones, rounds, protocol, I/O thread
+        ("burst", 1, 32, 4, PROTOCOL_TCP, False),
+        ("burst", 4, 32, 2, PROTOCOL_TCP, False),
+        ("burst", 4, 32, 2, PROTOCOL_TCP, True),
+        ("burst", 4, 32, 2, PROTOCOL_UDP, False),
+        ("steady", 1, 8, 4, PROTOCOL_TCP, False),
+        ("steady", 1, 8, 4, PROTOCOL_UDP, False),
+        ("flap", 1, 4, 8, PROTOCOL_TCP, False),
+    ],
+    ids=str,
+)
+async def test_benchmark(
+    hass: HomeAssistant,
+    request: pytest.FixtureRequest,
+    capsys: pytest.CaptureFixture[str],
+    scenario: tuple[str, int, int, int, str, bool],
+) -> None:
+    """Measure the throughput and latencies of panels sending zone events."""
+    shape, panels, zones, rounds, protocol, io_thread = scenario
+    port = _free_port()
+    for panel in range(panels):
+        config_entry = MockConfigEntry(
+            domain=DOMAIN,
+            options={
+                CONF_PORT: port,
+                CONF_ACCOUNT: account_id(panel),
+                CONF_ZONES: [{CONF_NAME: f"Zone {zone + 1}"} for zone in range(zones)],
+                CONF_PROTOCOL: protocol,
+                CONF_IO_THREAD: io_thread,
+                CONF_RATE_LIMIT: 0,  # the generator sends from a single address
+            },
+        )
+        config_entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    # The state latency of a zone runs from its last event to the last update of
+    # its listeners, once its binary sensor has written its final state (which
+    # isn't a state change when the zone ends up in the state it started in).
+    last_sent: dict[str, float] = {}  # entity ID -> send time of the last event
+    last_written: dict[str, float] = {}  # entity ID -> time of the last update
+
+    def on_sent(account: str, zone: int, _: bool, sent_at: float) -> None:  # noqa: FBT001
+        last_sent[_entity_id(port, account, zone)] = sent_at
+
+    def on_written(entity_id: str) -> None:
+        last_written[entity_id] = time.perf_counter()
+
+    unsubscribers = [
+        config_entry.runtime_data.coordinator.async_add_listener(
+            partial(
+                on_written,
+                _entity_id(port, config_entry.options[CONF_ACCOUNT], zone),
+            ),
+            zone,
+        )
+        for config_entry in hass.config_entries.async_entries(DOMAIN)
+        for zone in range(1, zones + 1)
+    ]
+    report = await run(
+        "127.0.0.1",
+        port,
+        panels=panels,
+        zones=zones,
+        rounds=rounds,
+        shape=shape,
+        udp=protocol == PROTOCOL_UDP,
+        on_sent=on_sent,
+    )
+    await hass.async_block_till_done()
+    for unsubscribe in unsubscribers:
+        unsubscribe()
+    report.state_latencies = [
+        last_written[entity_id] - sent_at for entity_id, sent_at in last_sent.items()
+    ]
+
+    assert report.events == panels * zones * rounds
+    assert len(report.ack_latencies) == report.events
+    final_states = dict(zone_events(shape, zones, rounds))
+    for panel in range(panels):
+        for zone, is_open in final_states.items():
+            state = hass.states.get(_entity_id(port, account_id(panel), zone))
+            assert state is not None
+            assert (state.state == STATE_ON) == is_open
+
+    with capsys.disabled():
+        print(  # noqa: T201
+            f"\n{shape}: {panels} panel(s) x {zones} zone(s) x {rounds} round(s)"
+            f" over {protocol.upper()}{' (I/O thread)' if io_thread else ''}\n"
+            f"{report}"
+        )
+
+    assert report.throughput >= request.config.getoption("--benchmark-min-throughput")
+    assert percentile(report.ack_latencies, 99) * 1000 <= request.config.getoption(
+        "--benchmark-max-ack-p99"
+    )
+    assert percentile(report.state_latencies, 99) * 1000 <= request.config.getoption(
+        "--benchmark-max-state-p99"
+    )
+
+    for config_entry in hass.config_entries.async_entries(DOMAIN):
+        assert await hass.config_entries.async_unload(config_entry.entry_id)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock
 
@@ -19,7 +19,9 @@ from custom_components.pima_force.const import (
     ATTR_LAST_CLOSE,
     ATTR_LAST_OPEN,
     ATTR_LAST_SET,
+    ATTR_SUPPRESSED_TRANSITIONS,
     ATTR_ZONE,
+    CONF_ACCOUNT,
     CONF_ZONES,
     DEFAULT_LISTENING_PORT,
     DOMAIN,
@@ -32,16 +34,26 @@ if TYPE_CHECKING:
     from freezegun.api import FrozenDateTimeFactory
     from homeassistant.core import HomeAssistant
 
-NOW = "2024-01-01T00:00:00+00:00"
+NOW = datetime(2024, 1, 1, tzinfo=UTC).timestamp()
+
+
+def _local(timestamp: str) -> str:
+    """Return an ISO timestamp as rendered in local time."""
+    value = dt_util.parse_datetime(timestamp)
+    assert value is not None
+    return dt_util.as_local(value).isoformat()
 
 
 async def _setup_entities(
-    hass: HomeAssistant, entry_id: str, zones: list[dict[str, str]]
+    hass: HomeAssistant,
+    entry_id: str,
+    zones: list[dict[str, str]],
+    port: int = DEFAULT_LISTENING_PORT,
 ) -> list[er.RegistryEntry]:
     config_entry = MockConfigEntry(
         domain=DOMAIN,
         entry_id=entry_id,
-        options={CONF_PORT: DEFAULT_LISTENING_PORT, CONF_ZONES: zones},
+        options={CONF_PORT: port, CONF_ZONES: zones},
     )
     config_entry.add_to_hass(hass)
 
@@ -57,7 +69,11 @@ async def _setup_entities(
 
 
 def _sorted_entities(entries: list[er.RegistryEntry]) -> list[er.RegistryEntry]:
-    return sorted(entries, key=lambda entry: int(entry.unique_id.split("_")[-1]))
+    """Return the zone entities ordered by zone number."""
+    return sorted(
+        (entry for entry in entries if entry.unique_id.split("_")[-1].isdigit()),
+        key=lambda entry: int(entry.unique_id.split("_")[-1]),
+    )
 
 
 def _stored_state(entity_id: str, state: str) -> State:
@@ -99,6 +115,24 @@ async def test_async_setup_entry_adds_named_zones(hass: HomeAssistant) -> None:
     ]
 
 
+async def test_entity_id_includes_account(hass: HomeAssistant) -> None:
+    """Test the account ID is part of the entity ID when configured."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        options={CONF_PORT: DEFAULT_LISTENING_PORT, CONF_ACCOUNT: "AAAAAA"},
+    )
+    config_entry.runtime_data = PimaForceRuntimeData(
+        PimaForceDataUpdateCoordinator(hass, config_entry)
+    )
+
+    sensor = PimaForceZoneBinarySensor(config_entry, 1, "Front Door", NOW)
+
+    assert (
+        sensor.entity_id
+        == f"binary_sensor.{DOMAIN}_{DEFAULT_LISTENING_PORT}_aaaaaa_zone1"
+    )
+
+
 async def test_is_on_prefers_live_zone_state(
     hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -263,8 +297,6 @@ async def test_handle_update_sets_timestamps(
 
     tz = dt_util.get_time_zone("America/New_York")
     assert tz is not None
-    assert sensor.extra_state_attributes is not None
-    initial_last_close = sensor.extra_state_attributes[ATTR_LAST_CLOSE]
     old_tz = dt_util.DEFAULT_TIME_ZONE
     dt_util.set_default_time_zone(tz)
     try:
@@ -274,7 +306,7 @@ async def test_handle_update_sets_timestamps(
 
         assert sensor.extra_state_attributes == {
             ATTR_LAST_OPEN: "2024-01-01T00:00:00-05:00",
-            ATTR_LAST_CLOSE: initial_last_close,
+            ATTR_LAST_CLOSE: "2023-12-31T19:00:00-05:00",  # rendered when read
             ATTR_LAST_SET: "2024-01-01T00:00:00-05:00",
             ATTR_ZONE: 6,
         }
@@ -325,9 +357,9 @@ async def test_restores_timestamp_attributes(
     await sensor.async_added_to_hass()
 
     assert sensor.extra_state_attributes == {
-        ATTR_LAST_OPEN: "2024-01-01T01:00:00+00:00",
-        ATTR_LAST_CLOSE: "2023-12-31T23:00:00+00:00",
-        ATTR_LAST_SET: "2024-01-01T01:00:00+00:00",
+        ATTR_LAST_OPEN: _local("2024-01-01T01:00:00+00:00"),
+        ATTR_LAST_CLOSE: _local("2023-12-31T23:00:00+00:00"),
+        ATTR_LAST_SET: _local("2024-01-01T01:00:00+00:00"),
         ATTR_ZONE: 7,
     }
 
@@ -366,7 +398,8 @@ async def test_async_setup_entry_handles_zone_option_changes(
         await _setup_entities(
             hass,
             entry_id,
-            [
+            port=DEFAULT_LISTENING_PORT + 1,
+            zones=[
                 {CONF_NAME: "Front Door"},
                 {CONF_NAME: "Back Door"},
                 {CONF_NAME: "Garage"},
@@ -391,7 +424,8 @@ async def test_async_setup_entry_handles_zone_option_changes(
         await _setup_entities(
             hass,
             entry_id,
-            [
+            port=DEFAULT_LISTENING_PORT + 2,
+            zones=[
                 {CONF_NAME: "Front Door"},
                 {CONF_NAME: ""},
                 {CONF_NAME: "Garage"},
@@ -414,7 +448,8 @@ async def test_async_setup_entry_handles_zone_option_changes(
         await _setup_entities(
             hass,
             entry_id,
-            [
+            port=DEFAULT_LISTENING_PORT + 3,
+            zones=[
                 {CONF_NAME: "Front Entry"},
                 {CONF_NAME: ""},
                 {CONF_NAME: "Garage Bay"},
@@ -437,7 +472,8 @@ async def test_async_setup_entry_handles_zone_option_changes(
         await _setup_entities(
             hass,
             entry_id,
-            [
+            port=DEFAULT_LISTENING_PORT + 4,
+            zones=[
                 {CONF_NAME: "Patio Door"},
                 {CONF_NAME: ""},
                 {CONF_NAME: "Front Entry"},
@@ -456,6 +492,88 @@ async def test_async_setup_entry_handles_zone_option_changes(
     )
 
 
+async def test_zone_changes_do_not_reload_entry(
+    hass: HomeAssistant, auto_mock_sia_client_tcp: MagicMock
+) -> None:
+    """Test zone changes are applied to the entities without reloading."""
+    entry_id = "test_entry"
+    await _setup_entities(
+        hass,
+        entry_id,
+        [{CONF_NAME: "Front Door"}, {CONF_NAME: "Back Door"}],
+    )
+    config_entry = hass.config_entries.async_get_entry(entry_id)
+    assert config_entry is not None
+    coordinator = config_entry.runtime_data.coordinator
+    registry = er.async_get(hass)
+    registry.async_update_entity(
+        f"binary_sensor.{DOMAIN}_{DEFAULT_LISTENING_PORT}_zone1",
+        new_entity_id="binary_sensor.front",
+    )
+    await hass.async_block_till_done()
+    coordinator.zones[1] = True
+    coordinator.async_update_listeners()
+
+    hass.config_entries.async_update_entry(
+        config_entry,
+        options={
+            **config_entry.options,
+            CONF_ZONES: [
+                {CONF_NAME: "Main Door"},
+                {CONF_NAME: ""},
+                {CONF_NAME: "Hall"},
+            ],
+        },
+    )
+    await hass.async_block_till_done()
+
+    assert config_entry.runtime_data.coordinator is coordinator
+    auto_mock_sia_client_tcp.async_start.assert_awaited_once()
+    auto_mock_sia_client_tcp.async_stop.assert_not_awaited()
+    entities = _sorted_entities(
+        [
+            entry
+            for entry in registry.entities.values()
+            if entry.config_entry_id == entry_id
+        ]
+    )
+    assert [entry.entity_id for entry in entities] == [
+        "binary_sensor.front",
+        f"binary_sensor.{DOMAIN}_{DEFAULT_LISTENING_PORT}_zone3",
+    ]
+    assert [entry.original_name for entry in entities] == ["Main Door", "Hall"]
+    state = hass.states.get("binary_sensor.front")
+    assert state is not None
+    assert state.state == STATE_ON
+    assert state.name == "Pima Force Main Door"
+    assert (
+        hass.states.get(f"binary_sensor.{DOMAIN}_{DEFAULT_LISTENING_PORT}_zone2")
+        is None
+    )
+
+
+async def test_port_change_reloads_entry(
+    hass: HomeAssistant, auto_mock_sia_client_tcp: MagicMock
+) -> None:
+    """Test a port change restarts the listener."""
+    entry_id = "test_entry"
+    await _setup_entities(hass, entry_id, [{CONF_NAME: "Front Door"}])
+    config_entry = hass.config_entries.async_get_entry(entry_id)
+    assert config_entry is not None
+    coordinator = config_entry.runtime_data.coordinator
+
+    hass.config_entries.async_update_entry(
+        config_entry,
+        options={**config_entry.options, CONF_PORT: DEFAULT_LISTENING_PORT + 1},
+    )
+    await hass.async_block_till_done()
+
+    assert config_entry.runtime_data.coordinator is not coordinator
+    assert config_entry.runtime_data.coordinator.port == DEFAULT_LISTENING_PORT + 1
+    assert auto_mock_sia_client_tcp.async_start.await_count == 2
+    auto_mock_sia_client_tcp.async_stop.assert_awaited_once()
+
+
 async def test_entity_services_update_zone_state(hass: HomeAssistant) -> None:
     """Test entity services update zone states."""
     config_entry = MockConfigEntry(
@@ -495,3 +613,64 @@ async def test_entity_services_update_zone_state(hass: HomeAssistant) -> None:
     state = hass.states.get(entity_id)
     assert state is not None
     assert state.state == STATE_OFF
+
+
+async def test_suppressed_transitions_attribute(
+    hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the suppressed transitions count is exposed once it's set."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        options={CONF_PORT: DEFAULT_LISTENING_PORT},
+    )
+    coordinator = PimaForceDataUpdateCoordinator(hass, config_entry)
+    config_entry.runtime_data = PimaForceRuntimeData(coordinator)
+
+    sensor = PimaForceZoneBinarySensor(config_entry, 8, "Window", NOW)
+    sensor.hass = hass
+    monkeypatch.setattr(sensor, "async_get_last_state", AsyncMock(return_value=None))
+    write_state = MagicMock()
+    monkeypatch.setattr(sensor, "async_write_ha_state", write_state)
+    await sensor.async_added_to_hass()
+
+    coordinator.zones[8] = False
+    coordinator.async_update_listeners()
+    write_state.assert_not_called()
+    assert sensor.extra_state_attributes is not None
+    assert ATTR_SUPPRESSED_TRANSITIONS not in sensor.extra_state_attributes
+
+    # The state is unchanged, but the count is.
+    coordinator.suppressed_transitions[8] = 2
+    coordinator.async_update_listeners()
+    write_state.assert_called_once()
+    assert sensor.extra_state_attributes[ATTR_SUPPRESSED_TRANSITIONS] == 2
+
+    coordinator.async_update_listeners()
+    write_state.assert_called_once()
+
+
+async def test_starts_from_saved_zones(
+    hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the saved zone store is used instead of the restore state."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        options={CONF_PORT: DEFAULT_LISTENING_PORT},
+    )
+    coordinator = PimaForceDataUpdateCoordinator(hass, config_entry)
+    config_entry.runtime_data = PimaForceRuntimeData(coordinator)
+    coordinator.zones[9] = True
+    coordinator.zones.set_timestamp(ATTR_LAST_SET, 9, NOW - 60)
+    coordinator.zones.set_timestamp(ATTR_LAST_OPEN, 9, NOW - 60)
+    coordinator.zones.set_timestamp(ATTR_LAST_CLOSE, 9, NOW - 120)
+    coordinator.zones_restored = True
+
+    sensor = PimaForceZoneBinarySensor(config_entry, 9, "Hall", NOW)
+    get_last_state = AsyncMock()
+    monkeypatch.setattr(sensor, "async_get_last_state", get_last_state)
+    await sensor.async_added_to_hass()
+
+    get_last_state.assert_not_called()
+    assert sensor.is_on is True
+    assert coordinator.zones.timestamp(ATTR_LAST_SET, 9) == NOW - 60
+    assert coordinator.zones.timestamp(ATTR_LAST_CLOSE, 9) == NOW - 120
@@ -11,9 +11,22 @@ from custom_components.pima_force.config_flow import (
     PimaForceConfigFlow,
 )
 from custom_components.pima_force.const import (
+    CONF_ACCOUNT,
+    CONF_COALESCE_WINDOW,
+    CONF_IO_THREAD,
+    CONF_MAX_CONNECTIONS,
+    CONF_OVERFLOW_POLICY,
+    CONF_PROTOCOL,
+    CONF_RATE_LIMIT,
     CONF_ZONES,
     DEFAULT_LISTENING_PORT,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_RATE_LIMIT,
     DOMAIN,
+    OVERFLOW_POLICY_KEEP_NEWEST,
+    OVERFLOW_POLICY_REFUSE,
+    PROTOCOL_TCP,
+    PROTOCOL_UDP,
     TITLE,
 )
 
@@ -88,5 +101,204 @@ async def test_options_flow_updates_port(hass: HomeAssistant) -> None:
         user_input={CONF_PORT: 6000},
     )
     assert result.get("type") == FlowResultType.CREATE_ENTRY
-    assert result.get("data") == {CONF_PORT: 6000, CONF_ZONES: zones}
+    assert result.get("data") == {
+        CONF_PORT: 6000,
+        CONF_ZONES: zones,
+        CONF_COALESCE_WINDOW: 0,
+        CONF_OVERFLOW_POLICY: OVERFLOW_POLICY_KEEP_NEWEST,
+        CONF_IO_THREAD: False,
+        CONF_PROTOCOL: PROTOCOL_TCP,
+        CONF_RATE_LIMIT: DEFAULT_RATE_LIMIT,
+        CONF_MAX_CONNECTIONS: DEFAULT_MAX_CONNECTIONS,
+    }
     assert config_entry.title == f"{TITLE} 6000"
+
+
+async def test_flow_user_account(hass: HomeAssistant) -> None:
+    """Test the account ID is validated, normalized and kept unique per port."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": "user"}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={CONF_PORT: DEFAULT_LISTENING_PORT, CONF_ACCOUNT: "xyz"},
+    )
+    assert result.get("type") == FlowResultType.FORM
+    assert result.get("errors") == {CONF_ACCOUNT: "invalid_account"}
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={CONF_PORT: DEFAULT_LISTENING_PORT, CONF_ACCOUNT: " aaaaaa "},
+    )
+    assert result.get("type") == FlowResultType.CREATE_ENTRY
+    assert result.get("title") == f"{TITLE} {DEFAULT_LISTENING_PORT} AAAAAA"
+    assert result.get("options") == {
+        CONF_PORT: DEFAULT_LISTENING_PORT,
+        CONF_ACCOUNT: "AAAAAA",
+    }
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": "user"}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={CONF_PORT: DEFAULT_LISTENING_PORT, CONF_ACCOUNT: "AAAAAA"},
+    )
+    assert result.get("type") == FlowResultType.FORM
+    assert result.get("errors") == {"base": "already_configured"}
+
+
+async def test_options_flow_account(hass: HomeAssistant) -> None:
+    """Test the options flow sets and clears the account ID."""
+    MockConfigEntry(
+        domain=DOMAIN, options={CONF_PORT: 5000, CONF_ACCOUNT: "BBBBBB"}
+    ).add_to_hass(hass)
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=f"{TITLE} 5000",
+        options={CONF_PORT: 5000, CONF_ZONES: []},
+    )
+    config_entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={CONF_PORT: 5000, CONF_ACCOUNT: "bbbbbb"},
+    )
+    assert result.get("type") == FlowResultType.FORM
+    assert result.get("errors") == {"base": "already_configured"}
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={CONF_PORT: 5000, CONF_ACCOUNT: "AAAAAA"},
+    )
+    assert result.get("type") == FlowResultType.CREATE_ENTRY
+    assert result.get("data") == {
+        CONF_PORT: 5000,
+        CONF_ACCOUNT: "AAAAAA",
+        CONF_ZONES: [],
+        CONF_COALESCE_WINDOW: 0,
+        CONF_OVERFLOW_POLICY: OVERFLOW_POLICY_KEEP_NEWEST,
+        CONF_IO_THREAD: False,
+        CONF_PROTOCOL: PROTOCOL_TCP,
+        CONF_RATE_LIMIT: DEFAULT_RATE_LIMIT,
+        CONF_MAX_CONNECTIONS: DEFAULT_MAX_CONNECTIONS,
+    }
+    assert config_entry.title == f"{TITLE} 5000 AAAAAA"
+
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={CONF_PORT: 5000},
+    )
+    assert result.get("type") == FlowResultType.CREATE_ENTRY
+    assert result.get("data") == {
+        CONF_PORT: 5000,
+        CONF_ZONES: [],
+        CONF_COALESCE_WINDOW: 0,
+        CONF_OVERFLOW_POLICY: OVERFLOW_POLICY_KEEP_NEWEST,
+        CONF_IO_THREAD: False,
+        CONF_PROTOCOL: PROTOCOL_TCP,
+        CONF_RATE_LIMIT: DEFAULT_RATE_LIMIT,
+        CONF_MAX_CONNECTIONS: DEFAULT_MAX_CONNECTIONS,
+    }
+    assert config_entry.title == f"{TITLE} 5000"
+
+
+async def test_options_flow_coalesce_window(hass: HomeAssistant) -> None:
+    """Test the options flow sets the coalescing window."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        options={CONF_PORT: 5000, CONF_ZONES: [], CONF_COALESCE_WINDOW: 2},
+    )
+    config_entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    assert _schema_default(result.get("data_schema"), CONF_COALESCE_WINDOW) == 2
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={CONF_PORT: 5000, CONF_COALESCE_WINDOW: 0.5},
+    )
+    assert result.get("type") == FlowResultType.CREATE_ENTRY
+    assert config_entry.options[CONF_COALESCE_WINDOW] == 0.5
+
+
+async def test_flow_user_protocol(hass: HomeAssistant) -> None:
+    """Test the user flow sets the protocol."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": "user"}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={CONF_PORT: DEFAULT_LISTENING_PORT, CONF_PROTOCOL: PROTOCOL_UDP},
+    )
+    assert result.get("type") == FlowResultType.CREATE_ENTRY
+    assert result.get("options") == {
+        CONF_PORT: DEFAULT_LISTENING_PORT,
+        CONF_PROTOCOL: PROTOCOL_UDP,
+    }
+    config_entry = result["result"]
+
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    assert _schema_default(result.get("data_schema"), CONF_PROTOCOL) == PROTOCOL_UDP
+
+
+async def test_options_flow_overflow_policy(hass: HomeAssistant) -> None:
+    """Test the options flow sets the queue overflow policy."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        options={CONF_PORT: 5000, CONF_OVERFLOW_POLICY: OVERFLOW_POLICY_REFUSE},
+    )
+    config_entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    assert (
+        _schema_default(result.get("data_schema"), CONF_OVERFLOW_POLICY)
+        == OVERFLOW_POLICY_REFUSE
+    )
+
+    # Events are always acknowledged in the I/O thread, so they can't be refused.
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_PORT: 5000,
+            CONF_OVERFLOW_POLICY: OVERFLOW_POLICY_REFUSE,
+            CONF_IO_THREAD: True,
+        },
+    )
+    assert result.get("type") == FlowResultType.FORM
+    assert result.get("errors") == {CONF_OVERFLOW_POLICY: "refuse_io_thread"}
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_PORT: 5000,
+            CONF_OVERFLOW_POLICY: OVERFLOW_POLICY_KEEP_NEWEST,
+            CONF_IO_THREAD: True,
+        },
+    )
+    assert result.get("type") == FlowResultType.CREATE_ENTRY
+    assert config_entry.options[CONF_OVERFLOW_POLICY] == OVERFLOW_POLICY_KEEP_NEWEST
+
+
+async def test_options_flow_limits(hass: HomeAssistant) -> None:
+    """Test the options flow sets the rate limit and the connections cap."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        options={CONF_PORT: 5000, CONF_RATE_LIMIT: 0, CONF_MAX_CONNECTIONS: 4},
+    )
+    config_entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    assert _schema_default(result.get("data_schema"), CONF_RATE_LIMIT) == 0
+    assert _schema_default(result.get("data_schema"), CONF_MAX_CONNECTIONS) == 4
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={CONF_PORT: 5000, CONF_RATE_LIMIT: 2.5, CONF_MAX_CONNECTIONS: 8.0},
+    )
+    assert result.get("type") == FlowResultType.CREATE_ENTRY
+    assert config_entry.options[CONF_RATE_LIMIT] == 2.5
+    assert config_entry.options[CONF_MAX_CONNECTIONS] == 8
+    assert isinstance(config_entry.options[CONF_MAX_CONNECTIONS], int)
@@ -1,22 +1,49 @@
 """Tests for the coordinator."""
 
-from typing import TYPE_CHECKING
+import asyncio
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
 from unittest.mock import MagicMock
 
+import pytest
 from homeassistant.const import CONF_PORT
+from homeassistant.util import dt as dt_util
 from pysiaalarm.event import SIAEvent
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
+from custom_components.pima_force import coordinator as coordinator_module
+from custom_components.pima_force.adm_cid import AdmCidEvent
 from custom_components.pima_force.const import (
     ADM_CID_EVENT_QUALIFIER_CLOSE,
     ADM_CID_EVENT_QUALIFIER_OPEN,
+    ADM_CID_EVENT_QUALIFIER_STATUS,
     ADM_CID_PIMA_ZONE_STATUS_CODE,
+    ARM_STATE_ARMED_AWAY,
+    ARM_STATE_ARMED_HOME,
+    ARM_STATE_DISARMED,
+    ATTR_LAST_SET,
+    CONF_COALESCE_WINDOW,
+    CONF_OVERFLOW_POLICY,
     DEFAULT_LISTENING_PORT,
     DOMAIN,
+    OVERFLOW_POLICY_REFUSE,
+)
+from custom_components.pima_force.coordinator import (
+    CONNECTION_TIMEOUT,
+    DATA_HEALTH_TIMER,
+    HEALTH_CHECK_INTERVAL,
+    SAVE_DELAY,
+    PimaForceDataUpdateCoordinator,
+    async_remove_store,
+    async_subscribe_events,
 )
-from custom_components.pima_force.coordinator import PimaForceDataUpdateCoordinator
 
 if TYPE_CHECKING:
+    from freezegun.api import FrozenDateTimeFactory
     from homeassistant.core import HomeAssistant
 
 
@@ -30,7 +57,7 @@ async def test_process_event_updates_zone(hass: HomeAssistant) -> None:
         ),
     )
     mock_update_listeners = MagicMock()
-    coordinator.async_update_listeners = mock_update_listeners
+    coordinator.async_update_zone_listeners = mock_update_listeners
 
     await coordinator.process_event(
         SIAEvent(
@@ -39,8 +66,9 @@ async def test_process_event_updates_zone(hass: HomeAssistant) -> None:
             ri="2",
         )
     )
+    await hass.async_block_till_done()
     assert coordinator.zones == {2: True}
-    mock_update_listeners.assert_called_once()
+    mock_update_listeners.assert_called_once_with(2)
 
     mock_update_listeners.reset_mock()
     await coordinator.process_event(
@@ -50,8 +78,57 @@ async def test_process_event_updates_zone(hass: HomeAssistant) -> None:
             ri="2",
         )
     )
+    await hass.async_block_till_done()
     assert coordinator.zones == {2: False}
-    mock_update_listeners.assert_called_once()
+    mock_update_listeners.assert_called_once_with(2)
+
+
+async def test_zone_listeners_dispatch(hass: HomeAssistant) -> None:
+    """Test zone events reach only their zone listeners and broadcast listeners."""
+    coordinator = PimaForceDataUpdateCoordinator(
+        hass,
+        MockConfigEntry(
+            domain=DOMAIN,
+            options={CONF_PORT: DEFAULT_LISTENING_PORT},
+        ),
+    )
+    zone1 = MagicMock()
+    zone2 = MagicMock()
+    everything = MagicMock()
+    remove_zone1 = coordinator.async_add_listener(zone1, 1)
+    remove_zone2 = coordinator.async_add_listener(zone2, 2)
+    remove_everything = coordinator.async_add_listener(everything)
+
+    await coordinator.process_event(
+        SIAEvent(
+            event_type=ADM_CID_PIMA_ZONE_STATUS_CODE,
+            event_qualifier=ADM_CID_EVENT_QUALIFIER_OPEN,
+            ri="1",
+        )
+    )
+    await hass.async_block_till_done()
+    zone1.assert_called_once()
+    zone2.assert_not_called()
+    everything.assert_called_once()
+
+    zone1.reset_mock()
+    everything.reset_mock()
+    coordinator.async_update_listeners()
+    zone1.assert_called_once()
+    zone2.assert_called_once()
+    everything.assert_called_once()
+
+    remove_zone1()
+    remove_zone2()
+    remove_everything()
+    zone1.reset_mock()
+    zone2.reset_mock()
+    everything.reset_mock()
+    coordinator.async_update_listeners()
+    coordinator.async_update_zone_listeners(1)
+    zone1.assert_not_called()
+    zone2.assert_not_called()
+    everything.assert_not_called()
 
 
 async def test_process_event_ignores_non_zone_event(hass: HomeAssistant) -> None:
@@ -63,7 +140,7 @@ async def test_process_event_ignores_non_zone_event(hass: HomeAssistant) -> None
             options={CONF_PORT: DEFAULT_LISTENING_PORT},
         ),
     )
-    coordinator.async_update_listeners = MagicMock()
+    coordinator.async_update_zone_listeners = MagicMock()
 
     await coordinator.process_event(
         SIAEvent(
@@ -79,16 +156,89 @@ async def test_process_event_ignores_non_zone_event(hass: HomeAssistant) -> None
             ri="2",
         )
     )
-    await coordinator.process_event(
-        SIAEvent(
-            event_type=ADM_CID_PIMA_ZONE_STATUS_CODE,
-            event_qualifier=ADM_CID_EVENT_QUALIFIER_OPEN,
-            ri=None,
+    for ri in (None, "²", "1000", "70000"):
+        await coordinator.process_event(
+            SIAEvent(
+                event_type=ADM_CID_PIMA_ZONE_STATUS_CODE,
+                event_qualifier=ADM_CID_EVENT_QUALIFIER_OPEN,
+                ri=ri,
+            )
         )
+
+    assert coordinator.zones == {}
+    coordinator.async_update_zone_listeners.assert_not_called()
+
+
+async def test_process_event_dispatches_codes(hass: HomeAssistant) -> None:
+    """Test alarm, trouble, bypass and arming events update the panel state."""
+    coordinator = PimaForceDataUpdateCoordinator(
+        hass,
+        MockConfigEntry(
+            domain=DOMAIN,
+            options={CONF_PORT: DEFAULT_LISTENING_PORT},
+        ),
+    )
+    everything = MagicMock()
+    coordinator.async_add_listener(everything)
+
+    async def process(*events: tuple[str, str, str | None, str | None]) -> None:
+        for event_type, event_qualifier, partition, ri in events:
+            await coordinator.process_event(
+                SIAEvent(
+                    event_type=event_type,
+                    event_qualifier=event_qualifier,
+                    partition=partition,
+                    ri=ri,
+                )
+            )
+        await hass.async_block_till_done()
+
+    await process(
+        ("130", ADM_CID_EVENT_QUALIFIER_OPEN, "01", "005"),
+        ("110", ADM_CID_EVENT_QUALIFIER_STATUS, "01", "007"),
+        ("301", ADM_CID_EVENT_QUALIFIER_OPEN, "00", "000"),
+        ("573", ADM_CID_EVENT_QUALIFIER_OPEN, "01", "004"),
+        ("573", ADM_CID_EVENT_QUALIFIER_OPEN, "01", "006"),
+        ("401", ADM_CID_EVENT_QUALIFIER_CLOSE, "01", "003"),
+        ("441", ADM_CID_EVENT_QUALIFIER_CLOSE, "02", "003"),
+        ("441", ADM_CID_EVENT_QUALIFIER_CLOSE, None, "003"),
+    )
+    assert coordinator.alarms == {("130", 5), ("110", 7)}
+    assert coordinator.troubles == {("301", 0)}
+    assert coordinator.bypassed == {4, 6}
+    assert coordinator.arm_states == {
+        1: ARM_STATE_ARMED_HOME,
+        2: ARM_STATE_ARMED_HOME,
+    }
+    everything.assert_called_once()
+
+    # Repeated events don't update the listeners.
+    everything.reset_mock()
+    await process(
+        ("130", ADM_CID_EVENT_QUALIFIER_STATUS, "01", "005"),
+        ("573", ADM_CID_EVENT_QUALIFIER_OPEN, "01", "004"),
+        ("441", ADM_CID_EVENT_QUALIFIER_CLOSE, "02", "003"),
+        ("301", ADM_CID_EVENT_QUALIFIER_CLOSE, "00", "001"),
     )
+    everything.assert_not_called()
 
+    await process(
+        ("130", ADM_CID_EVENT_QUALIFIER_CLOSE, "01", "005"),
+        ("301", ADM_CID_EVENT_QUALIFIER_CLOSE, "00", "000"),
+        ("573", ADM_CID_EVENT_QUALIFIER_CLOSE, "01", "004"),
+        ("401", ADM_CID_EVENT_QUALIFIER_OPEN, "01", "003"),
+        ("400", ADM_CID_EVENT_QUALIFIER_CLOSE, "02", "003"),
+    )
+    assert coordinator.alarms == {("110", 7)}
+    assert coordinator.troubles == set()
+    assert coordinator.bypassed == {6}
+    assert coordinator.arm_states == {
+        1: ARM_STATE_DISARMED,
+        2: ARM_STATE_ARMED_AWAY,
+    }
+    everything.assert_called_once()
     assert coordinator.zones == {}
-    coordinator.async_update_listeners.assert_not_called()
+    assert coordinator.stats.frames_ignored == {}
 
 
 async def test_coordinator_start_stop_calls_client(
@@ -107,3 +257,406 @@ async def test_coordinator_start_stop_calls_client(
 
     auto_mock_sia_client_tcp.async_start.assert_awaited_once()
     auto_mock_sia_client_tcp.async_stop.assert_awaited_once()
+
+
+async def test_coordinator_start_failure_closes_journal(
+    hass: HomeAssistant, auto_mock_sia_client_tcp: MagicMock
+) -> None:
+    """Test that the journal is closed when the SIA client fails to start."""
+    coordinator = PimaForceDataUpdateCoordinator(
+        hass,
+        MockConfigEntry(
+            domain=DOMAIN,
+            options={CONF_PORT: DEFAULT_LISTENING_PORT},
+        ),
+    )
+    auto_mock_sia_client_tcp.async_start.side_effect = OSError
+    with pytest.raises(OSError):  # noqa: PT011
+        await coordinator.async_start()
+
+    coordinator.journal.append(1, 1, True)
+    assert list(coordinator.journal.records()) == []
+
+
+async def test_coordinator_saves_zones(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the zone store is saved after updates and on stop, and loaded on start."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN, options={CONF_PORT: DEFAULT_LISTENING_PORT}
+    )
+    key = f"{DOMAIN}.{config_entry.entry_id}"
+    coordinator = PimaForceDataUpdateCoordinator(hass, config_entry)
+    await coordinator.async_start()
+    assert not coordinator.zones_restored
+
+    coordinator.zones[2] = True
+    coordinator.zones.set_timestamp(ATTR_LAST_SET, 2, 100)
+    coordinator.async_update_zone_listeners(2)
+    await hass.async_block_till_done()
+    assert key not in hass_storage
+
+    # Further updates don't postpone the save.
+    now = dt_util.utcnow()
+    async_fire_time_changed(hass, now + timedelta(seconds=SAVE_DELAY - 1))
+    coordinator.zones[4] = True
+    coordinator.async_update_zone_listeners(4)
+    async_fire_time_changed(hass, now + timedelta(seconds=SAVE_DELAY))
+    await hass.async_block_till_done()
+    assert hass_storage[key]["data"] == coordinator.zones.as_dict()
+
+    # The next update schedules a save again.
+    coordinator.zones[4] = False
+    coordinator.async_update_zone_listeners(4)
+    async_fire_time_changed(hass, now + timedelta(seconds=SAVE_DELAY * 2))
+    await hass.async_block_till_done()
+    assert hass_storage[key]["data"] == coordinator.zones.as_dict()
+
+    coordinator.zones[3] = False
+    await coordinator.async_stop()
+    assert hass_storage[key]["data"] == coordinator.zones.as_dict()
+
+    coordinator = PimaForceDataUpdateCoordinator(hass, config_entry)
+    await coordinator.async_start()
+    assert coordinator.zones_restored
+    assert coordinator.zones == {2: True, 3: False, 4: False}
+    assert coordinator.zones.timestamp(ATTR_LAST_SET, 2) == 100
+    await coordinator.async_stop()
+
+    await async_remove_store(hass, config_entry.entry_id)
+    assert key not in hass_storage
+
+
+def _zone_event(zone: int, *, is_open: bool) -> SIAEvent:
+    return SIAEvent(
+        event_type=ADM_CID_PIMA_ZONE_STATUS_CODE,
+        event_qualifier=ADM_CID_EVENT_QUALIFIER_OPEN
+        if is_open
+        else ADM_CID_EVENT_QUALIFIER_CLOSE,
+        ri=str(zone),
+    )
+
+
+async def test_coalescing_window(hass: HomeAssistant) -> None:
+    """Test transitions within the coalescing window are merged."""
+    coordinator = PimaForceDataUpdateCoordinator(
+        hass,
+        MockConfigEntry(
+            domain=DOMAIN,
+            options={CONF_PORT: DEFAULT_LISTENING_PORT, CONF_COALESCE_WINDOW: 1},
+        ),
+    )
+    listener = MagicMock()
+    coordinator.async_add_listener(listener, 1)
+
+    # The first transition is written immediately.
+    await coordinator.process_event(_zone_event(1, is_open=True))
+    await hass.async_block_till_done()
+    assert listener.call_count == 1
+
+    # Flapping back to the written state is suppressed altogether.
+    await coordinator.process_event(_zone_event(1, is_open=False))
+    assert coordinator.zones == {1: True}
+    assert coordinator.zones.open_count() == 1
+    await coordinator.process_event(_zone_event(1, is_open=True))
+    await coordinator.process_event(_zone_event(1, is_open=True))
+    await hass.async_block_till_done()
+    assert listener.call_count == 1
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert listener.call_count == 2
+    assert coordinator.zones == {1: True}
+    assert coordinator.suppressed_transitions == {1: 2}
+
+    # The window is extended while the zone flaps, only the final state is written.
+    await coordinator.process_event(_zone_event(1, is_open=False))
+    assert listener.call_count == 2
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert listener.call_count == 3
+    assert coordinator.zones == {1: False}
+    assert coordinator.suppressed_transitions == {1: 2}
+
+    # A quiet window closes without any update.
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=3))
+    assert listener.call_count == 3
+    await coordinator.process_event(_zone_event(1, is_open=True))
+    await hass.async_block_till_done()
+    assert listener.call_count == 4
+
+    # The last state within a window is kept when the coordinator is stopped.
+    await coordinator.process_event(_zone_event(1, is_open=False))
+    assert coordinator.zones == {1: True}
+    await coordinator.async_stop()
+    assert coordinator.zones == {1: False}
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=4))
+    await hass.async_block_till_done()
+    assert listener.call_count == 4
+
+
+async def test_coalescing_window_unchanged_report(hass: HomeAssistant) -> None:
+    """Test a report which doesn't change the zone doesn't open a window."""
+    coordinator = PimaForceDataUpdateCoordinator(
+        hass,
+        MockConfigEntry(
+            domain=DOMAIN,
+            options={CONF_PORT: DEFAULT_LISTENING_PORT, CONF_COALESCE_WINDOW: 30},
+        ),
+    )
+    coordinator.zones[1] = False
+    listener = MagicMock()
+    coordinator.async_add_listener(listener, 1)
+
+    await coordinator.process_event(_zone_event(1, is_open=False))
+    await hass.async_block_till_done()
+    assert listener.call_count == 1
+
+    await coordinator.process_event(_zone_event(1, is_open=True))
+    await hass.async_block_till_done()
+    assert listener.call_count == 2
+    assert coordinator.zones == {1: True}
+    await coordinator.async_stop()
+
+
+async def test_zone_updates_are_batched(hass: HomeAssistant) -> None:
+    """Test a burst of zone events is flushed as a single listener dispatch."""
+    coordinator = PimaForceDataUpdateCoordinator(
+        hass,
+        MockConfigEntry(
+            domain=DOMAIN,
+            options={CONF_PORT: DEFAULT_LISTENING_PORT},
+        ),
+    )
+    batch_times: list[str | None] = []
+    zone1 = MagicMock(side_effect=lambda: batch_times.append(coordinator.batch_time))
+    zone2 = MagicMock(side_effect=lambda: batch_times.append(coordinator.batch_time))
+    everything = MagicMock()
+    coordinator.async_add_listener(zone1, 1)
+    coordinator.async_add_listener(zone2, 2)
+    coordinator.async_add_listener(everything)
+
+    await coordinator.process_event(_zone_event(1, is_open=True))
+    await coordinator.process_event(_zone_event(2, is_open=True))
+    await coordinator.process_event(_zone_event(1, is_open=False))
+    everything.assert_not_called()
+
+    await hass.async_block_till_done()
+    zone1.assert_called_once()
+    zone2.assert_called_once()
+    everything.assert_called_once()
+    assert batch_times[0] is not None
+    assert batch_times[0] == batch_times[1]
+    assert coordinator.batch_time is None
+    assert coordinator.zones == {1: False, 2: True}
+
+    await coordinator.process_event(_zone_event(2, is_open=False))
+    await coordinator.async_stop()
+    await hass.async_block_till_done()
+    zone2.assert_called_once()
+
+
+async def test_stats(hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the performance counters."""
+    coordinator = PimaForceDataUpdateCoordinator(
+        hass,
+        MockConfigEntry(
+            domain=DOMAIN,
+            options={CONF_PORT: DEFAULT_LISTENING_PORT},
+        ),
+    )
+
+    monkeypatch.setattr(coordinator_module, "time", mock_time := MagicMock(wraps=time))
+    mock_time.perf_counter.side_effect = [*[10] * 6, 10.03, 10.031]
+    for event in (
+        _zone_event(1, is_open=True),
+        _zone_event(1, is_open=True),
+        _zone_event(2, is_open=False),
+        SIAEvent(),  # keep-alive
+        SIAEvent(event_type="401"),
+        SIAEvent(event_type="401"),
+    ):
+        assert coordinator.async_ingest(event)
+    await hass.async_block_till_done()
+
+    stats = coordinator.stats.as_dict()
+    # Measured from the arrival of the first event to the listener update.
+    parse_to_listener = stats.pop("parse_to_listener")
+    assert parse_to_listener["<=50ms"] == sum(parse_to_listener.values()) == 1
+    assert sum(stats.pop("listener_to_state_write").values()) == 1
+    assert stats == {
+        "frames_received": 6,
+        "frames_ignored": {"401": 2},
+        "keep_alives": 1,
+        "zone_changes": 2,
+        "queue_depth": 0,
+        "queue_high_water": 6,
+        "events_dropped": 0,
+        "events_refused": 0,
+    }
+
+
+async def test_ingest_queue_batches(
+    hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test queued events are handled in batches, one per loop iteration."""
+    monkeypatch.setattr(coordinator_module, "INGEST_BATCH_SIZE", 2)
+    coordinator = PimaForceDataUpdateCoordinator(
+        hass,
+        MockConfigEntry(domain=DOMAIN, options={CONF_PORT: DEFAULT_LISTENING_PORT}),
+    )
+    for zone in range(1, 6):
+        assert coordinator.async_ingest(_zone_event(zone, is_open=True))
+    assert coordinator.stats.queue_depth == 5
+
+    await asyncio.sleep(0)
+    assert list(coordinator.zones) == [1, 2]
+    assert coordinator.stats.queue_depth == 3
+    await hass.async_block_till_done()
+    assert list(coordinator.zones) == [1, 2, 3, 4, 5]
+    assert coordinator.stats.queue_depth == 0
+
+    # Queued events are discarded once stopped.
+    assert coordinator.async_ingest(_zone_event(6, is_open=True))
+    await coordinator.async_stop()
+    await hass.async_block_till_done()
+    assert 6 not in coordinator.zones
+    assert coordinator.stats.queue_depth == 0
+
+
+async def test_ingest_queue_keep_newest(
+    hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test new events replace the queued events they supersede when it's full."""
+    monkeypatch.setattr(coordinator_module, "INGEST_QUEUE_SIZE", 4)
+    coordinator = PimaForceDataUpdateCoordinator(
+        hass,
+        MockConfigEntry(domain=DOMAIN, options={CONF_PORT: DEFAULT_LISTENING_PORT}),
+    )
+    for event in (
+        _zone_event(1, is_open=True),
+        SIAEvent(),  # keep-alive
+        _zone_event(2, is_open=True),
+        _zone_event(1, is_open=False),
+        SIAEvent(),  # the queue is full, the keep-alive is superseded
+        _zone_event(1, is_open=True),  # the newest event of the zone is superseded
+    ):
+        assert coordinator.async_ingest(event)
+    assert coordinator.stats.events_dropped == 2
+
+    # Nothing is superseded, the queued events were acknowledged already.
+    assert not coordinator.async_ingest(_zone_event(3, is_open=True))
+    assert coordinator.stats.events_refused == 1
+    coordinator.io_thread = True
+    assert not coordinator.async_ingest(_zone_event(3, is_open=True))
+    assert coordinator.stats.events_dropped == 3
+    assert coordinator.stats.queue_high_water == 4
+
+    await hass.async_block_till_done()
+    assert dict(coordinator.zones) == {1: True, 2: True}
+    assert coordinator.stats.zone_changes == 2  # zone 1 closing was superseded
+    assert coordinator.stats.keep_alives == 1
+
+    # The drained events aren't superseded anymore.
+    for zone in (1, 1, 3):
+        assert coordinator.async_ingest(_zone_event(zone, is_open=False))
+    await hass.async_block_till_done()
+    assert dict(coordinator.zones) == {1: False, 2: True, 3: False}
+    assert coordinator.stats.events_dropped == 3
+
+
+@pytest.mark.allowed_logs(["Error handling event"])
+async def test_ingest_queue_handler_error(hass: HomeAssistant) -> None:
+    """Test the queue keeps being drained when handling an event fails."""
+    coordinator = PimaForceDataUpdateCoordinator(
+        hass,
+        MockConfigEntry(domain=DOMAIN, options={CONF_PORT: DEFAULT_LISTENING_PORT}),
+    )
+    subscriber = MagicMock(side_effect=[RuntimeError, None, None])
+    async_subscribe_events(hass, subscriber)
+
+    assert coordinator.async_ingest(_zone_event(1, is_open=True))
+    assert coordinator.async_ingest(_zone_event(2, is_open=True))
+    await hass.async_block_till_done()
+    assert dict(coordinator.zones) == {1: True, 2: True}
+
+    assert coordinator.async_ingest(_zone_event(3, is_open=True))
+    await hass.async_block_till_done()
+    assert dict(coordinator.zones) == {1: True, 2: True, 3: True}
+    assert subscriber.call_count == 3
+    assert coordinator.stats.queue_depth == 0
+
+
+async def test_ingest_queue_refuse(
+    hass: HomeAssistant, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test new events are refused when the queue is full."""
+    monkeypatch.setattr(coordinator_module, "INGEST_QUEUE_SIZE", 2)
+    coordinator = PimaForceDataUpdateCoordinator(
+        hass,
+        MockConfigEntry(
+            domain=DOMAIN,
+            options={
+                CONF_PORT: DEFAULT_LISTENING_PORT,
+                CONF_OVERFLOW_POLICY: OVERFLOW_POLICY_REFUSE,
+            },
+        ),
+    )
+    assert coordinator.async_ingest(_zone_event(1, is_open=True))
+    assert coordinator.async_ingest(_zone_event(2, is_open=True))
+    assert not coordinator.async_ingest(_zone_event(3, is_open=True))
+    assert coordinator.stats.events_refused == 1
+    await hass.async_block_till_done()
+
+    assert coordinator.async_ingest(_zone_event(3, is_open=True))
+    await hass.async_block_till_done()
+    assert dict(coordinator.zones) == {1: True, 2: True, 3: True}
+
+
+async def test_coordinator_health(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    auto_mock_sia_client_tcp: MagicMock,
+) -> None:
+    """Test the connection state is checked on a timer shared by the entries."""
+    coordinators = [
+        PimaForceDataUpdateCoordinator(
+            hass, MockConfigEntry(domain=DOMAIN, options={CONF_PORT: port})
+        )
+        for port in (DEFAULT_LISTENING_PORT, DEFAULT_LISTENING_PORT + 1)
+    ]
+    coordinator = coordinators[0]
+    assert coordinator.ack_latency is None
+    listener = MagicMock()
+    coordinator.async_add_listener(listener)
+    auto_mock_sia_client_tcp.ack_latency = {"AAAAAA": 0.01}
+    for started in coordinators:
+        await started.async_start()
+    assert coordinator.connected is None
+    assert coordinator.ack_latency is None
+
+    freezer.tick(HEALTH_CHECK_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert coordinator.connected is None
+    listener.assert_called_once()
+
+    listener.reset_mock()
+    coordinator.async_ingest(AdmCidEvent("AAAAAA", "0001", "R1", "L0", *[None] * 4))
+    assert coordinator.connected is True
+    assert coordinator.last_frame == dt_util.utcnow().timestamp()
+    assert coordinator.ack_latency == 0.01
+    listener.assert_called_once()
+    coordinator.async_ingest(AdmCidEvent("AAAAAA", "0002", "R1", "L0", *[None] * 4))
+    listener.assert_called_once()
+
+    freezer.tick(timedelta(seconds=CONNECTION_TIMEOUT))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert coordinator.connected is False
+    assert coordinators[1].connected is False  # no frame since started
+
+    timer = hass.data[DATA_HEALTH_TIMER]
+    await coordinator.async_stop()
+    assert hass.data[DATA_HEALTH_TIMER] is timer
+    await coordinators[1].async_stop()
+    assert DATA_HEALTH_TIMER not in hass.data
@@ -0,0 +1,147 @@
+"""Tests for the device triggers."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock
+
+import pytest
+import voluptuous as vol
+from homeassistant.helpers import device_registry as dr
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.pima_force.const import (
+    DOMAIN,
+    PANEL_TRIGGER_TYPES,
+)
+from custom_components.pima_force.device_trigger import (
+    TRIGGER_SCHEMA,
+    async_attach_trigger,
+    async_get_triggers,
+)
+
+from .helpers import adm_cid_event
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.trigger import TriggerInfo
+
+    from .helpers import SetupEntry
+
+ZONES = ["Front Door", "", "Hall"]
+
+
+def _device_id(hass: HomeAssistant, config_entry: MockConfigEntry) -> str:
+    device = dr.async_get(hass).async_get_device({(DOMAIN, config_entry.entry_id)})
+    assert device is not None
+    return device.id
+
+
+def _trigger(device_id: str, trigger_type: str, **extra: Any) -> dict[str, Any]:
+    return {
+        "platform": "device",
+        "domain": DOMAIN,
+        "device_id": device_id,
+        "type": trigger_type,
+        **extra,
+    }
+
+
+async def test_get_triggers(hass: HomeAssistant, setup_entry: SetupEntry) -> None:
+    """Test the triggers of the used zones and of the panel are listed."""
+    device_id = _device_id(hass, await setup_entry(ZONES))
+    assert await async_get_triggers(hass, device_id) == [
+        _trigger(device_id, "zone_opened", subtype="1"),
+        _trigger(device_id, "zone_closed", subtype="1"),
+        _trigger(device_id, "zone_opened", subtype="3"),
+        _trigger(device_id, "zone_closed", subtype="3"),
+        *(_trigger(device_id, trigger_type) for trigger_type in PANEL_TRIGGER_TYPES),
+    ]
+    assert await async_get_triggers(hass, "missing") == []
+
+    other_entry = MockConfigEntry(domain="other")
+    other_entry.add_to_hass(hass)
+    for identifier in (("other", "device"), (DOMAIN, "missing")):
+        device = dr.async_get(hass).async_get_or_create(
+            config_entry_id=other_entry.entry_id, identifiers={identifier}
+        )
+        assert await async_get_triggers(hass, device.id) == []
+
+
+def test_trigger_schema() -> None:
+    """Test zone triggers require a zone number and panel triggers don't."""
+    assert TRIGGER_SCHEMA(_trigger("device", "zone_opened", subtype="12"))
+    assert TRIGGER_SCHEMA(_trigger("device", "alarm"))
+    for config in (
+        _trigger("device", "zone_opened"),
+        _trigger("device", "zone_opened", subtype="012"),
+        _trigger("device", "alarm", subtype="1"),
+        _trigger("device", "unknown"),
+    ):
+        with pytest.raises(vol.Invalid):
+            TRIGGER_SCHEMA(config)
+
+
+async def test_attach_trigger(hass: HomeAssistant, setup_entry: SetupEntry) -> None:
+    """Test triggers run their action on the matching events only."""
+    config_entry = await setup_entry(ZONES)
+    device_id = _device_id(hass, config_entry)
+    coordinator = config_entry.runtime_data.coordinator
+    trigger_info: TriggerInfo = {
+        "domain": "automation",
+        "name": "test",
+        "home_assistant_start": False,
+        "variables": None,
+        "trigger_data": {"id": "0", "idx": "0", "alias": None},
+    }
+    zone_opened = AsyncMock()
+    alarm = AsyncMock()
+    removers = [
+        await async_attach_trigger(
+            hass,
+            TRIGGER_SCHEMA(_trigger(device_id, "zone_opened", subtype="3")),
+            zone_opened,
+            trigger_info,
+        ),
+        await async_attach_trigger(
+            hass, TRIGGER_SCHEMA(_trigger(device_id, "alarm")), alarm, trigger_info
+        ),
+    ]
+
+    for event in (
+        adm_cid_event(1, "760", "1", "001", partition="02"),  # other zone
+        adm_cid_event(2, "760", "3", "003", partition="02"),  # closed
+        adm_cid_event(3, "760", "1", "003", partition="02"),
+        adm_cid_event(4, "760", "1", "003", partition="02"),  # still open
+        adm_cid_event(5, "130", "6", "005", partition="02"),  # still active
+        adm_cid_event(6, "130", "1", "005", partition="02"),
+    ):
+        assert coordinator.async_ingest(event)
+    await hass.async_block_till_done()
+
+    zone_opened.assert_awaited_once()
+    assert zone_opened.call_args.args[0] == {
+        "trigger": {
+            "id": "0",
+            "idx": "0",
+            "alias": None,
+            "platform": "device",
+            "domain": DOMAIN,
+            "device_id": device_id,
+            "type": "zone_opened",
+            "subtype": "3",
+            "code": "760",
+            "partition": 2,
+            "zone": 3,
+            "description": f"{DOMAIN} zone_opened",
+        }
+    }
+    alarm.assert_awaited_once()
+    assert alarm.call_args.args[0]["trigger"]["zone"] == 5
+
+    for remove in removers:
+        remove()
+    assert coordinator.async_ingest(adm_cid_event(7, "760", "3", "003", partition="02"))
+    assert coordinator.async_ingest(adm_cid_event(8, "760", "1", "003", partition="02"))
+    await hass.async_block_till_done()
+    zone_opened.assert_awaited_once()
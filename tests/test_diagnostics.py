@@ -0,0 +1,44 @@
+"""Tests for the diagnostics."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.const import CONF_PORT
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.pima_force.const import DEFAULT_LISTENING_PORT, DOMAIN
+from custom_components.pima_force.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+async def test_diagnostics(hass: HomeAssistant) -> None:
+    """Test the diagnostics include the counters of the entry and its server."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN, options={CONF_PORT: DEFAULT_LISTENING_PORT}
+    )
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    coordinator = config_entry.runtime_data.coordinator
+    coordinator.zones[1] = True
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, config_entry)
+
+    assert diagnostics["options"] == {CONF_PORT: DEFAULT_LISTENING_PORT}
+    assert diagnostics["zones"] == {1: True}
+    assert diagnostics["suppressed_transitions"] == {}
+    assert diagnostics["coordinator"] == coordinator.stats.as_dict()
+    assert diagnostics["server"] == {
+        "connections_accepted": 0,
+        "connections_dropped": 0,
+        "connections_refused": 0,
+        "frames_duplicate": 0,
+        "frames_rate_limited": 0,
+        "frames_received": 0,
+        "frames_refused": 0,
+        "frames_unrouted": 0,
+    }
@@ -2,14 +2,25 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from typing import TYPE_CHECKING
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from homeassistant.const import ATTR_CONFIG_ENTRY_ID, CONF_NAME, CONF_PORT, Platform
-from homeassistant.exceptions import HomeAssistantError
+from homeassistant.const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_ENTITY_ID,
+    CONF_NAME,
+    CONF_PORT,
+    STATE_OFF,
+    STATE_ON,
+    Platform,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.util import dt as dt_util
 from pytest_homeassistant_custom_component.common import (
     MockConfigEntry,
+    async_capture_events,
 )
 
 from custom_components.pima_force import (
@@ -20,11 +31,23 @@ from custom_components.pima_force import (
     config_entry_update_listener,
 )
 from custom_components.pima_force.const import (
+    ATTR_ENTRIES,
+    ATTR_RECORDS,
     CONF_ZONES,
     DEFAULT_LISTENING_PORT,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_RATE_LIMIT,
     DOMAIN,
+    EVENT_JOURNAL,
+    OVERFLOW_POLICY_KEEP_NEWEST,
+    PROTOCOL_TCP,
+    SERVICE_GET_ZONE_STATES,
     SERVICE_GET_ZONES,
+    SERVICE_QUERY_JOURNAL,
+    SERVICE_SET_CLOSED,
+    SERVICE_SET_OPEN,
     SERVICE_SET_ZONES,
+    SIGNAL_ZONES_UPDATED,
 )
 
 if TYPE_CHECKING:
@@ -40,8 +63,11 @@ async def test_setup(hass: HomeAssistant) -> None:
     config_entry.add_to_hass(hass)
     assert await hass.config_entries.async_setup(config_entry.entry_id)
     await hass.async_block_till_done(wait_background_tasks=True)
+    journal_path = config_entry.runtime_data.coordinator.journal.path
+    assert journal_path.exists()
     assert await hass.config_entries.async_remove(config_entry.entry_id)
     await hass.async_block_till_done(wait_background_tasks=True)
+    assert not journal_path.exists()
 
 
 async def test_async_setup_get_zones_action(hass: HomeAssistant) -> None:
@@ -71,6 +97,182 @@ async def test_async_setup_get_zones_action(hass: HomeAssistant) -> None:
         )
 
 
+async def test_async_setup_get_zone_states_action(hass: HomeAssistant) -> None:
+    """Test get_zone_states service returns the snapshot of the zones."""
+    entry_ids = []
+    for port in (DEFAULT_LISTENING_PORT, DEFAULT_LISTENING_PORT + 1):
+        config_entry = MockConfigEntry(
+            domain=DOMAIN,
+            options={
+                CONF_PORT: port,
+                CONF_ZONES: [{CONF_NAME: "Door"}, {CONF_NAME: ""}, {CONF_NAME: "Hall"}],
+            },
+        )
+        config_entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        entry_ids.append(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_OPEN,
+        {ATTR_ENTITY_ID: f"binary_sensor.{DOMAIN}_{DEFAULT_LISTENING_PORT}_zone3"},
+        blocking=True,
+    )
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_ZONE_STATES,
+        {ATTR_CONFIG_ENTRY_ID: entry_ids},
+        blocking=True,
+        return_response=True,
+    )
+    assert response is not None
+    assert list(response) == entry_ids
+    door, hall = response[entry_ids[0]]
+    assert door[CONF_NAME] == "Door"
+    assert door["zone"] == 1
+    assert door["state"] == STATE_OFF
+    assert door["last_open"] is None
+    assert door["last_close"] is not None
+    assert hall[CONF_NAME] == "Hall"
+    assert hall["zone"] == 3
+    assert hall["state"] == STATE_ON
+    assert hall["last_open"] == hall["last_set"]
+    assert [zone["state"] for zone in response[entry_ids[1]]] == [STATE_OFF] * 2
+
+    # The snapshot is cached until a zone changes.
+    assert (
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_GET_ZONE_STATES,
+            {ATTR_CONFIG_ENTRY_ID: entry_ids[0]},
+            blocking=True,
+            return_response=True,
+        )
+    )[entry_ids[0]] is response[entry_ids[0]]
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_CLOSED,
+        {ATTR_ENTITY_ID: f"binary_sensor.{DOMAIN}_{DEFAULT_LISTENING_PORT}_zone3"},
+        blocking=True,
+    )
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_ZONE_STATES,
+        {ATTR_CONFIG_ENTRY_ID: entry_ids[0]},
+        blocking=True,
+        return_response=True,
+    )
+    assert response is not None
+    assert [zone["state"] for zone in response[entry_ids[0]]] == [STATE_OFF] * 2
+
+    # Removed zones are dropped from the snapshot.
+    hass.config_entries.async_update_entry(
+        config_entry, options={**config_entry.options, CONF_ZONES: [{CONF_NAME: "X"}]}
+    )
+    await hass.async_block_till_done()
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_GET_ZONE_STATES,
+        {ATTR_CONFIG_ENTRY_ID: config_entry.entry_id},
+        blocking=True,
+        return_response=True,
+    )
+    assert response is not None
+    assert [zone[CONF_NAME] for zone in response[config_entry.entry_id]] == ["X"]
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    for entry_id in (config_entry.entry_id, "missing_entry"):
+        with pytest.raises(ServiceValidationError):
+            await hass.services.async_call(
+                DOMAIN,
+                SERVICE_GET_ZONE_STATES,
+                {ATTR_CONFIG_ENTRY_ID: entry_id},
+                blocking=True,
+                return_response=True,
+            )
+
+
+async def test_async_setup_query_journal_action(hass: HomeAssistant) -> None:
+    """Test query_journal service returns and replays the journal records."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN, options={CONF_PORT: DEFAULT_LISTENING_PORT}
+    )
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    journal = config_entry.runtime_data.coordinator.journal
+    start = dt_util.parse_datetime("2024-01-01T00:00:00+00:00")
+    assert start is not None
+    for minute, zone, is_open in ((0, 1, True), (1, 2, True), (2, 1, False)):
+        journal.append(start.timestamp() + minute * 60, zone, is_open)
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_QUERY_JOURNAL,
+        {ATTR_CONFIG_ENTRY_ID: config_entry.entry_id},
+        blocking=True,
+        return_response=True,
+    )
+    assert response is not None
+    assert response[ATTR_RECORDS] == [
+        {
+            "time": dt_util.as_local(start + timedelta(minutes=minute)).isoformat(),
+            "zone": zone,
+            "state": state,
+        }
+        for minute, zone, state in (
+            (0, 1, STATE_ON),
+            (1, 2, STATE_ON),
+            (2, 1, STATE_OFF),
+        )
+    ]
+
+    events = async_capture_events(hass, EVENT_JOURNAL)
+    response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_QUERY_JOURNAL,
+        {
+            ATTR_CONFIG_ENTRY_ID: config_entry.entry_id,
+            "start": "2024-01-01 00:01:00+00:00",
+            "end": start + timedelta(minutes=2),
+            CONF_ZONES: [1],
+            "replay": True,
+        },
+        blocking=True,
+        return_response=True,
+    )
+    assert response is not None
+    assert [record["state"] for record in response[ATTR_RECORDS]] == [STATE_OFF]
+    await hass.async_block_till_done()
+    assert [event.data for event in events] == [
+        {ATTR_CONFIG_ENTRY_ID: config_entry.entry_id, **response[ATTR_RECORDS][0]}
+    ]
+
+    # Replaying without a response.
+    assert (
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_QUERY_JOURNAL,
+            {ATTR_CONFIG_ENTRY_ID: config_entry.entry_id, "replay": True},
+            blocking=True,
+        )
+        is None
+    )
+    await hass.async_block_till_done()
+    assert len(events) == 4
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_QUERY_JOURNAL,
+            {ATTR_CONFIG_ENTRY_ID: config_entry.entry_id},
+            blocking=True,
+            return_response=True,
+        )
+
+
 async def test_async_setup_set_zones_action(hass: HomeAssistant) -> None:
     """Test set_zones service updates configured zone names."""
     config_entry = MockConfigEntry(
@@ -106,6 +308,75 @@ async def test_async_setup_set_zones_action(hass: HomeAssistant) -> None:
     assert config_entry.options[CONF_ZONES] == [{CONF_NAME: ""}, {CONF_NAME: "Hall"}]
 
 
+async def test_set_zones_action_batch(hass: HomeAssistant) -> None:
+    """Test set_zones updates a batch of entries in place, all of them or none."""
+    config_entries = [
+        MockConfigEntry(
+            domain=DOMAIN,
+            options={CONF_PORT: port, CONF_ZONES: [{CONF_NAME: "Front Door"}]},
+        )
+        for port in (DEFAULT_LISTENING_PORT, DEFAULT_LISTENING_PORT + 1)
+    ]
+    for config_entry in config_entries:
+        config_entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinators = [entry.runtime_data.coordinator for entry in config_entries]
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_OPEN,
+        {ATTR_ENTITY_ID: f"binary_sensor.{DOMAIN}_{DEFAULT_LISTENING_PORT}_zone1"},
+        blocking=True,
+    )
+
+    with pytest.raises(ServiceValidationError) as error:
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SET_ZONES,
+            {
+                ATTR_ENTRIES: [
+                    {
+                        ATTR_CONFIG_ENTRY_ID: config_entries[0].entry_id,
+                        CONF_ZONES: ["Hall"],
+                    },
+                    {ATTR_CONFIG_ENTRY_ID: "missing", CONF_ZONES: ["Hall"]},
+                ]
+            },
+            blocking=True,
+        )
+    assert error.value.translation_key == "entry_not_found"
+    assert config_entries[0].options[CONF_ZONES] == [{CONF_NAME: "Front Door"}]
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_ZONES,
+        {
+            ATTR_ENTRIES: [
+                {
+                    ATTR_CONFIG_ENTRY_ID: config_entries[0].entry_id,
+                    CONF_ZONES: ["Front Door", "Garage"],
+                },
+                {
+                    ATTR_CONFIG_ENTRY_ID: config_entries[1].entry_id,
+                    CONF_ZONES: ["Hall"],
+                },
+            ]
+        },
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+    assert [entry.runtime_data.coordinator for entry in config_entries] == coordinators
+    front_door = hass.states.get(
+        f"binary_sensor.{DOMAIN}_{DEFAULT_LISTENING_PORT}_zone1"
+    )
+    assert front_door is not None
+    assert front_door.state == STATE_ON
+    assert hass.states.get(f"binary_sensor.{DOMAIN}_{DEFAULT_LISTENING_PORT}_zone2")
+    hall = hass.states.get(f"binary_sensor.{DOMAIN}_{DEFAULT_LISTENING_PORT + 1}_zone1")
+    assert hall is not None
+    assert hall.name == "Pima Force Hall"
+
+
 async def test_async_setup_entry(hass: HomeAssistant) -> None:
     """Test async_setup_entry assigns runtime data and starts the coordinator."""
     config_entry = MockConfigEntry(domain=DOMAIN)
@@ -124,20 +395,69 @@ async def test_async_setup_entry(hass: HomeAssistant) -> None:
     assert config_entry.runtime_data.coordinator is coordinator
     coordinator.async_start.assert_awaited_once()
     hass.config_entries.async_forward_entry_setups.assert_awaited_once_with(
-        config_entry, (Platform.BINARY_SENSOR,)
+        config_entry, (Platform.BINARY_SENSOR, Platform.SENSOR)
     )
 
 
 async def test_config_entry_update_listener(hass: HomeAssistant) -> None:
-    """Test config entry update listener triggers a reload."""
-    config_entry = MockConfigEntry(domain=DOMAIN)
+    """Test config entry update listener reloads only on listener changes."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN, options={CONF_PORT: DEFAULT_LISTENING_PORT}
+    )
+    coordinator = MagicMock()
+    coordinator.port = DEFAULT_LISTENING_PORT
+    coordinator.account = ""
+    coordinator.protocol = PROTOCOL_TCP
+    coordinator.io_thread = False
+    coordinator.rate_limit = DEFAULT_RATE_LIMIT
+    coordinator.max_connections = DEFAULT_MAX_CONNECTIONS
+    config_entry.runtime_data = PimaForceRuntimeData(coordinator=coordinator)
     hass.config_entries.async_schedule_reload = MagicMock()
 
-    await config_entry_update_listener(hass, config_entry)
+    with patch(
+        "custom_components.pima_force.async_dispatcher_send"
+    ) as mock_dispatcher_send:
+        await config_entry_update_listener(hass, config_entry)
+    hass.config_entries.async_schedule_reload.assert_not_called()
+    assert coordinator.coalesce_window == 0
+    assert coordinator.overflow_policy == OVERFLOW_POLICY_KEEP_NEWEST
+    mock_dispatcher_send.assert_called_once_with(
+        hass, SIGNAL_ZONES_UPDATED.format(config_entry.entry_id)
+    )
+
+    coordinator.io_thread = True
+    with patch(
+        "custom_components.pima_force.async_dispatcher_send"
+    ) as mock_dispatcher_send:
+        await config_entry_update_listener(hass, config_entry)
+    hass.config_entries.async_schedule_reload.assert_called_once_with(
+        config_entry.entry_id
+    )
+    mock_dispatcher_send.assert_not_called()
+    hass.config_entries.async_schedule_reload.reset_mock()
+
+    coordinator.io_thread = False
+    coordinator.rate_limit = 5
+    with patch(
+        "custom_components.pima_force.async_dispatcher_send"
+    ) as mock_dispatcher_send:
+        await config_entry_update_listener(hass, config_entry)
+    hass.config_entries.async_schedule_reload.assert_called_once_with(
+        config_entry.entry_id
+    )
+    mock_dispatcher_send.assert_not_called()
+    hass.config_entries.async_schedule_reload.reset_mock()
 
+    coordinator.rate_limit = DEFAULT_RATE_LIMIT
+    coordinator.port = DEFAULT_LISTENING_PORT + 1
+    with patch(
+        "custom_components.pima_force.async_dispatcher_send"
+    ) as mock_dispatcher_send:
+        await config_entry_update_listener(hass, config_entry)
     hass.config_entries.async_schedule_reload.assert_called_once_with(
         config_entry.entry_id
     )
+    mock_dispatcher_send.assert_not_called()
 
 
 async def test_async_unload_entry(hass: HomeAssistant) -> None:
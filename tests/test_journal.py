@@ -0,0 +1,64 @@
+"""Test pima_force journal."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from custom_components.pima_force.journal import Journal, remove_journal
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+async def test_ring(hass: HomeAssistant) -> None:
+    """Test the oldest records are overwritten once the journal is full."""
+    journal = Journal(hass, "entry", capacity=3)
+    journal.open()
+    assert list(journal.records()) == []
+    for time in range(5):
+        journal.append(time, time + 1, time % 2 == 0)
+    assert list(journal.records()) == [(2, 3, True), (3, 4, False), (4, 5, True)]
+    assert list(journal.records(3)) == [(3, 4, False), (4, 5, True)]
+    assert list(journal.records(end=3)) == [(2, 3, True), (3, 4, False)]
+    assert list(journal.records(2.5, 3.5)) == [(3, 4, False)]
+    journal.close()
+    journal.close()
+
+
+async def test_reopen(hass: HomeAssistant) -> None:
+    """Test the records survive reopening, and incompatible files are reset."""
+    journal = Journal(hass, "entry", capacity=3)
+    journal.open()
+    journal.append(1, 1, True)
+    journal.append(2, 1, False)
+    journal.close()
+
+    journal = Journal(hass, "entry", capacity=3)
+    journal.open()
+    assert list(journal.records()) == [(1, 1, True), (2, 1, False)]
+    journal.close()
+
+    # A different capacity changes the file size.
+    journal = Journal(hass, "entry", capacity=4)
+    journal.open()
+    assert list(journal.records()) == []
+    journal.close()
+
+    # A corrupted header.
+    with journal.path.open("r+b") as file:
+        file.write(b"XXXX")
+    journal.open()
+    assert list(journal.records()) == []
+    journal.close()
+
+    remove_journal(hass, "entry")
+    assert not journal.path.exists()
+    remove_journal(hass, "entry")
+
+
+async def test_closed(hass: HomeAssistant) -> None:
+    """Test a closed journal ignores appends and has no records."""
+    journal = Journal(hass, "entry")
+    journal.append(1, 1, True)
+    assert list(journal.records()) == []
+    assert not journal.path.exists()
@@ -0,0 +1,168 @@
+"""Tests for the shared SIA listener."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.exceptions import ConfigEntryError
+from pysiaalarm.event import SIAEvent
+
+from custom_components.pima_force.const import DEFAULT_LISTENING_PORT, PROTOCOL_UDP
+from custom_components.pima_force.listener import DATA_LISTENERS, async_register
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+async def test_listener_is_shared_per_port(
+    hass: HomeAssistant, auto_mock_sia_client_tcp: MagicMock
+) -> None:
+    """Test config entries on the same port share a single SIA server."""
+    unregister_first = await async_register(
+        hass, DEFAULT_LISTENING_PORT, "", MagicMock()
+    )
+    unregister_second = await async_register(
+        hass, DEFAULT_LISTENING_PORT, "AAAAAA", MagicMock()
+    )
+    auto_mock_sia_client_tcp.async_start.assert_awaited_once()
+    assert list(hass.data[DATA_LISTENERS]) == [DEFAULT_LISTENING_PORT]
+
+    await unregister_first()
+    auto_mock_sia_client_tcp.async_stop.assert_not_awaited()
+    await unregister_second()
+    auto_mock_sia_client_tcp.async_stop.assert_awaited_once()
+    assert hass.data[DATA_LISTENERS] == {}
+
+
+async def test_listener_routes_by_account(hass: HomeAssistant) -> None:
+    """Test events are routed by account ID with a fallback to the default route."""
+    default = MagicMock()
+    panel = MagicMock()
+    await async_register(hass, DEFAULT_LISTENING_PORT, "AAAAAA", panel)
+    listener = hass.data[DATA_LISTENERS][DEFAULT_LISTENING_PORT]
+
+    event = SIAEvent(account="aaaaaa")
+    assert listener.async_route(event)
+    panel.assert_called_once_with(event)
+
+    assert listener.async_route(SIAEvent(account="BBBBBB"))  # acknowledged
+    panel.assert_called_once()
+    assert listener.server.stats.frames_unrouted == 1
+
+    panel.return_value = False
+    assert not listener.async_route(SIAEvent(account="AAAAAA"))
+
+    await async_register(hass, DEFAULT_LISTENING_PORT, "", default)
+    listener.async_route(event := SIAEvent(account="BBBBBB"))
+    default.assert_called_once_with(event)
+    assert panel.call_count == 2
+
+
+async def test_listener_rejects_duplicate_account(hass: HomeAssistant) -> None:
+    """Test an account can be served by a single config entry on a port."""
+    await async_register(hass, DEFAULT_LISTENING_PORT, "AAAAAA", MagicMock())
+
+    with pytest.raises(ConfigEntryError):
+        await async_register(hass, DEFAULT_LISTENING_PORT, "AAAAAA", MagicMock())
+
+
+async def test_listener_rejects_other_protocol(hass: HomeAssistant) -> None:
+    """Test a port is served over a single protocol."""
+    await async_register(
+        hass, DEFAULT_LISTENING_PORT, "AAAAAA", MagicMock(), protocol=PROTOCOL_UDP
+    )
+    assert isinstance(
+        hass.data[DATA_LISTENERS][DEFAULT_LISTENING_PORT].server, MagicMock
+    )
+
+    with pytest.raises(ConfigEntryError, match="served over UDP"):
+        await async_register(hass, DEFAULT_LISTENING_PORT, "BBBBBB", MagicMock())
+
+
+async def test_listener_io_thread_rejects_refuse(hass: HomeAssistant) -> None:
+    """Test a handler refusing events can't join a port served by an I/O thread."""
+    unregister = await async_register(
+        hass, DEFAULT_LISTENING_PORT, "AAAAAA", MagicMock(), io_thread=True
+    )
+
+    with pytest.raises(ConfigEntryError, match="I/O thread"):
+        await async_register(
+            hass, DEFAULT_LISTENING_PORT, "BBBBBB", MagicMock(), refuse=True
+        )
+    other = await async_register(hass, DEFAULT_LISTENING_PORT, "CCCCCC", MagicMock())
+    await other()
+    await unregister()
+
+    # Without an I/O thread, the first entry may refuse events.
+    await async_register(
+        hass, DEFAULT_LISTENING_PORT + 1, "AAAAAA", MagicMock(), refuse=True
+    )
+    await async_register(
+        hass, DEFAULT_LISTENING_PORT + 1, "BBBBBB", MagicMock(), io_thread=True
+    )
+    assert not hass.data[DATA_LISTENERS][DEFAULT_LISTENING_PORT + 1].io_thread
+
+
+async def test_listener_start_failure(
+    hass: HomeAssistant, auto_mock_sia_client_tcp: MagicMock
+) -> None:
+    """Test a listener which failed to start is discarded."""
+    auto_mock_sia_client_tcp.async_start.side_effect = OSError
+
+    with pytest.raises(OSError):  # noqa: PT011
+        await async_register(hass, DEFAULT_LISTENING_PORT, "", MagicMock())
+
+    assert hass.data[DATA_LISTENERS] == {}
+
+
+async def test_listener_io_thread(
+    hass: HomeAssistant, auto_mock_sia_client_tcp: MagicMock
+) -> None:
+    """Test the SIA server runs on an I/O thread which hands events over in batches."""
+    started_in: list[threading.Thread] = []
+    auto_mock_sia_client_tcp.async_start.side_effect = lambda: started_in.append(
+        threading.current_thread()
+    )
+    handler = MagicMock(return_value=False)
+    unregister = await async_register(
+        hass, DEFAULT_LISTENING_PORT, "", handler, io_thread=True
+    )
+    listener = hass.data[DATA_LISTENERS][DEFAULT_LISTENING_PORT]
+    assert started_in[0] is not threading.current_thread()
+    assert started_in[0].is_alive()
+
+    events = [SIAEvent(account="AAAAAA"), SIAEvent(account="BBBBBB")]
+
+    def send() -> None:
+        for event in events:
+            assert listener._route(event)  # refusal isn't possible  # noqa: SLF001
+
+    thread = threading.Thread(target=send)
+    thread.start()
+    thread.join()
+    handler.assert_not_called()
+    await hass.async_block_till_done()
+    assert [call.args[0] for call in handler.call_args_list] == events
+
+    await unregister()
+    auto_mock_sia_client_tcp.async_stop.assert_awaited_once()
+    assert not started_in[0].is_alive()
+
+
+async def test_listener_io_thread_start_failure(
+    hass: HomeAssistant, auto_mock_sia_client_tcp: MagicMock
+) -> None:
+    """Test the I/O thread is stopped when the SIA server fails to start."""
+    threads = threading.active_count()
+    auto_mock_sia_client_tcp.async_start.side_effect = OSError
+
+    with pytest.raises(OSError):  # noqa: PT011
+        await async_register(
+            hass, DEFAULT_LISTENING_PORT, "", MagicMock(), io_thread=True
+        )
+
+    assert hass.data[DATA_LISTENERS] == {}
+    assert threading.active_count() == threads
@@ -0,0 +1,339 @@
+"""Tests for the sensor platform."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from homeassistant.const import (
+    CONF_NAME,
+    CONF_PORT,
+    STATE_OFF,
+    STATE_ON,
+    STATE_UNKNOWN,
+    EntityCategory,
+)
+from homeassistant.core import State
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+    mock_restore_cache,
+)
+
+from custom_components.pima_force.adm_cid import AdmCidEvent
+from custom_components.pima_force.const import (
+    CONF_ACCOUNT,
+    CONF_ZONES,
+    DEFAULT_LISTENING_PORT,
+    DOMAIN,
+    SERVICE_SET_OPEN,
+)
+from custom_components.pima_force.coordinator import (
+    CONNECTION_TIMEOUT,
+    HEALTH_CHECK_INTERVAL,
+)
+
+from .helpers import adm_cid_event
+
+if TYPE_CHECKING:
+    from unittest.mock import MagicMock
+
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.core import HomeAssistant
+
+    from .helpers import SetupEntry
+
+PREFIX = f"{DOMAIN}_{DEFAULT_LISTENING_PORT}"
+OPEN_ZONES = f"sensor.{PREFIX}_open_zones"
+CONNECTED = f"binary_sensor.{PREFIX}_connected"
+LAST_FRAME = f"sensor.{PREFIX}_last_frame"
+ACK_LATENCY = f"sensor.{PREFIX}_ack_latency"
+ANY_ZONE_OPEN = f"binary_sensor.{PREFIX}_any_zone_open"
+ALARM = f"binary_sensor.{PREFIX}_alarm"
+TROUBLE = f"binary_sensor.{PREFIX}_trouble"
+BYPASSED_ZONES = f"sensor.{PREFIX}_bypassed_zones"
+
+
+def _aggregates(hass: HomeAssistant) -> tuple[str, str]:
+    open_zones = hass.states.get(OPEN_ZONES)
+    any_zone_open = hass.states.get(ANY_ZONE_OPEN)
+    assert open_zones is not None
+    assert any_zone_open is not None
+    return open_zones.state, any_zone_open.state
+
+
+def _health(hass: HomeAssistant) -> tuple[str, ...]:
+    states = [
+        hass.states.get(entity_id) for entity_id in (CONNECTED, LAST_FRAME, ACK_LATENCY)
+    ]
+    assert None not in states
+    return tuple(state.state for state in states if state is not None)
+
+
+async def test_aggregates_follow_zone_changes(
+    hass: HomeAssistant, setup_entry: SetupEntry
+) -> None:
+    """Test the aggregates count the open used zones and are written on a change."""
+    config_entry = await setup_entry(["Front Door", "", "Garage"])
+    coordinator = config_entry.runtime_data.coordinator
+    state = hass.states.get(OPEN_ZONES)
+    assert state is not None
+    assert state.name == "Pima Force Open zones"
+    assert state.attributes["state_class"] == "measurement"
+    state = hass.states.get(ANY_ZONE_OPEN)
+    assert state is not None
+    assert state.name == "Pima Force Any zone open"
+    assert _aggregates(hass) == ("0", STATE_OFF)
+
+    coordinator.zones[1] = True
+    coordinator.zones[2] = True  # unused
+    coordinator.async_update_zone_listeners(1, 2)
+    await hass.async_block_till_done()
+    assert _aggregates(hass) == ("1", STATE_ON)
+    last_written = hass.states.get(ANY_ZONE_OPEN)
+
+    coordinator.zones[3] = True
+    coordinator.async_update_zone_listeners(3)
+    await hass.async_block_till_done()
+    assert _aggregates(hass) == ("2", STATE_ON)
+    assert hass.states.get(ANY_ZONE_OPEN) is last_written
+
+    coordinator.zones[1] = False
+    coordinator.zones[3] = False
+    coordinator.async_update_zone_listeners(1, 3)
+    await hass.async_block_till_done()
+    assert _aggregates(hass) == ("0", STATE_OFF)
+
+
+async def test_aggregates_wait_for_coalescing_window(
+    hass: HomeAssistant, setup_entry: SetupEntry
+) -> None:
+    """Test the aggregates don't count the transitions within a window."""
+    config_entry = await setup_entry(["Front Door", "", "Garage"])
+    coordinator = config_entry.runtime_data.coordinator
+    coordinator.coalesce_window = 1
+
+    assert coordinator.async_ingest(adm_cid_event(1, "760", "1", "001"))
+    await hass.async_block_till_done()
+    assert _aggregates(hass) == ("1", STATE_ON)
+
+    # The zone closes within its window, while another zone is written.
+    assert coordinator.async_ingest(adm_cid_event(2, "760", "3", "001"))
+    assert coordinator.async_ingest(adm_cid_event(3, "760", "1", "003"))
+    await hass.async_block_till_done()
+    assert _aggregates(hass) == ("2", STATE_ON)
+    assert coordinator.zones == {1: True, 3: True}
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert _aggregates(hass) == ("1", STATE_ON)
+    assert coordinator.zones == {1: False, 3: True}
+
+
+async def test_aggregates_follow_used_zones(
+    hass: HomeAssistant, setup_entry: SetupEntry
+) -> None:
+    """Test the aggregates are recounted when the used zones change."""
+    config_entry = await setup_entry(["Front Door", ""])
+    coordinator = config_entry.runtime_data.coordinator
+    coordinator.zones[2] = True
+    coordinator.async_update_listeners()
+    await hass.async_block_till_done()
+    assert _aggregates(hass) == ("0", STATE_OFF)
+
+    hass.config_entries.async_update_entry(
+        config_entry,
+        options={
+            **config_entry.options,
+            CONF_ZONES: [{CONF_NAME: "Front Door"}, {CONF_NAME: "Hall"}],
+        },
+    )
+    await hass.async_block_till_done()
+    assert _aggregates(hass) == ("1", STATE_ON)
+
+    hass.config_entries.async_update_entry(
+        config_entry,
+        options={**config_entry.options, CONF_ZONES: [{CONF_NAME: "Front Door"}]},
+    )
+    await hass.async_block_till_done()
+    assert _aggregates(hass) == ("0", STATE_OFF)
+
+
+async def test_aggregates_count_restored_zones(
+    hass: HomeAssistant, setup_entry: SetupEntry
+) -> None:
+    """Test restored zone states are counted until the zones are reported."""
+    mock_restore_cache(
+        hass,
+        [
+            State(f"binary_sensor.{PREFIX}_zone1", STATE_ON),
+            State(f"binary_sensor.{PREFIX}_zone2", STATE_OFF),
+        ],
+    )
+    config_entry = await setup_entry(["Front Door", "Back Door"])
+    assert _aggregates(hass) == ("1", STATE_ON)
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SET_OPEN,
+        {"entity_id": f"binary_sensor.{PREFIX}_zone2"},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+    assert _aggregates(hass) == ("2", STATE_ON)
+    assert config_entry.runtime_data.coordinator.zones == {1: True, 2: True}
+
+
+async def test_aggregate_entity_ids_include_account(hass: HomeAssistant) -> None:
+    """Test the account ID is part of the aggregate entity IDs when configured."""
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        options={CONF_PORT: DEFAULT_LISTENING_PORT, CONF_ACCOUNT: "AAAAAA"},
+    )
+    config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.states.get(f"sensor.{PREFIX}_aaaaaa_open_zones") is not None
+    assert hass.states.get(f"binary_sensor.{PREFIX}_aaaaaa_any_zone_open") is not None
+
+
+async def test_health_entities(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    auto_mock_sia_client_tcp: MagicMock,
+    setup_entry: SetupEntry,
+) -> None:
+    """Test the connection health of the panel is exposed as diagnostics."""
+    auto_mock_sia_client_tcp.ack_latency = {"": 0.01234}
+    config_entry = await setup_entry(["Front Door"])
+    coordinator = config_entry.runtime_data.coordinator
+    registry = er.async_get(hass)
+    for entity_id in (CONNECTED, LAST_FRAME, ACK_LATENCY):
+        entry = registry.async_get(entity_id)
+        assert entry is not None
+        assert entry.entity_category == EntityCategory.DIAGNOSTIC
+    assert _health(hass) == (STATE_UNKNOWN, STATE_UNKNOWN, "12.3")
+
+    coordinator.async_ingest(AdmCidEvent("", "0001", "R1", "L0", *[None] * 4))
+    await hass.async_block_till_done()
+    now = dt_util.utcnow().isoformat(timespec="seconds")
+    assert _health(hass) == (STATE_ON, now, "12.3")
+
+    freezer.tick(HEALTH_CHECK_INTERVAL)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    last_written = hass.states.get(LAST_FRAME)
+    auto_mock_sia_client_tcp.ack_latency[""] = 0.5
+    freezer.tick(timedelta(seconds=CONNECTION_TIMEOUT))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert _health(hass) == (STATE_OFF, now, "500.0")
+    assert hass.states.get(LAST_FRAME) is last_written
+
+
+async def test_panel_state_entities(
+    hass: HomeAssistant, setup_entry: SetupEntry
+) -> None:
+    """Test the alarm, trouble, bypass and arm state events are exposed."""
+    config_entry = await setup_entry(["Front Door"])
+    coordinator = config_entry.runtime_data.coordinator
+
+    def state(entity_id: str) -> State:
+        result = hass.states.get(entity_id)
+        assert result is not None
+        return result
+
+    assert state(ALARM).name == "Pima Force Alarm"
+    assert state(ALARM).attributes["device_class"] == "safety"
+    assert state(ALARM).state == STATE_OFF
+    assert state(ALARM).attributes["events"] == []
+    assert state(TROUBLE).attributes["device_class"] == "problem"
+    assert state(TROUBLE).state == STATE_OFF
+    assert state(BYPASSED_ZONES).state == "0"
+    assert state(BYPASSED_ZONES).attributes["zones"] == []
+    assert hass.states.get(f"sensor.{PREFIX}_arm_state_1") is None
+
+    for event_type, event_qualifier, partition, ri in (
+        ("130", "1", "01", "005"),
+        ("301", "1", "00", "000"),
+        ("573", "1", "01", "004"),
+        ("401", "3", "01", "003"),
+    ):
+        assert coordinator.async_ingest(
+            adm_cid_event(1, event_type, event_qualifier, ri, partition=partition)
+        )
+    await hass.async_block_till_done()
+    assert state(ALARM).state == STATE_ON
+    assert state(ALARM).attributes["events"] == [{"code": "130", "zone": 5}]
+    assert state(TROUBLE).state == STATE_ON
+    assert state(TROUBLE).attributes["events"] == [{"code": "301", "zone": 0}]
+    assert state(BYPASSED_ZONES).state == "1"
+    assert state(BYPASSED_ZONES).attributes["zones"] == [4]
+    arm_state = state(f"sensor.{PREFIX}_arm_state_1")
+    assert arm_state.name == "Pima Force Partition 1 arm state"
+    assert arm_state.state == "armed_away"
+    assert arm_state.attributes["options"] == ["disarmed", "armed_away", "armed_home"]
+    last_written = state(ALARM)
+
+    for event_type, event_qualifier, partition, ri in (
+        ("301", "3", "00", "000"),
+        ("401", "1", "01", "003"),
+        ("441", "3", "02", "003"),
+    ):
+        assert coordinator.async_ingest(
+            adm_cid_event(1, event_type, event_qualifier, ri, partition=partition)
+        )
+    await hass.async_block_till_done()
+    assert state(ALARM) is last_written
+    assert state(TROUBLE).state == STATE_OFF
+    assert state(f"sensor.{PREFIX}_arm_state_1").state == "disarmed"
+    assert state(f"sensor.{PREFIX}_arm_state_2").state == "armed_home"
+
+    last_written = state(f"sensor.{PREFIX}_arm_state_2")
+    coordinator.async_update_listeners()
+    await hass.async_block_till_done()
+    assert state(f"sensor.{PREFIX}_arm_state_2") is last_written
+
+
+async def test_partition_open_zones(
+    hass: HomeAssistant, setup_entry: SetupEntry
+) -> None:
+    """Test the open used zones are counted per partition reported by the panel."""
+    config_entry = await setup_entry(["Front Door", "Garage", "Office", ""])
+    coordinator = config_entry.runtime_data.coordinator
+
+    def open_zones(partition: int) -> str:
+        state = hass.states.get(f"sensor.{PREFIX}_partition_open_zones_{partition}")
+        assert state is not None
+        return state.state
+
+    for zone, partition in ((1, "01"), (2, "01"), (3, "02"), (2, "01"), (4, "02")):
+        assert coordinator.async_ingest(
+            adm_cid_event(1, "760", "1", f"{zone:03}", partition=partition)
+        )
+    await hass.async_block_till_done()
+    state = hass.states.get(f"sensor.{PREFIX}_partition_open_zones_1")
+    assert state is not None
+    assert state.name == "Pima Force Partition 1 open zones"
+    assert (open_zones(1), open_zones(2)) == ("2", "1")
+    arm_state = hass.states.get(f"sensor.{PREFIX}_arm_state_2")
+    assert arm_state is not None
+    assert arm_state.state == STATE_UNKNOWN
+
+    assert coordinator.async_ingest(adm_cid_event(2, "760", "3", "001"))
+    await hass.async_block_till_done()
+    assert (open_zones(1), open_zones(2)) == ("1", "1")
+
+    # Zones without a name aren't counted, like in the entry's open zones.
+    hass.config_entries.async_update_entry(
+        config_entry,
+        options={
+            **config_entry.options,
+            CONF_ZONES: [{CONF_NAME: name} for name in ("", "Garage", "", "Hall")],
+        },
+    )
+    await hass.async_block_till_done()
+    assert (open_zones(1), open_zones(2)) == ("1", "1")
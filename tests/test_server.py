@@ -0,0 +1,430 @@
+"""Tests for the SIA TCP server."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+from typing import TYPE_CHECKING, Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pysiaalarm.event import SIAEvent
+
+from custom_components.pima_force import server as server_module
+from custom_components.pima_force.adm_cid import AdmCidEvent
+from custom_components.pima_force.const import DEFAULT_LISTENING_PORT
+from custom_components.pima_force.server import (
+    PimaForceSIAServer,
+    PimaForceSIAServerUDP,
+)
+
+from .helpers import sia_frame
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+def _writer() -> MagicMock:
+    writer = MagicMock()
+    writer.drain = AsyncMock()
+    writer.wait_closed = AsyncMock()
+    writer.get_extra_info.return_value = ("192.168.1.2", 5000)
+    return writer
+
+
+async def _handle(server: PimaForceSIAServer, data: bytes) -> MagicMock:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    writer = _writer()
+    await server.handle_line(reader, writer)
+    writer.close.assert_called_once()
+    return writer
+
+
+async def test_start_stop(hass: HomeAssistant) -> None:  # noqa: ARG001
+    """Test the server starts and stops listening."""
+    server = PimaForceSIAServer(DEFAULT_LISTENING_PORT, MagicMock())
+    tcp_server = MagicMock()
+    tcp_server.wait_closed = AsyncMock()
+    with patch(
+        "custom_components.pima_force.server.asyncio.start_server",
+        AsyncMock(return_value=tcp_server),
+    ) as mock_start_server:
+        await server.async_start()
+    mock_start_server.assert_awaited_once_with(
+        server.handle_line, "", DEFAULT_LISTENING_PORT
+    )
+
+    await server.async_stop()
+    tcp_server.close.assert_called_once()
+    assert server.shutdown_flag
+
+    await server.async_stop()
+    tcp_server.close.assert_called_once()
+
+
+async def test_fast_path(hass: HomeAssistant) -> None:  # noqa: ARG001
+    """Test zone status and keep-alive frames bypass pysiaalarm."""
+    route = MagicMock()
+    server = PimaForceSIAServer(DEFAULT_LISTENING_PORT, route)
+
+    writer = await _handle(
+        server,
+        sia_frame('"ADM-CID"0001R1L0#AAAAAA[#AAAAAA|1760 01 002]')
+        + sia_frame('"NULL"0002R1L0#AAAAAA[]'),
+    )
+
+    assert [call.args[0] for call in writer.write.call_args_list] == [
+        sia_frame('"ACK"0001R1L0#AAAAAA[KC]'),
+        sia_frame('"ACK"0002R1L0#AAAAAA[KC]'),
+    ]
+    assert [call.args[0] for call in route.call_args_list] == [
+        AdmCidEvent("AAAAAA", "0001", "R1", "L0", "1", "760", "01", "002"),
+        AdmCidEvent("AAAAAA", "0002", "R1", "L0", None, None, None, None),
+    ]
+    assert server.stats.as_dict() == {
+        "connections_accepted": 1,
+        "connections_dropped": 0,
+        "connections_refused": 0,
+        "frames_duplicate": 0,
+        "frames_rate_limited": 0,
+        "frames_received": 2,
+        "frames_refused": 0,
+        "frames_unrouted": 0,
+    }
+
+
+async def test_fallback(hass: HomeAssistant) -> None:  # noqa: ARG001
+    """Test other frames are parsed by pysiaalarm and routed before the ACK."""
+    route = MagicMock(side_effect=[False, True])
+    server = PimaForceSIAServer(DEFAULT_LISTENING_PORT, route)
+    event_frame = sia_frame('"ADM-CID"0003R1L0#AAAAAA[#AAAAAA|1401 01 001]')
+
+    writer = await _handle(server, event_frame + event_frame + b"\n\r")  # blank
+
+    writer.write.assert_called_once_with(sia_frame('"ACK"0003R1L0#AAAAAA[KC]'))
+    assert route.call_count == 2
+    event = route.call_args.args[0]
+    assert isinstance(event, SIAEvent)
+    assert (event.event_type, event.event_qualifier, event.ri) == ("401", "1", "001")
+    assert server.stats.frames_refused == 1
+    assert list(server.ack_latency) == ["AAAAAA"]
+
+
+async def test_ack_latency(hass: HomeAssistant) -> None:  # noqa: ARG001
+    """Test the ACK latency of the last event frame of every account is kept."""
+    server = PimaForceSIAServer(DEFAULT_LISTENING_PORT, MagicMock())
+    with (
+        patch.object(server_module, "ACK_LATENCY_ACCOUNTS", 2),
+        patch.object(server_module, "time") as mock_time,
+    ):
+        mock_time.monotonic.return_value = 0
+        mock_time.perf_counter.side_effect = [10, 10.002, 11, 11.5, 12, 12.25, 13, 14]
+        await _handle(
+            server,
+            sia_frame('"NULL"0001R1L0#AAAAAA[]')
+            + sia_frame('"NULL"0001R1L0#BBBBBB[]')
+            + sia_frame('"NULL"0002R1L0#AAAAAA[]')
+            + sia_frame('"NULL"0001R1L0#CCCCCC[]'),
+        )
+
+    assert server.ack_latency == {"AAAAAA": 0.25, "CCCCCC": 1}
+
+
+@pytest.mark.allowed_logs(["Dropping unterminated data"])
+async def test_frames_spanning_reads(
+    hass: HomeAssistant,  # noqa: ARG001
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test frames are reassembled across reads and unterminated data is dropped."""
+    monkeypatch.setattr(server_module, "READ_SIZE", 10)
+    monkeypatch.setattr(server_module, "MAX_FRAME_SIZE", 100)
+    route = MagicMock()
+    server = PimaForceSIAServer(DEFAULT_LISTENING_PORT, route)
+
+    writer = await _handle(
+        server,
+        sia_frame('"ADM-CID"0001R1L0#AAAAAA[#AAAAAA|1760 01 002]')
+        + b"\r"  # empty frames are ignored
+        + sia_frame('"ADM-CID"0002R1L0#AAAAAA[#AAAAAA|3760 01 002]')
+        + b"x" * 101,
+    )
+
+    assert [call.args[0] for call in writer.write.call_args_list] == [
+        sia_frame('"ACK"0001R1L0#AAAAAA[KC]'),
+        sia_frame('"ACK"0002R1L0#AAAAAA[KC]'),
+    ]
+    assert route.call_count == 2
+
+
+async def test_duplicates(
+    hass: HomeAssistant,  # noqa: ARG001
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test retransmitted event frames are acknowledged but not passed on."""
+    monkeypatch.setattr(server_module, "DEDUP_CACHE_SIZE", 2)
+    route = MagicMock()
+    server = PimaForceSIAServer(DEFAULT_LISTENING_PORT, route)
+    first = sia_frame('"ADM-CID"0001R1L0#AAAAAA[#AAAAAA|1760 01 002]')
+    second = sia_frame('"ADM-CID"0002R1L0#AAAAAA[#AAAAAA|3760 01 002]')
+    fallback = sia_frame('"ADM-CID"0003R1L0#AAAAAA[#AAAAAA|1401 01 001]')
+    keep_alive = sia_frame('"NULL"0004R1L0#AAAAAA[]')
+
+    writer = await _handle(
+        server,
+        first + first + keep_alive + keep_alive + fallback + fallback + first,
+    )
+    # Over a new connection, the least recently seen frames are evicted.
+    writer = await _handle(server, second + second + fallback + first)
+
+    assert [call.args[0] for call in writer.write.call_args_list] == [
+        sia_frame('"ACK"0002R1L0#AAAAAA[KC]'),
+        sia_frame('"ACK"0002R1L0#AAAAAA[KC]'),
+        sia_frame('"ACK"0003R1L0#AAAAAA[KC]'),
+        sia_frame('"ACK"0001R1L0#AAAAAA[KC]'),
+    ]
+    assert [call.args[0].sequence for call in route.call_args_list] == [
+        "0001",
+        "0004",
+        "0004",
+        "0003",
+        "0002",
+        "0003",
+        "0001",
+    ]
+    assert server.stats.frames_duplicate == 4
+
+
+async def test_refused(hass: HomeAssistant) -> None:  # noqa: ARG001
+    """Test refused fast path frames aren't acknowledged."""
+    route = MagicMock(side_effect=[False, True])
+    server = PimaForceSIAServer(DEFAULT_LISTENING_PORT, route)
+    event_frame = sia_frame('"ADM-CID"0001R1L0#AAAAAA[#AAAAAA|1760 01 002]')
+
+    writer = await _handle(server, event_frame + event_frame)
+
+    # The retransmission isn't a duplicate since the frame wasn't acknowledged.
+    writer.write.assert_called_once_with(sia_frame('"ACK"0001R1L0#AAAAAA[KC]'))
+    assert route.call_count == 2
+    assert server.stats.frames_refused == 1
+    assert server.stats.frames_duplicate == 0
+
+
+async def test_connection_reset(hass: HomeAssistant) -> None:  # noqa: ARG001
+    """Test a reset connection is closed."""
+    server = PimaForceSIAServer(DEFAULT_LISTENING_PORT, MagicMock())
+    reader = MagicMock()
+    reader.read = AsyncMock(side_effect=ConnectionResetError)
+    writer = _writer()
+
+    await server.handle_line(reader, writer)
+
+    writer.close.assert_called_once()
+    assert server.stats.connections_dropped == 1
+
+
+@pytest.mark.parametrize("dualstack", [True, False])
+def test_udp_bind(
+    socket_enabled: None,  # noqa: ARG001
+    monkeypatch: pytest.MonkeyPatch,
+    dualstack: bool,  # noqa: FBT001
+) -> None:
+    """Test the UDP socket is bound to all the interfaces, like the TCP server."""
+    monkeypatch.setattr(socket, "has_dualstack_ipv6", lambda: dualstack)
+    with server_module._bind_udp(0) as sock:  # noqa: SLF001
+        assert sock.type == socket.SOCK_DGRAM
+        if dualstack:
+            assert sock.getsockname()[0] == "::"
+            assert not sock.getsockopt(socket.IPPROTO_IPV6, socket.IPV6_V6ONLY)
+        else:
+            assert sock.getsockname()[0] == "0.0.0.0"  # noqa: S104
+
+
+def test_udp_bind_failure(
+    socket_enabled: None,  # noqa: ARG001
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the UDP socket is closed when its port can't be bound."""
+    monkeypatch.setattr(socket, "has_dualstack_ipv6", lambda: False)
+    with server_module._bind_udp(0) as taken:  # noqa: SLF001
+        sockets: list[socket.socket] = []
+        socket_class = socket.socket
+
+        def create_socket(*args: Any) -> socket.socket:
+            sockets.append(sock := socket_class(*args))
+            return sock
+
+        monkeypatch.setattr(socket, "socket", create_socket)
+        with pytest.raises(OSError, match="in use"):
+            server_module._bind_udp(taken.getsockname()[1])  # noqa: SLF001
+    assert sockets[0].fileno() == -1
+
+
+async def test_udp(hass: HomeAssistant) -> None:
+    """Test the frames of datagrams are acknowledged back to their source."""
+    route = MagicMock()
+    server = PimaForceSIAServerUDP(DEFAULT_LISTENING_PORT, route)
+    transport = MagicMock()
+    sock = MagicMock()
+    with (
+        patch.object(server_module, "_bind_udp", return_value=sock) as mock_bind,
+        patch.object(
+            hass.loop,
+            "create_datagram_endpoint",
+            AsyncMock(return_value=(transport, server)),
+        ) as mock_create_datagram_endpoint,
+    ):
+        await server.async_start()
+    mock_bind.assert_called_once_with(DEFAULT_LISTENING_PORT)
+    protocol_factory = mock_create_datagram_endpoint.await_args.args[0]
+    assert protocol_factory() is server
+    assert mock_create_datagram_endpoint.await_args.kwargs == {"sock": sock}
+
+    source = ("192.168.1.2", 5000)
+    server.datagram_received(
+        sia_frame('"ADM-CID"0001R1L0#AAAAAA[#AAAAAA|1760 01 002]')
+        + sia_frame('"ADM-CID"0002R1L0#AAAAAA[#AAAAAA|1401 01 001]'),
+        source,
+    )
+    server.datagram_received(
+        sia_frame('"ADM-CID"0001R1L0#AAAAAA[#AAAAAA|1760 01 002]'), source
+    )
+    await asyncio.sleep(0)
+
+    assert [call.args for call in transport.sendto.call_args_list] == [
+        (sia_frame('"ACK"0001R1L0#AAAAAA[KC]'), source),
+        (sia_frame('"ACK"0002R1L0#AAAAAA[KC]'), source),
+        (sia_frame('"ACK"0001R1L0#AAAAAA[KC]'), source),
+    ]
+    assert route.call_count == 2
+    assert server.stats.frames_received == 3
+    assert server.stats.frames_duplicate == 1
+
+    await server.async_stop()
+    transport.close.assert_called_once()
+    server.datagram_received(
+        sia_frame('"ADM-CID"0004R1L0#AAAAAA[#AAAAAA|1760 01 002]'), source
+    )
+    assert route.call_count == 2
+    await server.async_stop()
+
+
+async def test_connections_cap(hass: HomeAssistant) -> None:  # noqa: ARG001
+    """Test connections over the cap are closed right away."""
+    server = PimaForceSIAServer(DEFAULT_LISTENING_PORT, MagicMock(), max_connections=1)
+    reader = asyncio.StreamReader()
+    connection = asyncio.create_task(server.handle_line(reader, _writer()))
+    await asyncio.sleep(0)
+
+    writer = await _handle(server, sia_frame('"ADM-CID"0001R1L0#AAAAAA[]'))
+    writer.write.assert_not_called()
+    assert server.stats.connections_accepted == 1
+    assert server.stats.connections_refused == 1
+
+    reader.feed_eof()
+    await connection
+    await _handle(server, b"")
+    assert server.stats.connections_accepted == 2
+    assert server.stats.connections_refused == 1
+
+
+async def test_shared_port_defaults(hass: HomeAssistant) -> None:  # noqa: ARG001
+    """Test many panels keep their connections open on a port by default."""
+    route = MagicMock()
+    server = PimaForceSIAServer(DEFAULT_LISTENING_PORT, route)
+    readers = []
+    connections = []
+    for panel in range(40):
+        reader = asyncio.StreamReader()
+        # Panels behind one NAT address, each flushing a burst of events.
+        reader.feed_data(
+            b"".join(
+                sia_frame(
+                    f'"ADM-CID"{sequence:04}R1L0#A{panel:05}[#A{panel:05}|1760 01 002]'
+                )
+                for sequence in range(1, 201)
+            )
+        )
+        readers.append(reader)
+        connections.append(asyncio.create_task(server.handle_line(reader, _writer())))
+    await asyncio.sleep(0)
+
+    assert server.stats.connections_accepted == 40
+    assert server.stats.connections_refused == 0
+    assert route.call_count == 40 * 200
+    assert server.stats.frames_rate_limited == 0
+    for reader in readers:
+        reader.feed_eof()
+    await asyncio.gather(*connections)
+
+
+async def test_rate_limit(hass: HomeAssistant) -> None:  # noqa: ARG001
+    """Test the frames of a source over its rate are dropped unparsed."""
+    route = MagicMock()
+    server = PimaForceSIAServer(DEFAULT_LISTENING_PORT, route, rate_limit=1)
+    frames = [
+        sia_frame(f'"ADM-CID"{sequence:04}R1L0#AAAAAA[#AAAAAA|1760 01 002]')
+        for sequence in range(8)
+    ]
+    with (
+        patch.object(server_module, "RATE_LIMIT_SOURCES", 1),
+        patch.object(server_module, "time") as mock_time,
+    ):
+        mock_time.monotonic.return_value = 0
+        writer = await _handle(server, b"".join(frames[:7]))
+        assert writer.write.call_count == server_module.RATE_LIMIT_BURST
+        assert server.stats.frames_rate_limited == 2
+
+        mock_time.monotonic.return_value = 1  # refilled a frame
+        writer = await _handle(server, frames[5] + frames[6])
+        assert writer.write.call_count == 1
+        assert server.stats.frames_rate_limited == 3
+
+        # Other sources have their own bucket, the least recently used are reset.
+        writer = _writer()
+        writer.get_extra_info.return_value = ("192.168.1.3", 5000)
+        reader = asyncio.StreamReader()
+        reader.feed_data(frames[6])
+        reader.feed_eof()
+        await server.handle_line(reader, writer)
+        writer.write.assert_called_once()
+        writer = await _handle(server, frames[6] + frames[7])
+        assert writer.write.call_count == 2
+
+    assert route.call_count == 8
+    assert server.stats.frames_received == 12
+    assert server.stats.frames_rate_limited == 3
+
+    server.rate_limit = 0
+    writer = await _handle(server, b"".join(frames))
+    assert writer.write.call_count == 8
+
+
+async def test_udp_rate_limit(hass: HomeAssistant) -> None:
+    """Test the datagrams of a source over its rate are dropped unparsed."""
+    route = MagicMock()
+    server = PimaForceSIAServerUDP(DEFAULT_LISTENING_PORT, route, rate_limit=0.2)
+    transport = MagicMock()
+    with (
+        patch.object(server_module, "_bind_udp"),
+        patch.object(
+            hass.loop,
+            "create_datagram_endpoint",
+            AsyncMock(return_value=(transport, server)),
+        ),
+    ):
+        await server.async_start()
+
+    with patch.object(server_module, "time") as mock_time:
+        mock_time.monotonic.return_value = 0
+        for sequence in range(2):
+            server.datagram_received(
+                sia_frame(f'"ADM-CID"{sequence:04}R1L0#AAAAAA[#AAAAAA|1760 01 002]'),
+                ("192.168.1.2", 5000),
+            )
+
+    transport.sendto.assert_called_once()
+    route.assert_called_once()
+    assert server.stats.frames_rate_limited == 1
+    await server.async_stop()
@@ -0,0 +1,19 @@
+"""Tests for the performance counters."""
+
+from custom_components.pima_force.stats import Histogram
+
+
+def test_histogram() -> None:
+    """Test latencies are counted in fixed buckets."""
+    histogram = Histogram()
+    histogram.record(0)
+    histogram.record(0.001)
+    histogram.record(0.0011)
+    histogram.record(5)
+
+    counts = histogram.as_dict()
+    assert counts["<=0.1ms"] == 1
+    assert counts["<=1ms"] == 1
+    assert counts["<=2.5ms"] == 1
+    assert counts[">1000ms"] == 1
+    assert sum(counts.values()) == 4
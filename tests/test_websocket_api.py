@@ -0,0 +1,136 @@
+"""Tests for the websocket API."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.exceptions import Unauthorized
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.pima_force.adm_cid import AdmCidEvent
+from custom_components.pima_force.const import DOMAIN
+from custom_components.pima_force.coordinator import DATA_EVENT_SUBSCRIBERS
+from custom_components.pima_force.websocket_api import websocket_subscribe_events
+
+from .helpers import adm_cid_event
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .helpers import SetupEntry
+
+
+def _events(connection: MagicMock) -> list[dict[str, Any]]:
+    events = []
+    for call in connection.send_message.call_args_list:
+        message = call.args[0]
+        assert message["id"] == 1
+        assert message["type"] == "event"
+        events.append(message["event"])
+    return events
+
+
+async def test_subscribe_events(hass: HomeAssistant, setup_entry: SetupEntry) -> None:
+    """Test the zone transitions of an entry are pushed, filtered by zone."""
+    config_entry = await setup_entry()
+    coordinator = config_entry.runtime_data.coordinator
+    connection = MagicMock(subscriptions={})
+
+    websocket_subscribe_events(
+        hass,
+        connection,
+        {"id": 1, "config_entry_id": [config_entry.entry_id, "missing"]},
+    )
+    connection.send_error.assert_called_once_with(
+        1, "not_found", "Config entry missing not found"
+    )
+    assert not connection.subscriptions
+
+    websocket_subscribe_events(
+        hass,
+        connection,
+        {
+            "id": 1,
+            "config_entry_id": [config_entry.entry_id],
+            "zones": [2, 3],
+            "event_types": ["760"],
+        },
+    )
+    connection.send_result.assert_called_once_with(1)
+
+    for event in (
+        adm_cid_event(1, "760", "1", "001"),  # other zone
+        adm_cid_event(2, "130", "1", "002"),  # not a zone transition
+        adm_cid_event(3, "760", "1", "002"),
+        AdmCidEvent("", "0004", "R1", "L0", *[None] * 4),  # keep-alive
+        adm_cid_event(5, "760", "1", "002"),  # unchanged
+        adm_cid_event(6, "760", "3", "002"),
+    ):
+        assert coordinator.async_ingest(event)
+    await hass.async_block_till_done()
+
+    events = _events(connection)
+    assert all(isinstance(event.pop("time"), float) for event in events)
+    assert events == [
+        {
+            "config_entry_id": config_entry.entry_id,
+            "code": "760",
+            "qualifier": qualifier,
+            "partition": 1,
+            "zone": 2,
+            "old_state": old_state,
+            "new_state": new_state,
+        }
+        for qualifier, old_state, new_state in (
+            ("1", None, "on"),
+            ("3", "on", "off"),
+        )
+    ]
+
+    connection.subscriptions.pop(1)()
+    assert DATA_EVENT_SUBSCRIBERS not in hass.data
+
+
+async def test_subscribe_all_entries(
+    hass: HomeAssistant, setup_entry: SetupEntry
+) -> None:
+    """Test the zone transitions of all the entries are pushed."""
+    config_entry = await setup_entry()
+    connection = MagicMock(subscriptions={})
+    websocket_subscribe_events(hass, connection, {"id": 1})
+    other_entry = MockConfigEntry(domain=DOMAIN)
+    other_entry.add_to_hass(hass)
+    other = MagicMock(subscriptions={})
+    websocket_subscribe_events(
+        hass, other, {"id": 1, "config_entry_id": [other_entry.entry_id]}
+    )
+    other.send_result.assert_called_once_with(1)
+    # Subscriptions are kept by entry, so they outlive reloads.
+    assert await hass.config_entries.async_reload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert config_entry.runtime_data.coordinator.async_ingest(
+        adm_cid_event(1, "760", "1", "003")
+    )
+    await hass.async_block_till_done()
+    [event] = _events(connection)
+    assert (event["zone"], event["new_state"]) == (3, "on")
+    connection.subscriptions.pop(1)()
+
+    # Entries without subscribers aren't published.
+    assert config_entry.runtime_data.coordinator.async_ingest(
+        adm_cid_event(2, "760", "3", "003")
+    )
+    await hass.async_block_till_done()
+    assert len(_events(connection)) == 1
+    other.send_message.assert_not_called()
+
+
+async def test_subscribe_requires_admin(hass: HomeAssistant) -> None:
+    """Test only an administrator can subscribe."""
+    connection = MagicMock(subscriptions={}, user=MagicMock(is_admin=False))
+    with pytest.raises(Unauthorized):
+        websocket_subscribe_events(hass, connection, {"id": 1})
+    assert not connection.subscriptions
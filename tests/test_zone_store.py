@@ -0,0 +1,128 @@
+"""Tests for the zone store."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from custom_components.pima_force.const import (
+    ATTR_LAST_CLOSE,
+    ATTR_LAST_OPEN,
+    ATTR_LAST_SET,
+)
+from custom_components.pima_force.zone_store import ZoneStore
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+
+def test_zone_states() -> None:
+    """Test the store behaves as a mapping of zone numbers to open states."""
+    zones = ZoneStore()
+    zones[3] = True
+    zones[96] = False
+    zones[1] = True
+
+    assert list(zones) == [1, 3, 96]
+    assert len(zones) == 3
+    assert zones.open_count() == 2
+    assert zones == {1: True, 3: True, 96: False}
+    assert zones.get(2) is None
+    with pytest.raises(KeyError):
+        zones[2]
+
+    zones[3] = False
+    del zones[1]
+    assert zones == {3: False, 96: False}
+    assert zones.open_count() == 0
+    with pytest.raises(KeyError):
+        del zones[1]
+
+
+async def test_zone_timestamps(hass: HomeAssistant) -> None:  # noqa: ARG001
+    """Test the timestamps are kept as epochs and rendered in local time."""
+    zones = ZoneStore()
+    assert zones.timestamp(ATTR_LAST_SET, 5) is None
+
+    zones.set_timestamp(ATTR_LAST_SET, 5, 0)
+    assert zones.timestamp(ATTR_LAST_SET, 5) == 0
+    assert zones.timestamp(ATTR_LAST_SET, 4) is None
+    assert zones.timestamp(ATTR_LAST_OPEN, 5) is None
+    assert zones.isoformat(ATTR_LAST_SET, 5) == "1969-12-31T16:00:00-08:00"
+    assert zones.isoformat(ATTR_LAST_OPEN, 5) is None
+    zones.set_timestamp(ATTR_LAST_OPEN, 5, 1719792000.25)  # daylight saving time
+    assert zones.isoformat(ATTR_LAST_OPEN, 5) == "2024-06-30T17:00:00.250000-07:00"
+
+    zones.set_timestamp(ATTR_LAST_SET, 5, None)
+    assert zones.timestamp(ATTR_LAST_SET, 5) is None
+
+
+def test_zone_store_as_dict() -> None:
+    """Test the store round-trips through its compact form."""
+    zones = ZoneStore()
+    zones[1] = True
+    zones[70] = False
+    zones.set_timestamp(ATTR_LAST_SET, 2, 100.5)
+    zones.set_partition(1, 2)
+    zones.set_partition(70, 2)
+
+    data = zones.as_dict()
+    assert data == {
+        "known": f"{1 << 70 | 1 << 1:x}",
+        "open": "2",
+        "partitions": {"2": f"{1 << 70 | 1 << 1:x}"},
+        ATTR_LAST_OPEN: [],
+        ATTR_LAST_CLOSE: [],
+        ATTR_LAST_SET: [None, None, 100.5],
+    }
+
+    restored = ZoneStore()
+    restored[3] = True
+    restored.set_timestamp(ATTR_LAST_OPEN, 3, 1)
+    restored.restore(data)
+    assert restored == {1: True, 70: False}
+    assert restored.timestamp(ATTR_LAST_SET, 2) == 100.5
+    assert restored.timestamp(ATTR_LAST_OPEN, 3) is None
+    assert restored.partition(70) == 2
+    assert restored.partition_open_count(2) == 1
+    assert restored.as_dict() == data
+
+    # Stores saved before partitions were tracked.
+    del data["partitions"]
+    restored.restore(data)
+    assert restored.partitions() == []
+    assert restored.partition(1) is None
+
+
+def test_zone_store_partitions() -> None:
+    """Test the open zones of the partitions are counted."""
+    zones = ZoneStore()
+    zones[1] = True
+    zones[2] = True
+    assert zones.partitions() == []
+    assert zones.partition_open_count(1) == 0
+
+    assert zones.set_partition(1, 1)
+    assert zones.set_partition(2, 1)
+    assert zones.set_partition(3, 2)
+    assert not zones.set_partition(3, 2)
+    assert zones.partitions() == [1, 2]
+    assert (zones.partition_open_count(1), zones.partition_open_count(2)) == (2, 0)
+
+    zones[3] = True
+    zones[3] = True
+    zones[1] = False
+    assert (zones.partition_open_count(1), zones.partition_open_count(2)) == (1, 1)
+
+    assert zones.set_partition(2, 2)
+    assert zones.partition(2) == 2
+    assert (zones.partition_open_count(1), zones.partition_open_count(2)) == (0, 2)
+    assert zones.partition_open_count(2, mask=1 << 3) == 1
+
+    del zones[3]
+    del zones[1]
+    assert (zones.partition_open_count(1), zones.partition_open_count(2)) == (0, 1)
+    zones[4] = True
+    del zones[4]  # without a partition
+    assert zones.open_count() == 1
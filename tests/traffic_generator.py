@@ -0,0 +1,264 @@
+"""Synthetic SIA DC-09 traffic generator simulating Pima Force panels."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+SHAPES = ("burst", "steady", "flap")
+READ_SIZE = 1000
+_ACK_MATCHER = re.compile(rb'"ACK"(?P<sequence>\d{4})')
+
+
+def crc(data: bytes) -> int:
+    """Calculate the CRC-16/ARC of a SIA message (bitwise, on purpose)."""
+    value = 0
+    for byte in data:
+        value ^= byte
+        for _ in range(8):
+            value = (value >> 1) ^ 0xA001 if value & 1 else value >> 1
+    return value
+
+
+def account_id(panel: int) -> str:
+    """Return the account ID of a simulated panel."""
+    return f"{0xA00000 + panel:06X}"
+
+
+def build_frame(account: str, sequence: int, zone: int, *, is_open: bool) -> bytes:
+    """Build a zone status frame, as sent by a Pima Force panel."""
+    timestamp = datetime.now(UTC).strftime("%H:%M:%S,%m-%d-%Y")
+    message = (
+        f'"ADM-CID"{sequence:04d}L0#{account}'
+        f"[#{account}|{1 if is_open else 3}760 01 {zone:03d}]_{timestamp}"
+    ).encode()
+    return b"\n%04X%04X%s\r" % (crc(message), len(message), message)
+
+
+def zone_events(shape: str, zones: int, rounds: int) -> list[tuple[int, bool]]:
+    """Return the (zone, is_open) events of a panel for a burst shape."""
+    if shape == "flap":  # a single faulty contact
+        return [(1, index % 2 == 0) for index in range(zones * rounds)]
+    return [
+        (zone, round_ % 2 == 0)
+        for round_ in range(rounds)
+        for zone in range(1, zones + 1)
+    ]
+
+
+def percentile(values: Sequence[float], percent: float) -> float:
+    """Return the nearest-rank percentile of the values."""
+    if not values:
+        return float("nan")
+    ordered = sorted(values)
+    return ordered[
+        max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered)) - 1))
+    ]
+
+
+@dataclass
+class Report:
+    """Benchmark results."""
+
+    events: int = 0
+    duration: float = 0
+    ack_latencies: list[float] = field(default_factory=list)
+    state_latencies: list[float] = field(default_factory=list)
+
+    @property
+    def throughput(self) -> float:
+        """Return the number of acknowledged events per second."""
+        return self.events / self.duration if self.duration else float("nan")
+
+    def __str__(self) -> str:
+        """Format the report."""
+        lines = [
+            f"events: {self.events}",
+            f"duration: {self.duration:.3f} s",
+            f"throughput: {self.throughput:.0f} events/s",
+        ]
+        for name, latencies in (
+            ("ACK latency", self.ack_latencies),
+            ("state latency", self.state_latencies),
+        ):
+            if latencies:
+                lines.append(
+                    f"{name} (ms): "
+                    + ", ".join(
+                        f"p{percent}={percentile(latencies, percent) * 1000:.2f}"
+                        for percent in (50, 95, 99)
+                    )
+                    + f", max={max(latencies) * 1000:.2f}"
+                )
+        return "\n".join(lines)
+
+
+class _Acks:
+    """Match the ACKs of a panel's frames, which are sent in order."""
+
+    def __init__(self, events: int) -> None:
+        loop = asyncio.get_running_loop()
+        self.acked = [loop.create_future() for _ in range(events)]
+        self.done = loop.create_future()  # all acked, or the ACKs are broken
+        self.count = 0
+        self._buffer = b""
+
+    def fail(self, msg: str) -> None:
+        if not self.done.done():
+            self.done.set_exception(ConnectionError(msg))
+
+    def on_data(self, data: bytes) -> None:
+        *acks, self._buffer = (self._buffer + data).split(b"\r")
+        for ack in acks:
+            if not (match := _ACK_MATCHER.search(ack)):
+                self.fail(f"Unexpected response: {ack!r}")
+                return
+            if int(match["sequence"]) != self.count % 9999 + 1:
+                self.fail(f"Out of order ACK: {ack!r}")
+                return
+            self.acked[self.count].set_result(time.perf_counter())
+            self.count += 1
+        if self.count == len(self.acked) and not self.done.done():
+            self.done.set_result(None)
+
+
+class _DatagramAcks(asyncio.DatagramProtocol):
+    """Pass the received datagrams on."""
+
+    def __init__(self, on_data: Callable[[bytes], None]) -> None:
+        self._on_data = on_data
+
+    def datagram_received(self, data: bytes, _: tuple[str | Any, int]) -> None:
+        self._on_data(data)
+
+
+async def run_panel(  # noqa: PLR0913
+    host: str,
+    port: int,
+    account: str,
+    events: Sequence[tuple[int, bool]],
+    *,
+    burst: bool,
+    udp: bool = False,
+    on_sent: Callable[[str, int, bool, float], None] | None = None,
+) -> list[float]:
+    """
+    Send the events of a panel over a single connection, return the ACK latencies.
+
+    In burst mode all the frames are written at once, like a panel flushing its
+    queue on reconnect. Otherwise a frame is sent once the previous one is acked.
+    Over UDP, every frame is sent in its own datagram.
+    """
+    loop = asyncio.get_running_loop()
+    acks = _Acks(len(events))
+    acked, done, on_data = acks.acked, acks.done, acks.on_data
+    sent_at: list[float] = []
+
+    if udp:
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: _DatagramAcks(on_data), remote_addr=(host, port)
+        )
+        send: Callable[[bytes], None] = transport.sendto
+        close = transport.close
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+        send, close = writer.write, writer.close
+
+        async def read_acks() -> None:
+            while not done.done():
+                if not (data := await reader.read(READ_SIZE)):
+                    acks.fail(f"Connection closed after {acks.count} ACKs")
+                    return
+                on_data(data)
+
+        reader_task = asyncio.create_task(read_acks())
+    try:
+        for index, (zone, is_open) in enumerate(events):
+            send(build_frame(account, index % 9999 + 1, zone, is_open=is_open))
+            sent_at.append(time.perf_counter())
+            if on_sent:
+                on_sent(account, zone, is_open, sent_at[-1])
+            if not burst:
+                await asyncio.wait({done, acked[index]}, return_when="FIRST_COMPLETED")
+                if done.done():
+                    break
+        if not udp:
+            await writer.drain()
+        await done
+    finally:
+        if not udp:
+            reader_task.cancel()
+        close()
+    return [future.result() - sent for future, sent in zip(acked, sent_at, strict=True)]
+
+
+async def run(  # noqa: PLR0913
+    host: str,
+    port: int,
+    *,
+    panels: int,
+    zones: int,
+    rounds: int,
+    shape: str,
+    udp: bool = False,
+    on_sent: Callable[[str, int, bool, float], None] | None = None,
+) -> Report:
+    """Run the panels concurrently and report the results."""
+    events = zone_events(shape, zones, rounds)
+    start = time.perf_counter()
+    latencies = await asyncio.gather(
+        *(
+            run_panel(
+                host,
+                port,
+                account_id(panel),
+                events,
+                burst=shape != "steady",
+                udp=udp,
+                on_sent=on_sent,
+            )
+            for panel in range(panels)
+        )
+    )
+    report = Report(events=len(events) * panels, duration=time.perf_counter() - start)
+    for panel_latencies in latencies:
+        report.ack_latencies.extend(panel_latencies)
+    return report
+
+
+def main() -> None:
+    """Run the traffic generator against a running Home Assistant instance."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=10001)
+    parser.add_argument("--panels", type=int, default=1)
+    parser.add_argument("--zones", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--shape", choices=SHAPES, default="burst")
+    parser.add_argument("--udp", action="store_true")
+    args = parser.parse_args()
+    print(  # noqa: T201
+        asyncio.run(
+            run(
+                args.host,
+                args.port,
+                panels=args.panels,
+                zones=args.zones,
+                rounds=args.rounds,
+                shape=args.shape,
+                udp=args.udp,
+            )
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()